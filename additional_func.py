@@ -9,6 +9,9 @@ Task Description: Design a school-appropriate game allowing for user interaction
 
 # imports
 import pygame
+import weakref
+from startup_profile import startup_profile, sprite_name
+from frame_stats import frame_stats
 
 # dictionary of pressed keys
 keydict = {"space": pygame.K_SPACE, "esc": pygame.K_ESCAPE, "up": pygame.K_UP, "down": pygame.K_DOWN,
@@ -50,22 +53,72 @@ keydict = {"space": pygame.K_SPACE, "esc": pygame.K_ESCAPE, "up": pygame.K_UP, "
            "9": pygame.K_9,
            "0": pygame.K_0}
 
+# images that have been loaded to be shared, keyed by filename
+shared_images = {}
+
+# pixel masks of sprite images, kept with (and forgotten along with) the images they were made from
+sprite_masks = weakref.WeakKeyDictionary()
+
 # loads image file based on filename
-def loadImage(filename):
+def loadImage(filename, shared=False, mask=False):
     '''
     loadImage() loads a png as a pygame image
     
     Parameter (required):
         filename - filename of image
+    
+    Parameters (optional):
+        shared - Boolean representing whether the image can be shared with everything else that loads the same file (i.e., it is never drawn on); shared images are only loaded once; set to False by default
+        mask - Boolean representing whether to also make the image's pixel mask for exact collisions (see spritesTouching()); set to False by default
         
     Returns:
         image - loaded pygame image
     '''
     
-    image = pygame.image.load(filename)  # gets image
-    image = image.convert_alpha()  # allows for transparency
+    # uses the already loaded image if it can be shared
+    if shared and filename in shared_images:
+        return shared_images[filename]
+    
+    # image loads are timed in startup profiling mode, with back-to-back loads for the same object combined
+    with startup_profile.step('loadImage ' + sprite_name(filename), merge=True):
+        image = pygame.image.load(filename)  # gets image
+        image = image.convert_alpha()  # allows for transparency
+        frame_stats.count_surface()  # counts the converted image as a new surface
+        
+        # makes the pixel mask of the image's non-transparent pixels
+        if mask:
+            sprite_masks[image] = pygame.mask.from_surface(image)
+    
+    # saves the image to be shared
+    if shared:
+        shared_images[filename] = image
+    
     return image  # returns image
 
+# checks if two sprites' pixels overlap
+def spritesTouching(image1, x1, y1, image2, x2, y2):
+    '''
+    spritesTouching() checks whether the non-transparent pixels of two images overlap; it is the second, exact step of a touching() check after the boxes overlap
+    Images loaded without a mask (e.g., doors) count as solid boxes
+    
+    Parameters (required):
+        image1 - image of the first object
+        x1 - x position of the first image
+        y1 - y position of the first image
+        image2 - image of the second object
+        x2 - x position of the second image (in the same coordinates as the first)
+        y2 - y position of the second image
+    
+    Returns:
+        Boolean - True if the images' pixels overlap (or either image has no mask); False if not
+    '''
+    
+    mask1 = sprite_masks.get(image1)
+    mask2 = sprite_masks.get(image2)
+    if mask1 == None or mask2 == None:
+        return True
+    return mask1.overlap(mask2, (int(x2 - x1), int(y2 - y1))) != None
+
 # checks key press
 def keyPressed(key=""):
     '''
@@ -0,0 +1,70 @@
+'''
+Names: Spencer Lyudovyk, Amanda Lin, Jue Gong
+Date: 05/09/22
+Project: Labors of Hercules (Choose Your Own Adventure Game)
+File: ai_scheduler.py
+Purpose: This file contains the AIScheduler class that decides how often each monster's AI runs based on how far the monster is from the player.
+Task Description: Design a school-appropriate game allowing for user interaction/input.
+'''
+
+class AIScheduler:
+    '''
+    The AIScheduler() class runs monster AI at a level of detail based on distance from the player.
+    Monsters on screen run their AI every frame. Farther monsters only run it every few frames and take that many steps at once when they do.
+    Each monster gets its own slot, so the monsters in a ring run on different frames and the AI work is spread evenly over the frames.
+    A monster's ai_tick_rate (from its profile in stats/monsters.csv) caps the number of frames between its AI ticks.
+    '''
+
+    def __init__(self, rates=((650, 550, 1), (1650, 1350, 4), (None, None, 8))):
+        '''
+        __init__() initializes the AIScheduler
+
+        Parameter (optional):
+            rates - list of (largest x distance, largest y distance, frames between AI ticks) for each ring around the player, from nearest to farthest;
+                    the last ring has None distances and covers everything else; by default, monsters on screen tick every frame,
+                    monsters within about one more screen tick every 4 frames, and all others tick every 8 frames
+        '''
+
+        self.rates = rates
+        self.frame = 0  # number of finished frames
+        self.next_slot = 0  # slot given to the next monster the scheduler sees
+        self.ticks = 0  # number of AI ticks run this frame
+        self.last_ticks = 0  # number of AI ticks run in the last finished frame
+
+    def steps(self, monster, vector):
+        '''
+        steps() decides whether a monster's AI runs this frame
+
+        Parameters (required):
+            monster - monster object
+            vector - list of x and y distances from the monster to the player (the vector computed in Monster.track_player())
+
+        Returns:
+            int - number of frames of movement the monster should make this frame; 0 if its AI doesn't run this frame
+        '''
+
+        # gives the monster its slot the first time it is seen
+        if monster.ai_slot == None:
+            monster.ai_slot = self.next_slot
+            self.next_slot += 1
+
+        # finds the ring the monster is in
+        for (x_distance, y_distance, period) in self.rates:
+            if x_distance == None or (abs(vector[0]) <= x_distance and abs(vector[1]) <= y_distance):
+                break
+
+        # runs the monster's AI on its slot's frames only
+        period = min(period, monster.ai_tick_rate)
+        if (self.frame + monster.ai_slot)%period != 0:
+            return 0
+        self.ticks += 1
+        return period
+
+    def end_frame(self):
+        '''
+        end_frame() moves on to the next frame
+        '''
+
+        self.last_ticks = self.ticks
+        self.ticks = 0
+        self.frame += 1
@@ -13,6 +13,8 @@ from additional_func import *
 from monster import Monster
 from button import *
 from weapons import *
+from labyrinth import Labyrinth, NORTH, EAST, SOUTH, WEST
+from collision import BoxTable, boxes_touching, entity_box, entities_touching
 
 class Background():
     '''
@@ -20,6 +22,9 @@ class Background():
     It also contains all the wall collision points to prevent characters from moving through walls.
     '''
     
+    # bit of each monster move in the free move masks
+    move_bits = {"left": 1, "right": 2, "up": 4, "down": 8}
+    
     def __init__(self, sizex, sizey, bg_img, stagePos, offset=(505, 390), light_switch=(0,0)):
         '''
         __init__() initializes a Background() object
@@ -38,21 +43,33 @@ class Background():
         # size of screen
         self.sizex = sizex
         self.sizey = sizey
-        self.screen = pygame.display.set_mode([self.sizex, self.sizey])
+        with startup_profile.step('pygame.display.set_mode'):
+            self.screen = pygame.display.set_mode([self.sizex, self.sizey])
         
         # walls and doors
         self.wall_list = set()  # set of wall points
         self.wall_cells = {}  # dictionary of which cells have which walls (north, east, south, and/or west) in the labyrinth grid
         self.door_list = []  # list of all door objects in the background
+        self.door_ids = set()  # identities (id()) of the doors, so checking if an object is a door doesn't search door_list
+        self.labyrinth = Labyrinth(offset)  # graph of the labyrinth's cells, rooms, and doors used to find routes through the labyrinth
+        self.free_moves = {}  # masks of the moves monsters can make without hitting a wall, keyed by (x, y, width, height, distance); forgotten when a door opens or closes
+        self.wall_changes = 0  # number of times a door has opened or closed, so copies of the walls (e.g., monster_table.py's grid) know when to update
+        self.blockers = {}  # regions of wall points that can be switched on and off (the doors), by name: [points added when blocking, points removed when not blocking, whether blocking]
         
-        # list of all objects in the background
+        # list of all objects in the background; objects are added and removed with add_object() and remove_object()
         self.background_obj = []
+        self.background_ids = set()  # identities (id()) of the objects in background_obj, kept in sync with it so in_background() doesn't search the list
+        self.object_table = None  # box table of the objects in background_obj (see collision.py); built when first needed and forgotten when the objects change
         
         # starting center point position
         # this will be the player's position at the beginning of the game
         self.stagePosX = stagePos[0]
         self.stagePosY = stagePos[1]
         
+        # fractions of a pixel the player has moved in the x and y directions that haven't moved the stage yet (see scroll())
+        self.sub_x = 0.0
+        self.sub_y = 0.0
+        
         # offsets for background object placement
         self.offset_x = offset[0]
         self.offset_y = offset[1]
@@ -65,15 +82,86 @@ class Background():
         self.width = self.image.get_width()
         self.height = self.image.get_height()
         
+        # the map is drawn onto a black surface once and kept instead of the loaded image, so the map has no transparent parts
+        # redrawing the map (or part of it; see redraw_area()) then always covers whatever was drawn there before
+        flat = frame_stats.surface([self.width,self.height])
+        frame_stats.blit(flat, self.image, [0,0])
+        self.image = flat
+
         # surface to draw on, same size as image
-        self.surface = pygame.surface.Surface([self.width,self.height])
-        
+        self.surface = frame_stats.surface([self.width,self.height])
+
         # image for the dark sections of the labyrinth
         self.dark = loadImage('images/dark.png')
         
         # light switch button that can be clicked on to turn on all lights in the labyrinth
         self.light_switch = BackgroundButton(light_switch[0], light_switch[1], self.surface, 'switch')
-        self.background_obj.append(self.light_switch)  # light switch starts as a background object
+        self.add_object(self.light_switch)  # light switch starts as a background object
+
+    def add_object(self, object):
+        '''
+        add_object() adds an object to the background
+        
+        Parameter (required):
+            object - object to be drawn in the background
+        '''
+        
+        self.background_obj.append(object)
+        self.background_ids.add(id(object))
+        self.object_table = None
+    
+    def remove_object(self, object):
+        '''
+        remove_object() removes an object from the background
+        
+        Parameter (required):
+            object - object in the background
+        '''
+        
+        self.background_obj.remove(object)
+        self.object_table = None
+        
+        # the same object can be in the list more than once (e.g., an item dropped where it already was)
+        if not any(other is object for other in self.background_obj):
+            self.background_ids.discard(id(object))
+    
+    def set_objects(self, objects):
+        '''
+        set_objects() replaces all objects in the background
+        
+        Parameter (required):
+            objects - list of objects to be drawn in the background
+        '''
+        
+        self.background_obj = objects
+        self.background_ids = {id(object) for object in objects}
+        self.object_table = None
+    
+    def in_background(self, object):
+        '''
+        in_background() checks whether an object is in the background, without searching the list of background objects
+        
+        Parameter (required):
+            object - object to be checked
+        
+        Returns:
+            Boolean - True if the object is in background_obj; False if not
+        '''
+        
+        return id(object) in self.background_ids
+    
+    def is_door(self, object):
+        '''
+        is_door() checks whether an object is one of the background's doors, without searching the list of doors
+        
+        Parameter (required):
+            object - object to be checked
+        
+        Returns:
+            Boolean - True if the object is in door_list; False if not
+        '''
+        
+        return id(object) in self.door_ids
 
     def one_wall(self, x_left, y_top, x_right, y_bottom):
         '''
@@ -92,6 +180,71 @@ class Background():
             for y in range(y_top - self.offset_y, y_bottom - self.offset_y + 1, 5):
                 self.wall_list.add((x,y))
     
+    def add_blocker(self, name, closed_points, open_points, blocking=True):
+        '''
+        add_blocker() registers a region of wall points that can be switched on and off later with set_blocker() (e.g., a door)
+        
+        Parameters (required):
+            name - name of the blocker
+            closed_points - set of points added to the wall_list while the blocker is blocking
+            open_points - set of points removed from the wall_list while the blocker isn't blocking
+        
+        Parameter (optional):
+            blocking - whether the blocker starts off blocking; set to True by default; the walls are left as they are until the blocker is first switched
+        '''
+        
+        self.blockers[name] = [frozenset(closed_points), frozenset(open_points), blocking]
+    
+    def set_blocker(self, name, blocking):
+        '''
+        set_blocker() switches a blocker on or off; nothing is done if it is already in that state
+        
+        Parameters (required):
+            name - name of the blocker
+            blocking - whether the blocker should block
+        
+        Returns:
+            Boolean - True if the blocker was switched; False if it was already in that state
+        '''
+        
+        blocker = self.blockers[name]
+        if blocker[2] == blocking:
+            return False
+        blocker[2] = blocking
+        
+        # adds or removes all of the blocker's points at once
+        if blocking:
+            self.wall_list |= blocker[0]
+        else:
+            self.wall_list -= blocker[1]
+        
+        # forgets what was worked out from the old walls
+        self.free_moves = {}
+        self.wall_changes += 1
+        return True
+    
+    def restore_blocker(self, name, blocking):
+        '''
+        restore_blocker() puts a blocker's wall points in the state they are in after it was last switched to blocking or not blocking, whatever state they are in now
+        Unlike set_blocker(), this is done even if the blocker is already in that state (e.g., when loading a saved game, since the walls of a door that was never switched are different)
+        
+        Parameters (required):
+            name - name of the blocker
+            blocking - whether the blocker should block
+        '''
+        
+        blocker = self.blockers[name]
+        blocker[2] = blocking
+        
+        # removes all of the blocker's points, and adds back the points that block
+        self.wall_list -= blocker[1]
+        if blocking:
+            self.wall_list |= blocker[0]
+        
+        # forgets what was worked out from the old walls
+        self.free_moves = {}
+        self.wall_changes += 1
+    
     def place_walls(self, h=405, w=630, hor_rooms=None, vert_rooms=None, corridor_room=None, corridor_length=265):
         '''
         place_walls() creates the walls in the background and adds them to the wall_list to ensure the players/characters do not move through them
@@ -117,17 +270,20 @@ class Background():
                       8: {1:('W', 'E'), 2:('W', 'S'), 3:('N', 'S'), 4:('N', 'S'), 5:('N', 'E'), 6:('W', 'S'), 7:('N', 'S'), 8:('S', 'E'), 9:('W', 'E')},
                       9: {1:('W', 'S'), 2:('N', 'S'), 3:('N', 'S'), 4:('N', 'S'), 5:('S'), 6:('N', 'S'), 7:('N', 'S'), 8:('N', 'S'), 9:('S', 'E')}}
         
+        # compiles the cells into wall masks and adds them and the openings between them to the labyrinth graph
+        self.labyrinth.add_cells(self.wall_cells)
+        
         # loops through each cell in the 9x9 grid of the labyrinth
-        # checks which kind of wall each of the cells wants (based on dictionary) and creates it
+        # checks which kind of wall each of the cells wants (based on its wall mask) and creates it
         for col in range(0,9):  # 9 columns
             for row in range(0,9):  # 9 rows
-                if 'N' in self.wall_cells[row+1][col+1]:
+                if self.labyrinth.has_wall(row+1, col+1, NORTH):
                     self.one_wall(1245+540*col+60*col-60, (1050+540*row+60*row)-60, 1245+540*(col+1)+60*(col+1), 1050+540*row+60*row)
-                if 'S' in self.wall_cells[row+1][col+1]:
+                if self.labyrinth.has_wall(row+1, col+1, SOUTH):
                     self.one_wall(1245+540*col+60*col-60, (1050+540*(row+1)+60*(row+1))-60, 1245+540*(col+1)+60*(col+1), 1050+540*(row+1)+60*(row+1))
-                if 'W' in self.wall_cells[row+1][col+1]:
+                if self.labyrinth.has_wall(row+1, col+1, WEST):
                     self.one_wall((1245+540*col+60*col)-60, 1050+540*row+60*row-60, 1245+540*col+60*col, 1050+540*(row+1)+60*(row+1))                
-                if 'E' in self.wall_cells[row+1][col+1]:
+                if self.labyrinth.has_wall(row+1, col+1, EAST):
                     self.one_wall((1245+540*(col+1)+60*(col+1))-60, 1050+540*row+60*row-60, 1245+540*(col+1)+60*(col+1), 1050+540*(row+1)+60*(row+1))
         
         # creates the walls of the 6 cells on the left and right sides of the labyrinth
@@ -137,6 +293,7 @@ class Background():
                 self.one_wall(start_x,start_y,start_x+60,start_y+h+60)  # left wall
                 self.one_wall(start_x,start_y+h,start_x+w+60,start_y+h+60)  # bottom wall
                 self.one_wall(start_x+w,start_y,start_x+w+60,start_y+h+60)  # right wall
+                self.labyrinth.add_room(start_x,start_y,start_x+w+60,start_y+h+60)  # adds room to labyrinth graph
          
         # creates the vertical rooms using the same mathematical inputs as the previous rooms
         # height and width are flipped for vertical rooms
@@ -146,6 +303,7 @@ class Background():
                 self.one_wall(start_x,start_y,start_x+60,start_y+w+60)  # left wall
                 self.one_wall(start_x,start_y+w,start_x+h+60,start_y+w+60)  # bottom wall
                 self.one_wall(start_x+h,start_y,start_x+h+60,start_y+w+60)  # right wall
+                self.labyrinth.add_room(start_x,start_y,start_x+h+60,start_y+w+60)  # adds room to labyrinth graph
         
         # corridor walls for the final room
         if corridor_room:
@@ -153,6 +311,9 @@ class Background():
             start_y = corridor_room[1]
             self.one_wall(start_x, start_y-corridor_length, start_x+60, start_y+w+60)
             self.one_wall(start_x+h, start_y-corridor_length, start_x+h+60, start_y+w+60)
+            
+            # adds the corridor between the grid and the room to the labyrinth graph
+            self.labyrinth.add_room(start_x, start_y-corridor_length-60, start_x+h+60, start_y)
 
     def set_background_image(self):        
         '''
@@ -160,24 +321,98 @@ class Background():
         '''
         
         # pastes background image to screen
-        self.surface.blit(self.image, [0,0])
+        frame_stats.blit(self.surface, self.image, [0,0])
         
         # draws all doors
         self.place_doors()
         
         # draws all objects that are not monsters on the background image
         for object in self.background_obj:
-            if isinstance(object, BackgroundButton):  # places background buttons using their own function
-                object.place()
-            elif not isinstance(object, Monster):  # places all other non-monsters with their specified frame number and background coordinates
-                self.surface.blit(object.images[object.frame], [object.x_bg, object.y_bg])
+            self.draw_object(object)
         
         # draws the background onto the screen at the specified offset based on the player's location
-        self.screen.blit(self.surface, [-self.stagePosX, -self.stagePosY])
+        frame_stats.blit(self.screen, self.surface, [-self.stagePosX, -self.stagePosY])
+    
+    def draw_object(self, object):
+        '''
+        draw_object() draws one background object on the background image; monsters aren't drawn
+        
+        Parameter (required):
+            object - object in the background
+        '''
+        
+        if isinstance(object, BackgroundButton):  # places background buttons using their own function
+            object.place()
+        elif not isinstance(object, Monster):  # places all other non-monsters with their specified frame number and background coordinates
+            frame_stats.blit(self.surface, object.images[object.frame], [object.x_bg, object.y_bg])
+    
+    def drawn_images(self):
+        '''
+        drawn_images() retrieves what is drawn on the background image besides the map: the doors and the objects that aren't monsters
+        Comparing the result from before and after a change (e.g., loading a saved game) gives the areas that have to be redrawn (see redraw_changes())
+        
+        Returns:
+            set - (x, y, width, height, identity (id()) of the image) of each image drawn, in background coordinates
+        '''
+        
+        drawn = set()
+        for door in self.door_list:
+            image = door.images[door.frame]
+            drawn.add((door.x_bg, door.y_bg, image.get_width(), image.get_height(), id(image)))
+        for object in self.background_obj:
+            if not isinstance(object, Monster):
+                image = object.images[object.frame]
+                drawn.add((object.x_bg, object.y_bg, image.get_width(), image.get_height(), id(image)))
+        return drawn
+    
+    def redraw_area(self, box):
+        '''
+        redraw_area() redraws one area of the background image: the map, then the doors and objects that overlap it, in the same order as set_background_image()
+        This is much faster than redrawing the whole background image when only a few objects have changed
+        
+        Parameter (required):
+            box - left x, top y, width, and height of the area in background coordinates
+        '''
+        
+        # only the area is drawn on; anything outside of it is clipped
+        area = pygame.Rect(box).clip(self.surface.get_rect())
+        if area.width == 0 or area.height == 0:
+            return
+        self.surface.set_clip(area)
+        
+        # pastes the part of the map image in the area
+        frame_stats.blit(self.surface, self.image, area.topleft, area)
+        
+        # draws the doors and objects that overlap the area
+        for door in self.door_list:
+            image = door.images[door.frame]
+            if boxes_touching(box, (door.x_bg, door.y_bg, image.get_width(), image.get_height())):
+                door.place()
+        for object in self.background_obj:
+            if isinstance(object, Monster):
+                continue
+            image = object.images[object.frame]
+            if boxes_touching(box, (object.x_bg, object.y_bg, image.get_width(), image.get_height())):
+                self.draw_object(object)
+        
+        self.surface.set_clip(None)
+    
+    def redraw_changes(self, before):
+        '''
+        redraw_changes() redraws the areas of the background image where images were drawn before a change but aren't anymore, or are drawn now but weren't before
+        
+        Parameter (required):
+            before - result of drawn_images() from before the change
+        '''
+        
+        for (x, y, width, height, image) in before ^ self.drawn_images():
+            self.redraw_area((x, y, width, height))
     
     def scroll(self, x, y, player, item=None):
         '''
-        scroll() redraws the background if the player moves on screen
+        scroll() moves the player through the background and redraws it
+        Moves can be any size, including fractions of a pixel and both directions at once; the x move is made first and then the y move,
+        so a player moving diagonally into a wall slides along it
         
         Parameters (required):
             x - pixels moved in the x direction; negative means left; positive means right
@@ -188,51 +423,170 @@ class Background():
             item - the object the player is holding, if any; by default, set to None (i.e., player isn't holding an object)
         '''
         
-        # increment center point position
-        self.stagePosX += x
-        self.stagePosY += y
+        # adds the move to the fractions of a pixel left over from earlier moves; only whole pixels move the stage
+        self.sub_x += x
+        self.sub_y += y
+        dx = int(self.sub_x)
+        dy = int(self.sub_y)
+        self.sub_x -= dx
+        self.sub_y -= dy
+        
+        # moves in the x direction and then the y direction
+        if dx != 0 and not self.move_stage(dx, 0, player, item):
+            self.sub_x = 0.0  # forgets the fraction of a pixel if blocked, so the player doesn't creep into the wall later
+        if dy != 0 and not self.move_stage(0, dy, player, item):
+            self.sub_y = 0.0
+        
+        # redraws the background at the player's position
+        frame_stats.blit(self.screen, self.surface, [-self.stagePosX, -self.stagePosY])
+    
+    def move_stage(self, dx, dy, player, item=None):
+        '''
+        move_stage() moves the player in one direction as far as they can go without hitting a wall, leaving the background, or touching an object they can't walk over
         
-        # calculate new top left corner x position
-        if self.stagePosX > 0 and self.stagePosX < self.width:  # allows the player to move if they are in the the background
-            xOff = (0 - self.stagePosX % self.width)
-        elif self.stagePosX > self.width:  # stops the player from moving if they try to move off the background too far right
-            xOff = (-self.width - self.stagePosX % self.width)
-        else:  # stops the player from moving if they try to move off the background too far left
-            xOff = (0 + abs(self.stagePosX) % self.width)
+        Parameters (required):
+            dx - whole pixels to move in the x direction (0 if moving in the y direction)
+            dy - whole pixels to move in the y direction (0 if moving in the x direction)
+            player - player object
         
-        # calculate new top left corner y position
-        if self.stagePosY > 0 and self.stagePosY < self.height:  # allows the player to move if they are in the the background
-            yOff = (0 - self.stagePosY % self.height)
-        elif self.stagePosY > self.height:  # stops the player from moving if they try to move off the background too far up
-            yOff = (-self.height - self.stagePosY % self.height)
-        else:  # stops the player from moving if they try to move off the background too far down
-            yOff = (0 + abs(self.stagePosY) % self.height)
+        Parameters (optional):
+            item - the object the player is holding, if any; by default, set to None (i.e., player isn't holding an object)
         
-        # by default, the background image itself is not redrawn
-        redraw = False
+        Returns:
+            Boolean - True if the player moved the whole way; False if they were stopped
+        '''
         
-        # esures that the player is in the background and has not collided with any walls; if so, will redraw the background
-        if not self.detect_wall_collision(player) and self.stagePosX > -self.offset_x and self.stagePosY > -self.offset_y and self.stagePosX < (self.width-self.offset_x) and self.stagePosY < (self.height-self.offset_y):
-            redraw = True
+        # stops the player in front of the first wall on their way
+        distance = self.sweep(player, dx, dy)
+        x = self.stagePosX + (distance if dx != 0 else 0)
+        y = self.stagePosY + (distance if dy != 0 else 0)
+        
+        # stops the player if they would leave the background
+        if not (x > -self.offset_x and y > -self.offset_y and x < (self.width-self.offset_x) and y < (self.height-self.offset_y)):
+            return False
+        
+        # moves the player, but moves them back if they are now touching any items they aren't allowed to walk over
+        (start_x, start_y) = (self.stagePosX, self.stagePosY)
+        self.stagePosX = x
+        self.stagePosY = y
+        if self.touching_objects(player, item):
+            self.stagePosX = start_x
+            self.stagePosY = start_y
+            return False
+        
+        return distance == dx + dy
+    
+    def touching_objects(self, player, item=None):
+        '''
+        touching_objects() checks whether the player or the item they are holding is touching any object in the background they can't walk over
         
-        # if any items the player isn't allowed to walk over are being touched, doesn't redraw the background
-        for object in self.background_obj:
-            if item != None and object.walk_over == False and item.touching(object, self):
-                redraw = False
-            elif object.walk_over == False and isinstance(object, Monster) and player.touching(object, self,monster=True): # if object is monster
-                redraw = False
-            elif object.walk_over == False and not isinstance(object, Monster) and player.touching(object, self,monster=False): # if object is not monster
-                redraw = False
-        
-        # redraws the background if specified
-        if redraw == True:
-            self.screen.blit(self.surface, [xOff, yOff])
-        
-        # if redrawing not specified, does not move and resets previous position
-        else:
-            self.stagePosX -= x
-            self.stagePosY -= y
-            self.screen.blit(self.surface, [-self.stagePosX, -self.stagePosY])
+        Parameters (required):
+            player - player object
+        
+        Parameters (optional):
+            item - the object the player is holding, if any; by default, set to None (i.e., player isn't holding an object)
+        
+        Returns:
+            Boolean - True if any such object is being touched; False if not
+        '''
+        
+        # the player's box and the item's box are each checked against all objects' boxes at once, and only the objects they overlap are checked further (see collision.py)
+        table = self.objects_table()
+        player_box = entity_box(player, self)
+        for (object, box) in table.query(player_box):
+            if object.walk_over == False and entities_touching(player, player_box, object, box):
+                return True
+        if item != None:
+            item_box = entity_box(item, self)
+            for (object, box) in table.query(item_box):
+                if object.walk_over == False and entities_touching(item, item_box, object, box):
+                    return True
+        return False
+    
+    def objects_table(self):
+        '''
+        objects_table() retrieves the box table of the objects in the background, building it if the objects have changed since it was last built
+        
+        Returns:
+            BoxTable - table of the objects in background_obj and their collision boxes, with each object only once
+        '''
+        
+        if self.object_table == None:
+            entries = []
+            seen = set()
+            for object in self.background_obj:
+                if id(object) not in seen:
+                    seen.add(id(object))
+                    entries.append((object, entity_box(object, self)))
+            self.object_table = BoxTable(entries)
+        return self.object_table
+    
+    def collision_boxes(self, player):
+        '''
+        collision_boxes() retrieves the boxes that are checked against the walls when the player moves: the player's box and, if they are holding an item, the item's box
+        They cover the same points as detect_wall_collision() and item_detect_wall_collision()
+        
+        Parameter (required):
+            player - player object
+        
+        Returns:
+            list - tuples of the left, top, right, and bottom coordinates of each box with reference to the background grid
+        '''
+        
+        boxes = [(self.stagePosX - (player.width//2) - 5, self.stagePosY - (player.height//2) - 5,
+                  self.stagePosX + (player.width//2) + 5, self.stagePosY + (player.height//2) + 5)]
+        
+        item = player.held_item
+        if item != None:
+            boxes.append((self.stagePosX - 500 + item.x - 10, self.stagePosY - 400 + item.y - 10,
+                          self.stagePosX - 500 + item.x + item.width + 10, self.stagePosY - 400 + item.y + item.height + 10))
+        return boxes
+    
+    def sweep(self, player, dx, dy):
+        '''
+        sweep() finds how far the player can move in one direction before they hit a wall
+        Wall points are on a grid with 5 pixels between points, so the leading side of each of the player's boxes (see collision_boxes()) is checked on every
+        grid line it crosses on the way; a box can't skip over a wall however far it moves. A wall point stops a box 5 pixels before it,
+        which is where the player stops when moving 5 pixels at a time
+        
+        Parameters (required):
+            player - player object
+            dx - whole pixels to move in the x direction (0 if moving in the y direction)
+            dy - whole pixels to move in the y direction (0 if moving in the x direction)
+        
+        Returns:
+            int - pixels the player can move (with the same sign as the move); the whole move if no walls are in the way
+        '''
+        
+        move = dx + dy
+        for (left, top, right, bottom) in self.collision_boxes(player):
+            # turns the move into one along the first coordinate of each point, with the box's leading side at edge and its other sides between low and high
+            if dx > 0:
+                (edge, low, high, flip) = (right, top, bottom, False)
+            elif dx < 0:
+                (edge, low, high, flip) = (left, top, bottom, False)
+            elif dy > 0:
+                (edge, low, high, flip) = (bottom, left, right, True)
+            else:
+                (edge, low, high, flip) = (top, left, right, True)
+            
+            # grid coordinates along the leading side that a wall point stops the box at (within 5 pixels of the side)
+            across = range((low - 5)//5*5 + 5, high + 5, 5)
+            
+            # grid lines the leading side reaches (less than 5 pixels past them) on the way, nearest first
+            if move > 0:
+                lines = range(-(-(edge + 5)//5)*5, edge + move + 5, 5)
+            else:
+                lines = range((edge - 5)//5*5, edge + move - 5, -5)
+            
+            # the first line with a wall point stops the box 5 pixels before it
+            for line in lines:
+                if any(((a, line) if flip else (line, a)) in self.wall_list for a in across):
+                    stop = line - 5 - edge if move > 0 else line + 5 - edge
+                    move = stop
+                    break
+        
+        return move
     
     def detect_wall_collision(self, player):
         '''
@@ -275,28 +629,32 @@ class Background():
         # returns False if no collisions were detected
         return False
     
-    def monster_detect_wall_collision(self, monster):
+    def monster_detect_wall_collision(self, monster, dx=0, dy=0):
         '''
         monster_detect_wall_collision() detects if select monster x and y points are in a wall to determine if it was collided with a wall
         
         Parameter (required):
             monster - monster object
         
+        Parameters (optional):
+            dx - pixels to shift the monster in the x direction before checking; set to 0 by default
+            dy - pixels to shift the monster in the y direction before checking; set to 0 by default
+        
         Returns:
             Boolean - True if the monster has collided with a wall; False if the monster has not
         '''
         
         # retrieves the left (0/3), left middle (1/3), right middle (2/3), and right (3/3) x coordinates of the monster with reference to the background grid based on the center position and the monster width
-        x_left = monster.x_bg
-        x_l_mid = monster.x_bg + (monster.width//3)
-        x_r_mid = monster.x_bg + 2*(monster.width//3)
-        x_right = monster.x_bg + (monster.width)
+        x_left = monster.x_bg + dx
+        x_l_mid = x_left + (monster.width//3)
+        x_r_mid = x_left + 2*(monster.width//3)
+        x_right = x_left + (monster.width)
         
         # retrieves the top (0/3), top middle (1/3), bottom middle (2/3), and bottom (3/3) y coordinates of the monster with reference to the background grid based on the center position and the monster height
-        y_top = monster.y_bg 
-        y_t_mid = monster.y_bg + (monster.height//3)
-        y_b_mid = monster.y_bg + 2*(monster.height//3)
-        y_bottom = monster.y_bg + (monster.height)
+        y_top = monster.y_bg + dy
+        y_t_mid = y_top + (monster.height//3)
+        y_b_mid = y_top + 2*(monster.height//3)
+        y_bottom = y_top + (monster.height)
 
         # set of all monster points using x and y coordinates above
         monster_points = {(x_left, y_top), (x_left, y_t_mid), (x_left, y_b_mid), (x_left, y_bottom),
@@ -314,6 +672,77 @@ class Background():
         # returns False if no collisions were detected
         return False
 
+    def monster_free_moves(self, monster, distance=None):
+        '''
+        monster_free_moves() finds which of the four moves a monster can make from its position without colliding with a wall
+        Masks are saved by position, so each position is only checked once until a door is opened or closed
+        
+        Parameter (required):
+            monster - monster object
+        
+        Parameter (optional):
+            distance - number of pixels each move goes; set to None (one step at the monster's speed) by default
+        
+        Returns:
+            int - mask of the moves that are free (see move_bits)
+        '''
+        
+        if distance == None:
+            distance = monster.speed
+        
+        key = (monster.x_bg, monster.y_bg, monster.width, monster.height, distance)
+        if key in self.free_moves:
+            return self.free_moves[key]
+        
+        # checks each move the given distance away
+        mask = 0
+        for (move, dx, dy) in (("left", -distance, 0), ("right", distance, 0), ("up", 0, -distance), ("down", 0, distance)):
+            if not self.monster_detect_wall_collision(monster, dx, dy):
+                mask |= self.move_bits[move]
+        
+        # starts over if too many positions have been saved
+        if len(self.free_moves) > 100000:
+            self.free_moves = {}
+        
+        self.free_moves[key] = mask
+        return mask
+    
+    def line_of_sight(self, x1, y1, x2, y2):
+        '''
+        line_of_sight() checks whether two points can see each other through the labyrinth, using the places the points are in
+        Results are saved for each pair of places (see Labyrinth.visible()), so checks are cheap enough to make for every monster every frame
+        
+        Parameters (required):
+            x1 - x coordinate of the first point with respect to the stage
+            y1 - y coordinate of the first point with respect to the stage
+            x2 - x coordinate of the second point with respect to the stage
+            y2 - y coordinate of the second point with respect to the stage
+        
+        Returns:
+            Boolean - True if the points can see each other; False if not (or if either point is inside a wall between a room and the grid)
+        '''
+        
+        a = self.labyrinth.place_at(x1, y1)
+        b = self.labyrinth.place_at(x2, y2)
+        if a == None or b == None:
+            return False
+        return self.labyrinth.visible(a, b)
+    
+    def raycast(self, x, y, move):
+        '''
+        raycast() finds how far a point in the labyrinth grid is from the first wall in a direction
+        
+        Parameters (required):
+            x - x coordinate of the point with respect to the stage
+            y - y coordinate of the point with respect to the stage
+            move - direction to look ("left","right","up","down")
+        
+        Returns:
+            int - number of pixels to the wall; None if the point isn't in a grid cell
+        '''
+        
+        return self.labyrinth.raycast(x, y, move)
+    
     def item_detect_wall_collision(self, item):
         '''
         item_detect_wall_collision() detects if select item x and y points are in a wall to determine if it was collided with a wall
@@ -362,12 +791,13 @@ class Background():
         '''
         
         # x and y positions of the object with respect to the background image
-        if 'x_bg' in object.__dict__:
-            x_bg = object.x_bg
-            y_bg = object.y_bg
-        else:
+        # the player is always at the stage position (see collision.py for the coordinate spaces of objects)
+        if object.collision_space == "screen":
             x_bg = self.stagePosX
             y_bg = self.stagePosY
+        else:
+            x_bg = object.x_bg
+            y_bg = object.y_bg
         
         # gets new grid cell row and column position of object
         # position = (background coordinate - starting center position + offset)//corridor width
@@ -400,6 +830,17 @@ class Background():
         for door in corridor_doors:
             self.door_list.append(Door(self, door[0], door[1], index))
             index += 1
+        
+        self.door_ids = {id(door) for door in self.door_list}
+        
+        # registers each door's points as a blocker that is switched when the door opens or closes
+        for door in self.door_list:
+            (closed_points, open_points) = door.get_passable()
+            self.add_blocker(door.name, closed_points, open_points, blocking=door.frame == 0)
+        
+        # connects the places on either side of each door in the labyrinth graph
+        for door in self.door_list:
+            self.labyrinth.add_door(door)
     
     def place_doors(self):
         '''
@@ -427,43 +868,18 @@ class Background():
                 for col in range(2,9):
                     self.place_one_dark(row,col)
         
-        # if the player is in the labyrinth, darkens the grid squares directly around them
+        # if the player is in the labyrinth, darkens the grid squares directly around them that the flashlight can't reach
         else:
             # grid row and column position of player
             row = player.pos_row
             col = player.pos_col
+            place = self.labyrinth.cell_place(row, col)
             
-            # darkens square to north of player if not in the top labyrinth square
-            if row > 2:
-                self.place_one_dark(row-1, col)
-            
-            # darkens square to northeast of player if not in the top or rightmost labyrinth square
-            if row > 2 and col < 8:
-                self.place_one_dark(row-1, col+1)
-            
-            # darkens square to southwest of player if not in the bottom leftmost labyrinth square
-            if row < 8 and col > 2:
-                self.place_one_dark(row+1, col-1)
-            
-            # darkens square to west of player if not in the leftmost labyrinth square
-            if col > 2:
-                self.place_one_dark(row, col-1)
-            
-            # darkens square to northwest of player if not in the top leftmost labyrinth square
-            if row > 2 and col > 2:
-                self.place_one_dark(row-1, col-1)
-            
-            # darkens square to south of player if not in the bottom labyrinth square
-            if row < 8:
-                self.place_one_dark(row+1, col)
-            
-            # darkens square to southeast of player if not in the bottom rightmost labyrinth square
-            if row < 8 and col < 8:
-                self.place_one_dark(row+1, col+1)
-            
-            # darkens square to east of player if not in the rightmost labyrinth square
-            if col < 8:
-                self.place_one_dark(row, col+1)
+            # darkens each square around the player that is in the dark part of the labyrinth and can't be seen from the player's square
+            for (dark_row, dark_col) in ((row-1, col), (row-1, col+1), (row+1, col-1), (row, col-1), (row-1, col-1), (row+1, col), (row+1, col+1), (row, col+1)):
+                if dark_row >= 2 and dark_row <= 8 and dark_col >= 2 and dark_col <= 8:
+                    if not self.labyrinth.visible(place, self.labyrinth.cell_place(dark_row, dark_col)):
+                        self.place_one_dark(dark_row, dark_col)
     
     def place_one_dark(self, row, col):
         '''
@@ -479,13 +895,29 @@ class Background():
         y = -self.stagePosY + 1045 + 540*(row - 1) + 60*(row - 2)
         
         # draws dark square
-        self.screen.blit(self.dark, [x, y])
+        frame_stats.blit(self.screen, self.dark, [x, y])
 
 class Door():
     '''
     The Door() class represents a single door in the labyrinth.
     '''
     
+    collision_space = "background"  # a door's x_bg and y_bg are background coordinates (see collision.py)
+    
+    # attributes of each door (and their types); doors have no __dict__, so their attributes are stored in fixed slots
+    __slots__ = (
+        "images",  # list of surfaces; closed and open images
+        "width",   # int; width of the door's collision box in pixels
+        "height",  # int; height of the door's collision box in pixels
+        "screen",  # Background; background the door is a part of
+        "frame",   # int; 0 is closed, 1 is open
+        "x_bg",    # int; x position in background coordinates
+        "y_bg",    # int; y position in background coordinates
+        "x",       # int; x position in reference to the window
+        "y",       # int; y position in reference to the window
+        "name",    # str; name of the door's wall blocker
+    )
+    
     def __init__(self, screen, x, y, id, frame=0):
         '''
         ___init___() initializes a Door() object
@@ -519,66 +951,85 @@ class Door():
         self.x = self.x_bg - (self.x_bg%5) - self.screen.stagePosX - self.screen.sizex//2  # x position of the door with repsect to the pygame window
         self.y = self.y_bg - (self.x_bg%5) - self.screen.stagePosY - self.screen.sizey//2  # y position of the door with repsect to the pygame window
         
-        # set of the points of the door that should be removed from the labyrinth walls if opened and the points that should be added if closed
-        # starts of empty and is populated as needed
-        self.passable = set()
+        # name of the door's blocker, which holds the points of the door that are removed from the labyrinth walls if opened and added if closed
+        self.name = 'door' + str(id)
     
     def place(self):
         '''
         place() draws the door onto the screen wither open or closed depending on frame number
         '''
         
-        self.screen.surface.blit(self.images[self.frame], [self.x_bg, self.y_bg])
+        frame_stats.blit(self.screen.surface, self.images[self.frame], [self.x_bg, self.y_bg])
     
-    def get_passable(self, open=True):
+    def get_passable(self):
         '''
-        get_passable() retrieves
+        get_passable() retrieves the wall points of the door, which are registered once as a blocker in the background (see Background.add_blocker())
         
-        Parameters (optional):
-            open - Boolean representing whether the door should be opened or closed; set to True by default
-        '''
-        
-        # top left x and y positions of door rounded to the lower multiple of 5
-        start_x = self.x_bg - (self.x_bg%5)
-        start_y = self.y_bg - (self.y_bg%5)
-        
-        # if the door should be opened, searches a larger area of points to remove from the wall list
-        # larger area is needed to ensure all closed points are removed
-        if open:
-            # searches through door points by multiples of 5 and removes them from the background wall_list if found
-            # subtracting 15 and adding 15 ensures a larger area is searched
-            for x in range(start_x - self.screen.offset_x - 15, start_x - self.screen.offset_x + self.width + 15 + 1, 5):
-                for y in range(start_y - self.screen.offset_y - 15, start_y - self.screen.offset_y + self.height + 15 + 1, 5):
-                    if (x,y) in self.screen.wall_list:
-                        self.screen.wall_list.remove((x,y))
-        
-        # if the door should be closed, searches a smaller area of points
-        # smaller area is needed to ensure that, if reopened, all points will be fully removed
-        if not open:
-            # searches through door points by multiples of 5 and adds them to the background wall_list if not found
-            # adding 15 and subtracting 25 ensures a larger area is searched
-            for x in range(start_x - self.screen.offset_x + 15, start_x - self.screen.offset_x + self.width - 15 + 1, 5):
-                for y in range(start_y - self.screen.offset_y + 15, start_y - self.screen.offset_y + self.height - 15 + 1, 5):
-                    if (x,y) not in self.screen.wall_list:
-                        self.screen.wall_list.add((x,y))
+        Returns:
+            tuple - set of points added to the wall_list when the door is closed and set of points removed from the wall_list when the door is opened
+        '''
+        
+        # top left x and y positions of door rounded to the lower multiple of 5, with respect to the walls
+        start_x = self.x_bg - (self.x_bg%5) - self.screen.offset_x
+        start_y = self.y_bg - (self.y_bg%5) - self.screen.offset_y
+        
+        # points of a smaller area are added when the door is closed
+        # adding 15 and subtracting 15 ensures that, if reopened, all points will be fully removed
+        closed_points = {(x,y) for x in range(start_x + 15, start_x + self.width - 15 + 1, 5)
+                               for y in range(start_y + 15, start_y + self.height - 15 + 1, 5)}
+        
+        # points of a larger area are removed when the door is opened
+        # subtracting 15 and adding 15 ensures all closed points are removed
+        open_points = {(x,y) for x in range(start_x - 15, start_x + self.width + 15 + 1, 5)
+                             for y in range(start_y - 15, start_y + self.height + 15 + 1, 5)}
+        
+        return (closed_points, open_points)
     
     def open_door(self):
         '''
-        open_door() opens the door
+        open_door() opens the door; nothing is done if it is already open
+        
+        Returns:
+            Boolean - True if the door was opened; False if it was already open
         '''
         
+        # opens door by switching off its blocker, which removes its points from the background wall_list
+        if not self.screen.set_blocker(self.name, False):
+            return False
+        
         self.frame = 1  # changes frame to open (i.e., 1)
-        self.get_passable()  # opens door by removing door points from background wall_list
+        self.screen.labyrinth.door_changed(self)  # lets monsters find routes and move through the door
         self.place()  # redraws the door with the new frame number
+        return True
     
     def close_door(self):
         '''
-        close_door() closes the door
+        close_door() closes the door; nothing is done if it is already closed (e.g., when called every frame after the monster leaves its room)
+        
+        Returns:
+            Boolean - True if the door was closed; False if it was already closed
         '''
         
+        # closes door by switching on its blocker, which adds its points to the background wall_list
+        if not self.screen.set_blocker(self.name, True):
+            return False
+        
         self.frame = 0  # changes frame to closed (i.e., 0)
-        self.get_passable(open=False)  # closes door by adding door points to background wall_list
+        self.screen.labyrinth.door_changed(self)  # stops monsters from finding routes and moving through the door
         self.place()  # redraws the door with the new frame number
+        return True
+    
+    def restore(self, frame):
+        '''
+        restore() opens or closes the door when loading a saved game (see Background.restore_blocker()); the door isn't drawn, since only the parts of the background that changed are redrawn after loading
+        
+        Parameter (required):
+            frame - frame number of the door; 0 is closed; 1 is open
+        '''
+        
+        self.screen.restore_blocker(self.name, frame == 0)
+        self.frame = frame
+        self.screen.labyrinth.door_changed(self)
     
     def open_with_items(self, items_list, min_num, game, corridor_length=310):
         '''
@@ -597,15 +1048,21 @@ class Door():
         counter = 0
         
         if items_list != None:
-            # if the item is a Gem and is placed in front of the door, increments counter by 1
-            for item in items_list:
-                if isinstance(item, Gem) and item.in_space(self.x_bg - item.width, self.x_bg + self.width + item.width, self.y_bg - corridor_length, self.y_bg + item.height) and item.loc == 'ground':
+            # gems placed in front of the door are on the ground, so only the background objects whose boxes reach the space in front of the door are checked
+            collected = {id(item) for item in items_list if isinstance(item, Gem)}
+            width = max([item.width for item in items_list if isinstance(item, Gem)], default=0)
+            height = max([item.height for item in items_list if isinstance(item, Gem)], default=0)
+            space = (self.x_bg, self.y_bg - corridor_length, self.width + width, corridor_length + height)
+            
+            # if the item is a collected Gem and is placed in front of the door, increments counter by 1
+            for (item, box) in self.screen.objects_table().query(space):
+                if id(item) in collected and item.in_space(self.x_bg - item.width, self.x_bg + self.width + item.width, self.y_bg - corridor_length, self.y_bg + item.height) and item.loc == 'ground':
                     counter += 1
         
             # if enough gems have been placed, opens the door and redraws the background
             if counter >= min_num:
-                self.open_door()
-                self.screen.set_background_image()
+                if self.open_door():
+                    self.screen.set_background_image()
             
             # if not enough gems have been placed, informs the user of how many more gems they need
             elif (game.player.pos_col > 0 and game.player.pos_col < 9) and game.player.pos_row > 9:
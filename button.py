@@ -16,6 +16,16 @@ class Button(pygame.rect.Rect):
     The Button() class represents a button on any screen that can be clicked.
     '''
     
+    # attributes of each button (and their types) in addition to the position and size of pygame.Rect; buttons have no __dict__, so their attributes are stored in fixed slots
+    __slots__ = (
+        "images",        # list of surfaces; unclicked and clicked images
+        "frame",         # int; image frame
+        "screen_loc",    # surface; screen to draw the button on
+        "nick",          # str; button nickname
+        "count",         # int; lag that makes a click register only once
+        "prev_clicked",  # Boolean; whether the button has already been clicked
+    )
+    
     def __init__(self, x, y, screen_loc, nick):
         '''
         __init__() initializes a button
@@ -54,7 +64,7 @@ class Button(pygame.rect.Rect):
         place() draws the button on the screen
         '''
         
-        self.screen_loc.blit(self.images[self.frame], [self.x, self.y])
+        frame_stats.blit(self.screen_loc, self.images[self.frame], [self.x, self.y])
     
     def detectClick(self, events, pos=None):
         '''
@@ -106,6 +116,15 @@ class BackgroundButton(Button):
     The BackgroundButton() class is a subclass of Button() and represents a button that is part of the labyrinth background.
     '''
     
+    collision_space = "background"  # a background button's x_bg and y_bg are background coordinates (see collision.py)
+    
+    # attributes in addition to those of Button()
+    __slots__ = (
+        "walk_over",  # Boolean; whether the player can walk over the button
+        "x_bg",       # int; x position in background coordinates
+        "y_bg",       # int; y position in background coordinates
+    )
+    
     def __init__(self, x, y, screen_loc, nick):
         super().__init__(x, y, screen_loc, nick)
         self.walk_over = False
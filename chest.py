@@ -15,6 +15,24 @@ class Chest(pygame.surface.Surface):
     The Chest() class represents a chest that can be used in the game. 
     It is a subclass of the pygame Surface class.
     '''
+
+    collision_space = "background"  # a chest's x_bg and y_bg are background coordinates (see collision.py)
+
+    # attributes of each chest (and their types); chests have no __dict__, so their attributes are stored in fixed slots
+    __slots__ = (
+        "x_bg",       # int; x position in background coordinates
+        "y_bg",       # int; y position in background coordinates
+        "x",          # int; x position in reference to the window
+        "y",          # int; y position in reference to the window
+        "images",     # list of surfaces; closed and open images
+        "width",      # int; width of the chest in pixels
+        "height",     # int; height of the chest in pixels
+        "content",    # Holdable or None; item inside the chest
+        "walk_over",  # Boolean; whether the player can walk over the chest
+        "frame",      # int; image frame (0 is closed, 1 is open)
+        "state",      # Boolean; whether the chest is open
+    )
+
     def __init__(self,x_bg,y_bg):
         '''
         __init__ initializes chest items
@@ -31,7 +49,7 @@ class Chest(pygame.surface.Surface):
         # loads images into a list
         self.images = []
         for i in range(1,3):
-            img = loadImage('images/chest' + str(i) + '.png')
+            img = loadImage('images/chest' + str(i) + '.png', mask=True)
             self.images.append(img)
         
         # sets width and height of the chest to the image width and height
@@ -44,11 +62,10 @@ class Chest(pygame.surface.Surface):
 
         self.frame = 0              # image frame, changes based on open/close state
         self.state = False          # true if open, false if closed
-        
-        self.lag = 0                # lag counter
 
         # intializes parent class with width and height
         super().__init__([self.width,self.height], pygame.SRCALPHA)
+        frame_stats.count_surface()  # counts the new surface
 
     def place_object(self,object):
         '''
@@ -135,7 +152,7 @@ class Chest(pygame.surface.Surface):
         self.y = self.y_bg - (background.stagePosY)
 
         # places the chest image on the background in appropriate postion
-        background.screen.blit(self.images[self.frame], (self.x,self.y))
+        frame_stats.blit(background.screen, self.images[self.frame], (self.x,self.y))
 
         if self.content and self.state:     # if chest is open and it contains an item
             # adjusts the object's x and y coordinates so it is aligned properly in the chest
@@ -143,9 +160,9 @@ class Chest(pygame.surface.Surface):
             self.content.y = self.content.y_bg - background.stagePosY + 7
 
             # draws the holdable object image on the background in the appropriate position
-            background.screen.blit(self.content.images[0],(self.content.x,self.content.y))
+            frame_stats.blit(background.screen, self.content.images[0],(self.content.x,self.content.y))
 
-    def touching(self,other,background,tolerance=0,player=True):
+    def touching(self,other,background,tolerance=0,player=True,exact=False):
         '''
         touching() checks whether the chest is touching another object
 
@@ -157,6 +174,8 @@ class Chest(pygame.surface.Surface):
             tolerance - how much leeway there is between whether the chest is actually touching the object or not;
                         by default, set to 0
             player - whether the other object is the player or not; by default, set to True
+            exact - whether the pixels of the chest and the object must touch (checked only after their boxes do; see spritesTouching());
+                    by default, set to False i.e. their boxes touching is enough (as when checking if the player is close enough to open the chest)
 
         Returns:
             Boolean - True if touching the other object; False if not
@@ -173,7 +192,7 @@ class Chest(pygame.surface.Surface):
             # checks whether the x and y positions of either object are inside the other object
             if (x2 >= (x1 + tolerance) and x2 <= (x1 + self.width - tolerance)) or (x1 >= (x2 + tolerance) and x1 <= (x2 + other.held_item.width - tolerance)):
                 if (y2 >= (y1 + tolerance) and y2 <= (y1 + self.height -tolerance)) or (y1 >= (y2 + tolerance) and y1 <= (y2 + other.held_item.height -tolerance)):
-                    return True
+                    return not exact or spritesTouching(self.images[self.frame], x1, y1, other.held_item.images[other.held_item.frame], x2, y2)
                 
             return False
 
@@ -189,6 +208,6 @@ class Chest(pygame.surface.Surface):
             # checks whether the x and y positions of either object are inside the other object
             if (x2 >= (x1 + tolerance) and x2 <= (x1 + self.width - tolerance)) or (x1 >= (x2 + tolerance) and x1 <= (x2 + other.width - tolerance)):
                 if (y2 >= (y1 + tolerance) and y2 <= (y1 + self.height -tolerance)) or (y1 >= (y2 + tolerance) and y1 <= (y2 + other.height -tolerance)):
-                    return True
+                    return not exact or spritesTouching(self.images[self.frame], x1, y1, other.images[other.frame], x2, y2)
                 
             return False
\ No newline at end of file
@@ -0,0 +1,326 @@
+'''
+Names: Spencer Lyudovyk, Amanda Lin, Jue Gong
+Date: 05/09/22
+Project: Labors of Hercules (Choose Your Own Adventure Game)
+File: collision.py
+Purpose: This file contains the collision checks between objects in the game: a grid and a table of boxes that find the objects near each other (the broadphase),
+         box and pixel mask checks between two objects (the narrowphase), and query_pairs(), which finds every pair of touching objects at once.
+Task Description: Design a school-appropriate game allowing for user interaction/input.
+'''
+
+# imports
+from additional_func import spritesTouching
+
+# the box table keeps its boxes in NumPy arrays and checks them all at once; without NumPy, it checks them one at a time
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# all collision boxes are in background coordinates: the coordinates of the background surface that background objects are drawn on
+# objects store their positions in one of three spaces, named by their collision_space class attribute:
+#   "background" - x_bg and y_bg are background coordinates (items, chests, plants, doors, and buttons; this is the default)
+#   "stage" - x_bg and y_bg are stage coordinates, 500 and 400 pixels less than background coordinates (monsters)
+#   "screen" - x and y are window coordinates, stagePosX and stagePosY less than background coordinates (the player)
+STAGE_OFFSET = (500, 400)
+
+def entity_box(entity, background):
+    '''
+    entity_box() retrieves an object's collision box in background coordinates
+
+    Parameters (required):
+        entity - object with a position, width, and height
+        background - game background object the object is on
+
+    Returns:
+        tuple - left x, top y, width, and height of the object
+    '''
+
+    space = getattr(entity, 'collision_space', 'background')
+    if space == 'stage':
+        return (entity.x_bg + STAGE_OFFSET[0], entity.y_bg + STAGE_OFFSET[1], entity.width, entity.height)
+    elif space == 'screen':
+        return (background.stagePosX + entity.x, background.stagePosY + entity.y, entity.width, entity.height)
+    return (entity.x_bg, entity.y_bg, entity.width, entity.height)
+
+def boxes_touching(box1, box2):
+    '''
+    boxes_touching() checks whether two boxes overlap (a box includes its left and top sides, but not its right and bottom sides)
+
+    Parameters (required):
+        box1 - left x, top y, width, and height of the first box
+        box2 - left x, top y, width, and height of the second box
+
+    Returns:
+        Boolean - True if the boxes overlap; False if not
+    '''
+
+    (x1, y1, w1, h1) = box1
+    (x2, y2, w2, h2) = box2
+    return x1 < x2 + w2 and x2 < x1 + w1 and y1 < y2 + h2 and y2 < y1 + h1
+
+def entities_touching(entity1, box1, entity2, box2, exact=True):
+    '''
+    entities_touching() checks whether two objects are touching: first their boxes, and then, only if the boxes overlap, the pixels of their images
+
+    Parameters (required):
+        entity1 - first object
+        box1 - collision box of the first object (see entity_box())
+        entity2 - second object
+        box2 - collision box of the second object
+
+    Parameter (optional):
+        exact - whether the objects' pixels must touch (see spritesTouching()); set to True by default
+
+    Returns:
+        Boolean - True if the objects are touching; False if not
+    '''
+
+    if not boxes_touching(box1, box2):
+        return False
+    if not exact:
+        return True
+    return spritesTouching(entity1.images[entity1.frame], box1[0], box1[1], entity2.images[entity2.frame], box2[0], box2[1])
+
+class CollisionGrid:
+    '''
+    The CollisionGrid() class sorts objects into the square cells of a grid by their boxes, so only objects in the same cells have to be checked against each other.
+    '''
+
+    def __init__(self, cell_size=320):
+        '''
+        __init__() creates an empty grid
+
+        Parameter (optional):
+            cell_size - width and height of each cell in pixels; set to 320 by default (about the size of the largest objects, the doors)
+        '''
+
+        self.cell_size = cell_size
+        self.cells = {}  # objects in each cell, keyed by (column, row)
+        self.entities = []  # (object, box) of each object, in the order they were added
+
+    def __len__(self):
+        '''
+        __len__() retrieves the number of objects in the grid
+
+        Returns:
+            int - number of objects
+        '''
+
+        return len(self.entities)
+
+    def cell_range(self, box):
+        '''
+        cell_range() retrieves the cells that a box covers
+
+        Parameter (required):
+            box - left x, top y, width, and height of the box
+
+        Returns:
+            list - (column, row) of each cell
+        '''
+
+        (x, y, width, height) = box
+        size = self.cell_size
+        return [(col, row) for col in range(int(x)//size, int(x + width - 1)//size + 1)
+                           for row in range(int(y)//size, int(y + height - 1)//size + 1)]
+
+    def add(self, entity, box):
+        '''
+        add() adds an object to the grid
+
+        Parameters (required):
+            entity - object to be added
+            box - collision box of the object (see entity_box())
+        '''
+
+        index = len(self.entities)
+        self.entities.append((entity, box))
+        for cell in self.cell_range(box):
+            self.cells.setdefault(cell, []).append(index)
+
+    def query(self, box):
+        '''
+        query() finds the objects whose boxes overlap a box
+
+        Parameter (required):
+            box - left x, top y, width, and height of the box
+
+        Returns:
+            list - (object, box) of each object whose box overlaps, in the order they were added
+        '''
+
+        found = set()
+        for cell in self.cell_range(box):
+            found.update(self.cells.get(cell, ()))
+        return [self.entities[i] for i in sorted(found) if boxes_touching(box, self.entities[i][1])]
+
+    def candidate_pairs(self):
+        '''
+        candidate_pairs() finds the pairs of objects that share at least one cell, each pair only once
+
+        Returns:
+            list - (first index, second index) of each pair, with the first index smaller
+        '''
+
+        pairs = set()
+        for indices in self.cells.values():
+            for (n, i) in enumerate(indices):
+                for j in indices[n+1:]:
+                    pairs.add((i, j))
+        return sorted(pairs)
+
+class BoxTable:
+    '''
+    The BoxTable() class keeps the boxes of many objects (e.g., all background objects) in columns, so a box can be checked against all of them with one NumPy expression.
+    It is built once from a list of objects and is meant to be rebuilt when the objects change.
+    '''
+
+    def __init__(self, entries=()):
+        '''
+        __init__() creates the columns of the table
+
+        Parameter (optional):
+            entries - (object, box) of each object (see entity_box()); empty by default
+        '''
+
+        self.entries = list(entries)  # (object, box) of each object, in the order they were given
+
+        # left, top, right, and bottom sides of each object's box
+        if np != None:
+            boxes = np.array([box for (entity, box) in self.entries], dtype=float).reshape(-1, 4)
+            self.left = boxes[:, 0]
+            self.top = boxes[:, 1]
+            self.right = boxes[:, 0] + boxes[:, 2]
+            self.bottom = boxes[:, 1] + boxes[:, 3]
+
+    def __len__(self):
+        '''
+        __len__() retrieves the number of objects in the table
+
+        Returns:
+            int - number of objects
+        '''
+
+        return len(self.entries)
+
+    def query(self, box):
+        '''
+        query() finds the objects whose boxes overlap a box (see boxes_touching())
+
+        Parameter (required):
+            box - left x, top y, width, and height of the box
+
+        Returns:
+            list - (object, box) of each object whose box overlaps, in the order they were given
+        '''
+
+        if np == None:
+            return [entry for entry in self.entries if boxes_touching(box, entry[1])]
+
+        (x, y, width, height) = box
+        hits = np.flatnonzero((self.left < x + width) & (x < self.right) & (self.top < y + height) & (y < self.bottom))
+        return [self.entries[i] for i in hits]
+
+def query_pairs(entities, background, exact=True, cell_size=320):
+    '''
+    query_pairs() finds every pair of touching objects, each pair only once
+    The objects are sorted into a grid, and only objects that share a cell are checked against each other
+
+    Parameters (required):
+        entities - list of objects
+        background - game background object the objects are on
+
+    Parameters (optional):
+        exact - whether the objects' pixels must touch (see entities_touching()); set to True by default
+        cell_size - width and height of each grid cell in pixels; set to 320 by default
+
+    Returns:
+        list - (first object, second object) of each pair of touching objects, with the first object earlier in entities
+    '''
+
+    grid = CollisionGrid(cell_size)
+    for entity in entities:
+        grid.add(entity, entity_box(entity, background))
+
+    pairs = []
+    for (i, j) in grid.candidate_pairs():
+        (entity1, box1) = grid.entities[i]
+        (entity2, box2) = grid.entities[j]
+        if entities_touching(entity1, box1, entity2, box2, exact):
+            pairs.append((entity1, entity2))
+    return pairs
+
+def query_table(entities, table, background, exact=True):
+    '''
+    query_table() finds every pair of an object and a touching object from a box table, checking each object's box against the whole table at once
+
+    Parameters (required):
+        entities - list of objects (e.g., the player and the item they are holding)
+        table - BoxTable of the objects to check them against (e.g., the background objects)
+        background - game background object the objects are on
+
+    Parameter (optional):
+        exact - whether the objects' pixels must touch (see entities_touching()); set to True by default
+
+    Returns:
+        list - (object from entities, object from the table) of each pair of touching objects
+    '''
+
+    pairs = []
+    for entity in entities:
+        box = entity_box(entity, background)
+        for (other, other_box) in table.query(box):
+            if other is not entity and entities_touching(entity, box, other, other_box, exact):
+                pairs.append((entity, other))
+    return pairs
+
+class Contacts:
+    '''
+    The Contacts() class stores the touching pairs found by query_pairs() and query_table() so that whether two objects are touching can be looked up without checking them again.
+    '''
+
+    def __init__(self, pairs=()):
+        '''
+        __init__() indexes the touching pairs
+
+        Parameter (optional):
+            pairs - (object, object) of each pair of touching objects; empty by default
+        '''
+
+        self.pairs = list(pairs)
+        self.touched = {}  # identities (id()) of the objects touching each object, keyed by the object's identity
+        self.neighbours = {}  # objects touching each object, in the order their pairs were found, keyed by the object's identity
+        for (entity1, entity2) in self.pairs:
+            for (entity, other) in ((entity1, entity2), (entity2, entity1)):
+                touched = self.touched.setdefault(id(entity), set())
+                if id(other) not in touched:
+                    touched.add(id(other))
+                    self.neighbours.setdefault(id(entity), []).append(other)
+
+    def touching(self, entity1, entity2):
+        '''
+        touching() checks whether two objects were touching
+
+        Parameters (required):
+            entity1 - first object
+            entity2 - second object
+
+        Returns:
+            Boolean - True if the objects were found touching; False if not
+        '''
+
+        return id(entity2) in self.touched.get(id(entity1), ())
+
+    def objects_touching(self, entity):
+        '''
+        objects_touching() retrieves the objects that were touching an object
+
+        Parameter (required):
+            entity - object
+
+        Returns:
+            list - objects found touching it, in the order their pairs were found
+        '''
+
+        return self.neighbours.get(id(entity), [])
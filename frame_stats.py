@@ -0,0 +1,141 @@
+'''
+Names: Spencer Lyudovyk, Amanda Lin, Jue Gong
+Date: 05/09/22
+Project: Labors of Hercules (Choose Your Own Adventure Game)
+File: frame_stats.py
+Purpose: This file contains the FrameStats class that counts the surfaces, text renders, and blits made in each frame.
+Task Description: Design a school-appropriate game allowing for user interaction/input.
+'''
+
+# imports
+import pygame
+
+class FrameStats:
+    '''
+    The FrameStats() class counts drawing work done during a frame: surfaces created, text rendered with a font, blits, and pixels blitted.
+    Drawing code calls its surface(), render(), and blit() functions in place of the pygame ones so that the work is counted.
+    The counts are reset by end_frame() at the end of every frame (Game.tick()), and the counts of the last finished frame are kept in last.
+    '''
+
+    def __init__(self):
+        '''
+        __init__() initializes the FrameStats
+        '''
+
+        self.surfaces = 0  # number of surfaces created this frame
+        self.renders = 0  # number of font.render() calls this frame
+        self.blits = 0  # number of blit() calls this frame
+        self.pixels = 0  # number of pixels blitted this frame (after clipping)
+        self.frames = 0  # number of finished frames
+        self.last = self.counts()  # counts of the last finished frame
+        self.totals = self.counts()  # counts of all finished frames added together
+
+    def counts(self):
+        '''
+        counts() retrieves the counts of the current frame
+
+        Returns:
+            dictionary - counter name:count
+        '''
+
+        return {"surfaces": self.surfaces, "renders": self.renders, "blits": self.blits, "pixels": self.pixels}
+
+    def end_frame(self):
+        '''
+        end_frame() saves the counts of the current frame and resets them for the next frame
+        '''
+
+        self.last = self.counts()
+        for name in self.totals:
+            self.totals[name] += self.last[name]
+        self.frames += 1
+
+        self.surfaces = 0
+        self.renders = 0
+        self.blits = 0
+        self.pixels = 0
+
+    def count_surface(self):
+        '''
+        count_surface() counts a surface that was created without surface() (e.g., a Surface subclass or a loaded image)
+        '''
+
+        self.surfaces += 1
+
+    def surface(self, size, flags=0):
+        '''
+        surface() creates and counts a pygame surface
+
+        Parameter (required):
+            size - width and height of the surface
+
+        Parameter (optional):
+            flags - pygame surface flags (e.g., pygame.SRCALPHA); set to 0 by default
+
+        Returns:
+            pygame Surface - the new surface
+        '''
+
+        self.surfaces += 1
+        return pygame.surface.Surface(size, flags)
+
+    def render(self, font, text, antialias, color, background=None):
+        '''
+        render() renders and counts a line of text
+
+        Parameters (required):
+            font - pygame font the text is rendered with
+            text - text to render
+            antialias - Boolean representing whether the text has smooth edges
+            color - color of the text
+
+        Parameter (optional):
+            background - background color of the text; set to None (transparent) by default
+
+        Returns:
+            pygame Surface - the rendered text
+        '''
+
+        self.renders += 1
+        return font.render(text, antialias, color, background)
+
+    def blit(self, target, source, dest, area=None):
+        '''
+        blit() draws one surface onto another and counts the blit and the number of pixels drawn
+
+        Parameters (required):
+            target - surface that is drawn on
+            source - surface that is drawn
+            dest - location on the target that the source is drawn at
+
+        Parameter (optional):
+            area - part of the source that is drawn; set to None (the whole source) by default
+
+        Returns:
+            pygame Rect - area of the target that was drawn on
+        '''
+
+        rect = target.blit(source, dest, area)
+        self.blits += 1
+        self.pixels += rect.width*rect.height
+        return rect
+
+    def blit_many(self, target, sequence):
+        '''
+        blit_many() draws many surfaces onto one surface with a single pygame call and counts each blit and the number of pixels drawn
+
+        Parameters (required):
+            target - surface that is drawn on
+            sequence - list of (source, dest) pairs, drawn in order
+
+        Returns:
+            list - pygame Rects of the areas of the target that were drawn on
+        '''
+
+        rects = target.blits(sequence)
+        self.blits += len(rects)
+        self.pixels += sum(rect.width*rect.height for rect in rects)
+        return rects
+
+# counters shared by all files
+frame_stats = FrameStats()
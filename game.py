@@ -18,7 +18,15 @@ from health_bars import *
 from text import *
 from button import *
 from menu import *
-import pygame,sys
+from memory_profile import memory_profile
+from ai_scheduler import AIScheduler
+from monster_pool import MonsterPool
+from horde import Horde
+from collision import query_pairs, query_table, Contacts
+from triggers import TriggerZones
+from scheduler import scheduler, Timer
+from savefile import SaveWriter, SaveReader, GAME, ITEM, MONSTER, PLANT, CHEST, DOOR, LOCATIONS, NONE
+import pygame,sys,math
 
 class Game():
     '''
@@ -71,6 +79,7 @@ class Game():
         self.potion = potion
         self.items_list = items_list  # list of all items the player is holding
         self.extend = False  # whether the item the player is holding should be extended
+        self.contacts = Contacts()  # pairs of objects that were touching at the start of the frame (see find_collisions())
 
         # background interactable elements
         self.plants = plants  # list of all plants
@@ -92,6 +101,7 @@ class Game():
                                 "flashlight":False,
                                 "light switch":False,
                                 "gem":False}
+        self.triggers = TriggerZones()  # events run while the player is in certain places of the labyrinth (e.g., the introductions above)
         
         # levels
         self.level = level  # current level number
@@ -107,10 +117,10 @@ class Game():
         self.menu = None  # menu for showing items the player is holding
         self.menu_pause = False  # whether the game was paused to display the menu or not
 
-        # counters
-        self.flashlight_lag = 0  # lag for turning flashlight on/off
-        self.damage_lag = 0  # lag for doing damage to monster
-        self.items_list_lag = 0  # lag for looping through items list
+        # timers
+        self.scheduler = scheduler  # runs timed events in simulated time, which moves forward one frame each time gameplay() runs
+        self.scheduler.clear()  # forgets the timers of any previous game
+        self.repeats = {}  # timers of the actions repeated while a key is held (see repeat_ready())
         self.c = 0  # animation frame counter
         
         # initializes clock for game
@@ -119,9 +129,13 @@ class Game():
         # gem and gem countdown
         self.gems = gems  # list of all gems
         self.collected_gems = 0  # tracks how many gems the player has collected so far
-        self.time_left = 8*7200  # time left until gems disappear; 8 minutes
+        self.gem_time = 8*60  # number of seconds until gems disappear once the countdown starts; 8 minutes
+        self.gem_timer = None  # timer that removes the gems; started by the first gem_countdown()
         self.fps = 120  # frame rate of game; 120 fps
-        self.countdown = pygame.surface.Surface([95,50], pygame.SRCALPHA)  # countdown object to be drawn
+        self.player_speed = 5  # pixels the player moves each frame; can be any size, including fractions of a pixel (see Background.scroll())
+        self.countdown = frame_stats.surface([95,50], pygame.SRCALPHA)  # countdown object to be drawn
+        self.frame_stats = frame_stats  # surfaces, text renders, and blits counted in the current and last frame
+        self.ai_scheduler = AIScheduler()  # decides how often each monster's AI runs based on its distance from the player
         
         # retrieves the flashlight out of the weapons list
         for weapon in weapons:
@@ -135,6 +149,15 @@ class Game():
         
         # pygame events (e.g., key clicks)
         self.events = []
+        
+        # cell or room of the labyrinth graph the player is in; set by place_player()
+        self.player_place = None
+        
+        # monsters that all chase the player at once in horde mode (see horde.py); None if not playing in horde mode
+        self.horde = None
+        
+        # heads that split off a hydra when it is hurt; they all come from a pool made here so that none are created during a fight
+        self.hydra_heads = Horde(self, 0, pool=MonsterPool(Hydra_Head, 32))
     
     
     ## Game Setup ##
@@ -151,8 +174,10 @@ class Game():
         self.player.place(self.screen, 0)
 
         # creates and places walls
-        self.screen.place_walls(hor_rooms=self.rooms[0], vert_rooms=self.rooms[1], corridor_room=self.rooms[1][0])
-        self.screen.make_doors()
+        with startup_profile.step('Background.place_walls'):
+            self.screen.place_walls(hor_rooms=self.rooms[0], vert_rooms=self.rooms[1], corridor_room=self.rooms[1][0])
+        with startup_profile.step('Background.make_doors'):
+            self.screen.make_doors()
         
         # places the gems the player must collect at random locations in the labyrinth
         self.random_gem_locations()
@@ -162,30 +187,31 @@ class Game():
         # places all items the player possesses is not holding into the background
         for weapon in self.available_weapons:
             if self.player.held_item != weapon and weapon.loc != "chest":
-                self.screen.background_obj.append(weapon)
+                self.screen.add_object(weapon)
         
         # adds the player's starting weapon to the item list
         self.items_list.append(self.player.held_item)
         
         # adds the potion to available weapons and to the background
         self.available_weapons.append(self.potion)
-        self.screen.background_obj.append(self.potion)
+        self.screen.add_object(self.potion)
         
         # places all plants into background
         for plant in self.plants:
-            self.screen.background_obj.append(plant)
+            self.screen.add_object(plant)
 
         # places all monsters that are not active into the background
         for monster in self.monsters:
             if monster != self.active_monster:
-                self.screen.background_obj.append(monster)
+                self.screen.add_object(monster)
         
         # places all chests into the background
         for chest in self.chests:
-            self.screen.background_obj.append(chest)
+            self.screen.add_object(chest)
 
         # background map image
-        self.screen.set_background_image()
+        with startup_profile.step('Background.set_background_image'):
+            self.screen.set_background_image()
         
         # creates player and monster health bars
         self.player_health_bar = HealthBar(self.player.health, 20, 20, 'You')
@@ -200,6 +226,9 @@ class Game():
         
         # creates the error message box
         self.error_msg = ErrorBox(200,750,400,100)
+        
+        # introduces each kind of object the first time the player is in the same place as one of them
+        self.add_introductions()
     
     
     ## Main Gameplay ##
@@ -212,6 +241,9 @@ class Game():
             tutorial - Boolean representing whether the game is being player in tutorial or real game mode; default value is False
         '''
         
+        # moves simulated time forward by one frame, running the timers that are due
+        self.scheduler.advance()
+        
         # if the key 'space' is pressed, the item the player is holding should be extended
         # this means an item is being used
         if keyPressed("space"):
@@ -225,20 +257,14 @@ class Game():
             self.menu_pause = True
             self.make_menu()
         
+        self.find_collisions()  # finds every pair of touching objects once for the whole frame
         self.manipulate_backpack()  # allows the player to drop items, pick up items, cycle through backpack items, or add items to backpack
         self.move_player()  # moves player's location in the map
         self.item_interaction()  # allows player to use certain items
         
-        # checks for the correct number of gems collected at final level
-        if not tutorial and self.level == self.max_levels and self.screen.door_list[7].frame != 1:
-            # gets the gems that have been collected and adds them to a list
-            collected = []
-            for gem in self.gems:
-                if gem.times_picked_up > 0:
-                    collected.append(gem)
-            
-            # if the player has retrieved 5 gems, opens the last room for them to enter into
-            self.screen.door_list[7].open_with_items(collected, 5, self)
+        # runs the triggers in the player's place (introductions to new objects and, at the final level, the gem door)
+        if not tutorial:
+            self.triggers.update(self.player_place)
         
         
         # draws all chests on screen
@@ -266,6 +292,14 @@ class Game():
             
             if self.active_monster != None:
                 self.place_monster()  # draws monster on screen
+            
+            # moves and draws all horde monsters in horde mode
+            if self.horde != None:
+                self.horde.update(self)
+            
+            # moves and draws the heads that split off hydras
+            if len(self.hydra_heads) > 0:
+                self.hydra_heads.update(self)
         
         # draws dark parts of labyrinth
         self.darken_labyrinth()
@@ -396,37 +430,37 @@ class Game():
     def introduction_screen(self):
         '''
         introduction_screen() displays certain instructions on te first encounter with a particular item
+        The introductions to objects in the labyrinth are triggers run by self.triggers when the player is in the same place as the object (see add_introduction())
         '''
         
-        # first plant encounter
-        if not self.introductions['plant']:
-            for plant in self.plants:
-                self.check_introduce (plant, 'plant')
-        
-        # first key encounter
-        if not self.introductions['key']:
-            for key in self.keys:
-                self.check_introduce (key, 'key')
-
-        # first chest encounter
-        if not self.introductions['chest']:
-            for chest in self.chests:
-                self.check_introduce (chest, 'chest')
-
         # first flashlight encounter
         if not self.introductions['flashlight']:
             if self.player.held_item != None and self.player.held_item.nick == 'flashlight':
                 self.introduce ('flashlight')
+
+    def add_introduction(self, str, objects):
+        '''
+        add_introduction() registers the trigger that introduces a kind of object in the places of the given objects, unless it was already introduced
         
-        # first light switch encounter
-        if not self.introductions['light switch']:
-            if self.player.pos_col == 5 and self.player.pos_row == 5:
-                self.introduce('light switch')
+        Parameters (required):
+            str - a string representing the objects' name; corresponds to name in introduction dictionary
+            objects - list of objects with background coordinates (x_bg and y_bg), width, and height
+        '''
+        
+        if not self.introductions[str]:
+            self.triggers.register(str, [self.place_of(obj) for obj in objects], lambda: self.introduce(str))
 
-        # first gem encounter
-        if not self.introductions['gem']:
-            for gem in self.gems:
-                self.check_introduce(gem, 'gem')
+    def add_introductions(self):
+        '''
+        add_introductions() registers the triggers that introduce each kind of object in the labyrinth that hasn't been introduced yet
+        Only the keys the player can find (i.e., the available keys) are introduced; later keys are added as their monsters are killed (see next_level())
+        '''
+        
+        self.add_introduction('plant', self.plants)
+        self.add_introduction('key', [key for key in self.keys if key in self.available_weapons])
+        self.add_introduction('chest', self.chests)
+        self.add_introduction('light switch', [self.screen.light_switch])
+        self.add_introduction('gem', self.gems)
 
     def check_introduce (self, obj, str):
         '''
@@ -437,13 +471,38 @@ class Game():
             str - a string representing the object's name; corresponds to name in introduction dictionary
         '''
         
-        # gets object location before introducing
-        self.screen.get_new_loc(obj)
-        
-        # if the player and object are in the same area, introduces the object
-        if obj.pos_col == self.player.pos_col and obj.pos_row == self.player.pos_row:   # checks if they are in the same row/col
+        # if the player and object are in the same cell or room, introduces the object
+        if self.same_place(obj):
             self.introduce(str)  # displays introduction screen
     
+    def same_place(self, obj):
+        '''
+        same_place() checks if an object is in the same labyrinth cell or room as the player
+        
+        Parameter (required):
+            obj - object with background coordinates (x_bg and y_bg), width, and height
+        
+        Returns:
+            Boolean - True if the object is in the player's cell or room; False if not
+        '''
+        
+        place = self.place_of(obj)
+        return place != None and place == self.player_place
+    
+    def place_of(self, obj):
+        '''
+        place_of() finds the labyrinth cell or room an object is in
+        
+        Parameter (required):
+            obj - object with background coordinates (x_bg and y_bg), width, and height
+        
+        Returns:
+            place - number of the place of the object's center; None if it isn't in any place
+        '''
+        
+        labyrinth = self.screen.labyrinth
+        return labyrinth.place_at(obj.x_bg + obj.width//2 - labyrinth.offset_x, obj.y_bg + obj.height//2 - labyrinth.offset_y)
+    
     def introduce (self,str):
         '''
         introduce() displays instructional text for an item on its first encounter
@@ -539,7 +598,55 @@ class Game():
     
     
     ## Item Interaction and Labyrinth ##
-    
+
+    def find_collisions(self):
+        '''
+        find_collisions() finds every pair of touching objects that includes the player, the item they are holding, or the monster (see collision.py)
+        The rest of the frame looks the pairs up in self.contacts instead of checking objects against each other
+        '''
+
+        # objects that move, and so can touch each other, the doors, or any background object
+        movers = [self.player]
+        if self.player.held_item != None:
+            movers.append(self.player.held_item)
+        if self.active_monster != None:
+            movers.append(self.active_monster)
+
+        # the few moving objects and doors are checked against each other, and each moving object is checked against all background objects at once
+        pairs = query_pairs(movers + self.screen.door_list, self.screen)
+        pairs += query_table(movers, self.screen.objects_table(), self.screen)
+        self.contacts = Contacts(pairs)
+
+    def repeat_ready(self, name, delay):
+        '''
+        repeat_ready() lets an action done by holding a key happen on the first frame the key is held and then once every delay seconds while it stays held
+        This allows the player to either repeatedly press the key or hold it down
+
+        Parameters (required):
+            name - name of the action (e.g., 'flashlight')
+            delay - number of seconds between actions while the key is held
+
+        Returns:
+            Boolean - True if the action should happen this frame; False if not
+        '''
+
+        timer = self.repeats.get(name)
+        if timer != None and timer.active:
+            return False
+
+        self.repeats[name] = self.scheduler.after(delay)
+        return True
+
+    def release(self, name):
+        '''
+        release() lets an action done by holding a key happen again as soon as the key is pressed again (see repeat_ready())
+
+        Parameter (required):
+            name - name of the action
+        '''
+
+        self.scheduler.cancel(self.repeats.pop(name, None))
+
     def manipulate_backpack(self):
         '''
         manipulate_backpack() allows the player to pick up items, drop items, add items to backpack, and cycle through backpack items
@@ -567,11 +674,11 @@ class Game():
         elif not keyPressed('f') and self.bp_error_type == 'f':
             self.bp_error_type = None
         
-        # loops through all weapons and determines which one, if any, can be picked up
+        # loops through the objects the player is touching and determines which one, if any, can be picked up
         can_pick_up = None
-        for weapon in self.available_weapons:
-            # if the player is not holding any items, the item that they are on top of (if any) is an item that can be picked up
-            if weapon.touching(self.player, self.screen) and self.player.held_item == None and weapon.wielder == None and weapon not in self.items_list and len(self.items_list) < 5:
+        for weapon in self.contacts.objects_touching(self.player):
+            # if the player is not holding any items, the available item that they are on top of (if any) is an item that can be picked up
+            if weapon in self.available_weapons and self.player.held_item == None and weapon.wielder == None and weapon not in self.items_list and len(self.items_list) < 5:
                 can_pick_up = weapon
                 break  # if one item can be picked up, there is no need to look for others
         
@@ -627,13 +734,8 @@ class Game():
         
         # cycles through backpack items if the player has at least 1 item in the items_list
         if keyPressed("r") and len(self.items_list) > 0:
-            # implements a lag so that the items will be cycled through automatically every 40 frames
-            
-            # increments counter
-            self.items_list_lag += 1
-            
-            # selects item
-            if self.items_list_lag == 1:
+            # selects item, either each time 'r' is pressed or every third of a second (40 frames) while it is held
+            if self.repeat_ready('backpack', 1/3):
                 # if the player is holding a weapon, places that weapon into the backpack and gets its index location in the items_list
                 if self.player.held_item != None:
                     i = self.items_list.index(self.player.held_item)
@@ -653,10 +755,6 @@ class Game():
                 self.player.place(self.screen, self.frame)
                 
                 self.bp_error_type = 'r'
-            
-            # resets counter after 40 frames
-            if self.items_list_lag == 40:
-                self.items_list_lag = 0
                         
         # if there is nothing in the player's backpack, informs them of this
         elif keyPressed('r') and len(self.items_list) == 0 and self.bp_error_type != 'r':
@@ -664,9 +762,9 @@ class Game():
             self.error_msg.update_text("There is nothing in your backpack.")
             self.bp_error_type = 'r'
         
-        # resets the counter if not pressed
+        # resets the timer if not pressed
         elif not keyPressed('r') and self.bp_error_type == 'r':
-            self.items_list_lag = 0
+            self.release('backpack')
             self.bp_error_type = None
     
     def item_interaction(self):
@@ -677,29 +775,20 @@ class Game():
         ## flashlight functionality ##
         
         # if the player is holding the flashlight and pressed 'q', the flashlight is turned off if it's on and on if it's off
-        # state is changed either every 80 frames or every time the flashlight is reextended
+        # state is changed either every two thirds of a second (80 frames) while 'q' is held or every time 'q' is pressed
         if keyPressed('q') and self.player.held_item != None and self.player.held_item.nick == 'flashlight':
-            # implements a lag so that, if the 'q' key is held, the flashlight state is changed every 80 frames
-            
-            # increments lag counter
-            self.flashlight_lag += 1
-            
             # changes flashlight state
-            if self.flashlight_lag == 1:
+            if self.repeat_ready('flashlight', 2/3):
                 self.player.held_item.change_state()
-            
-            # resets lag counter after 80 frames
-            if self.flashlight_lag == 80:
-                self.flashlight_lag = 0
         
         # if the player presses 'q' while holding another item, informs them that they can only use that functionality with the flashlight
         elif keyPressed('q') and self.player.held_item != None and self.player.held_item.nick != 'flashlight':  # if the player is holding something that isn't a flashlight
             self.error = True
             self.error_msg.update_text('You can only turn a flashlight on/off.')
         
-        # if 'q' is not pressed, resets the counter for turning flashlight on/off
+        # if 'q' is not pressed, resets the timer for turning flashlight on/off
         elif not keyPressed('q'):
-            self.flashlight_lag = 0
+            self.release('flashlight')
         
         # turns off the flashlight if the player is not holding it
         if self.player.held_item != self.flashlight:
@@ -708,27 +797,21 @@ class Game():
         
         ## chest functionality ##
         
+        # if 'w' is pressed, opens a closed chest and closes an opened chest
+        # chest state is changed either every third of a second (40 frames) while 'w' is held or each time 'w' is pressed
+        toggle = False
+        if keyPressed('w'):
+            toggle = self.repeat_ready('chest', 1/3)
+        
+        # resets the chest timer if 'w' is not pressed
+        else:
+            self.release('chest')
+        
         # loops through all chests
         for chest in self.chests:
-            # if 'w' is pressed, opens a closed chest and closes an opened chest
-            # chest state is changed either every 40 frames or each time 'w' is pressed
-            if keyPressed('w'):
-                # implements a lag so that the chest state is changed every 40 frames if the player holds 'w'
-                
-                # increments lag counter
-                chest.lag += 1
-                
-                # changes the chest state if the player is touching the chest
-                if chest.lag == 1:
-                    chest.toggle(self.player, self.screen)
-
-                # resets lag every 40 frames
-                if chest.lag == 40:
-                    chest.lag = 0
-            
-            # resets the chest lag if 'w' is not pressed
-            else:
-                chest.lag = 0
+            # changes the chest state if the player is touching the chest
+            if toggle:
+                chest.toggle(self.player, self.screen)
             
             # allows the player to take an item out of an open, not empty chest if they aren't holding anything
             if keyPressed('d') and self.player.held_item == None and chest.content != None and chest.content.wielder == None and chest.content not in self.items_list and len(self.items_list) < 5:
@@ -739,36 +822,30 @@ class Game():
         
         ## shovel functionality ##
         
+        # digs either every third of a second (40 frames) while the shovel is held extended or every time the shovel is reextended
+        digging = self.player.held_item != None and self.player.held_item.nick == 'shovel' and self.extend
+        dig = digging and self.repeat_ready('dig', 1/3)
+        
         # loops through all of the plants
         for plant in self.plants:
             # digs up a plant if a shovel is being extended and is in contact with the plant
-            if self.player.held_item != None and self.player.held_item.nick == 'shovel' and self.extend:
-                # digs if the plant is not fully dug up, either every 40 frames or every time the shovel is reextended
-                if plant.frame != 4:
-                    # slows down speed of digging to every 40 frames if the shovel held extended
-                    
-                    # digs up plant
-                    if plant.dig_lag == 1:
-                        self.player.held_item.dig(plant, self.screen)
-                    
-                    # increments counter and resets counter after 40 frames
-                    plant.dig_lag += 1
-                    if plant.dig_lag == 40:
-                        plant.dig_lag = 0
+            if digging:
+                # digs if the plant is not fully dug up
+                if plant.frame != 4 and dig:
+                    self.player.held_item.dig(plant, self.screen)
                 
                 # if the plant is fully dug up, removes it from the list of plants
                 if plant.frame == 4:
                     self.plants.remove(plant)
             
             # if the player tries to dig with an item that isn't a shovel, informs them that they can only dig with a shovel
-            elif self.extend and self.player.held_item != None and self.player.held_item.touching(plant, self.screen):
+            elif self.extend and self.player.held_item != None and self.contacts.touching(self.player.held_item, plant):
                 self.error = True
                 self.error_msg.update_text("You can only dig with a shovel.")
         
-        # resets digging lag if the weapon is not extended
+        # resets digging timer if the weapon is not extended
         if not self.extend:
-            for plant in self.plants:
-                plant.dig_lag = 0
+            self.release('dig')
         
         
         ## key functionality ##
@@ -776,7 +853,7 @@ class Game():
         # loops through list of all doors
         for door in self.screen.door_list:
             # opens a door if the key that matches the door is extended and is touching the door
-            if self.extend and self.player.held_item != None and self.player.held_item.touching(door, self.screen) and door.frame == 0:
+            if self.extend and self.player.held_item != None and self.contacts.touching(self.player.held_item, door) and door.frame == 0:
                 if self.player.held_item.nick == 'key':
                     # opens door if the key id and door index match
                     if self.player.held_item.id == self.screen.door_list.index(door)+1:
@@ -797,9 +874,9 @@ class Game():
         darken_labyrinth() places squares of darkness onto the labyrinth to decrease the player's visibility if the lights are off
         '''
         
-        # if the flashlight is on and the player is inside the labyrinth, but the light switch has not been clicked (i.e., lights are off), lights up only the grid square the player is in
+        # if the flashlight is on and the player is inside the labyrinth, but the light switch has not been clicked (i.e., lights are off), lights up the grid square the player is in and the neighbouring squares that can be seen from it (see Labyrinth.visible())
         if self.labyrinth_lights_on != True and self.flashlight.state == True and (self.player.pos_row > 1 and self.player.pos_row < 9) and (self.player.pos_col > 1 and self.player.pos_col < 9):
-            self.screen.place_dark(self.player)  # darkens all labyrinth grid squares except for the player's square
+            self.screen.place_dark(self.player)  # darkens all labyrinth grid squares except for the player's square and the ones visible from it
 
         # if the light switch has not been clicked and either the player is not in the labyrinth or the flashlight is not turned on, the labyrinth is fully dark
         elif self.labyrinth_lights_on != True:
@@ -817,48 +894,34 @@ class Game():
         '''
         move_player() allows the player to move around the map (by shifting the map in the background in the opposite direction) and
                       changes the game's frame number to ensure the player and any item the player is holding are facing the correct direction
+        The player moves player_speed pixels each frame, diagonally if two arrow keys are pressed, and slides along walls they move into
         '''
         
-        # if the down key is pressed and player is not touching the monster's top side, moves the player 5 pixels down
+        # x and y directions of the pressed arrow keys (-1 is left or up, 1 is right or down)
+        x_dir = keyPressed("right") - keyPressed("left")
+        y_dir = keyPressed("down") - keyPressed("up")
+        
+        # the player can't move into the side of the monster they are touching (the monster's transparent corners don't block them)
+        if (x_dir != 0 or y_dir != 0) and self.active_monster != None and self.active_monster.touching(self.player, self.screen, exact=True):
+            if (y_dir > 0 and self.active_monster.previous == 'up') or (y_dir < 0 and self.active_monster.previous == 'down'):  # checks if the player is collided with the monster's top or bottom side
+                y_dir = 0
+            if (x_dir > 0 and self.active_monster.previous == 'left') or (x_dir < 0 and self.active_monster.previous == 'right'):  # checks if the player is collided with the monster's left or right side
+                x_dir = 0
+        
+        # moves the player (diagonal moves are the same length as straight ones) and redraws the background
+        speed = self.player_speed/math.sqrt(2) if x_dir != 0 and y_dir != 0 else self.player_speed
+        self.screen.scroll(x_dir*speed, y_dir*speed, self.player, self.player.held_item)
+        
+        # faces the player in the direction of the pressed key, checking down, right, left, and then up
         if keyPressed("down"):
-            if self.active_monster != None and self.active_monster.previous == 'up' and self.active_monster.touching(self.player, self.screen):  # checks if te player is collided with the monster's top side
-                self.screen.scroll(0, 0, self.player, self.player.held_item)  # redraws without moving
-            else:
-                self.screen.scroll(0, 5, self.player, self.player.held_item)  # moves screen 5 pixels up
-            
             self.frame = 0  # corresponds to down orientation
-        
-        # if the right key is pressed and player is not touching the monster's left side, moves the player 5 pixels right
         elif keyPressed("right"):
-            if self.active_monster != None and self.active_monster.previous == 'left' and self.active_monster.touching(self.player, self.screen):  # checks if te player is collided with the monster's left side
-                self.screen.scroll(0, 0, self.player, self.player.held_item)  # redraws without moving
-            else:
-                self.screen.scroll(5, 0, self.player, self.player.held_item)  # moves screen 5 pixels left
-            
             self.frame = 1  # corresponds to right orientation
-            
-        # if the left key is pressed and player is not touching the monster's right side, moves the player 5 pixels left
         elif keyPressed("left"):
-            if self.active_monster != None and self.active_monster.previous == 'right' and self.active_monster.touching(self.player, self.screen):  # checks if te player is collided with the monster's right side
-                self.screen.scroll(0, 0, self.player, self.player.held_item)  # redraws without moving
-            else:
-                self.screen.scroll(-5, 0, self.player, self.player.held_item)  # moves screen 5 pixels right
-            
             self.frame = 2  # corresponds to left orientation
-
-        # if the up key is pressed and player is not touching the monster's bottom side, moves the player 5 pixels up
         elif keyPressed("up"):
-            if self.active_monster != None and self.active_monster.previous == 'down' and self.active_monster.touching(self.player, self.screen):  # checks if te player is collided with the monster's bottom side
-                self.screen.scroll(0, 0, self.player, self.player.held_item)  # redraws without moving
-            else:
-                self.screen.scroll(0, -5, self.player, self.player.held_item)  # moves screen 5 pixels down
-            
             self.frame = 3  # corresponds to up orientation
     
-        # if no directional keys are pressed, redraws the player without moving
-        else:
-            self.screen.scroll(0, 0, self.player, self.player.held_item)
-    
     def place_player(self):
         '''
         place_player() draws the player and the weapon the player is holding, if any
@@ -879,6 +942,14 @@ class Game():
         
         # retrieves the new labyrinth grid row and column position of the player
         self.player.get_new_loc(self.screen)
+        
+        # retrieves the player's cell or room in the labyrinth graph, keeping the last one while the player is in the wall between a room and the grid
+        place = self.screen.labyrinth.place_at(self.screen.stagePosX, self.screen.stagePosY)
+        if place != None:
+            self.player_place = place
+        
+        # points the monsters' flow field towards the player's cell or room; it is only made again when the player changes places or a door opens or closes
+        self.screen.labyrinth.follow(self.player_place)
     
     
     ## Monster Functions ##
@@ -889,33 +960,29 @@ class Game():
         '''
         
         # if the player is using an item (if the item is extended) and that weapon comes into contact with the monster, does damage to the monster
-        if self.player.held_item != None and self.extend and self.player.held_item.touching(self.active_monster, self.screen):
+        if self.player.held_item != None and self.extend and self.contacts.touching(self.player.held_item, self.active_monster):
             # alerts the used that they cannot do damage to the monster with the key, flashlight, or gem
             if self.player.held_item.nick in ('key', 'flashlight', 'gem'):
                 self.error = True
                 self.error_msg.update_text("You can't kill with the {}.".format(self.player.held_item.nick))
             
-            # does damage to the monster either each time the weapon is extended or every 100 frames if the weapon is kept extended
+            # does damage to the monster either each time the weapon is extended or every 5/6 of a second (100 frames) if the weapon is kept extended
             # this means the player can either repeatedly press space or hold the spacebar to do damage
             else:
-                # increments the frame counter
-                self.damage_lag += 1
-                
                 # damages monster (specific number of damage points differs for different weapons and monsters)
-                if self.damage_lag == 1:
+                # a hurt hydra also splits off new heads
+                if self.repeat_ready('damage', 5/6):
                     self.active_monster.decrease_health(self.player.held_item.damage_pts[self.active_monster.nick])
-                
-                # implements the 100 frame lag for killing if the weapon stays extended
-                if self.damage_lag == 100:
-                    self.damage_lag = 0
+                    if self.active_monster.health > 0:
+                        self.active_monster.struck(self)
                 
                 # advances the game to the next level if the monster dies
                 if self.active_monster.health <= 0:
                     self.next_level()
         
-        # resets the frame lag counter if the weapon is unextended
+        # resets the damage timer if the weapon is unextended
         elif not self.extend:
-            self.damage_lag = 0
+            self.release('damage')
     
     def place_monster(self):
         '''
@@ -989,8 +1056,7 @@ class Game():
         
         # if the player is in the same room as any of the chests
         for chest in self.chests:
-            self.screen.get_new_loc(chest)
-            if chest.pos_col == self.player.pos_col and chest.pos_row == self.player.pos_row:
+            if self.same_place(chest):
                 self.text.text += "\n'w' to open or close chest"
 
         # info for closing the game
@@ -1010,6 +1076,10 @@ class Game():
         # list of gem locations
         gem_locs = []
         
+        # labyrinth graph and the player's starting cell, which every gem must be reachable from
+        labyrinth = self.screen.labyrinth
+        start = labyrinth.place_at(self.screen.stagePosX, self.screen.stagePosY)
+        
         # loops through all gems
         for gem in self.gems:
             # loops getting random location to ensure that each gem has a unique location
@@ -1019,63 +1089,103 @@ class Game():
                 x_row = random.randint(2, 8)
                 y_row = random.randint(2, 8)
                 
-                # if the grid locations are the same as previously placed gem, gets new x and y locations
-                if (x_row, y_row) not in gem_locs:
+                # if the grid locations are the same as previously placed gem or can't be reached, gets new x and y locations
+                if (x_row, y_row) not in gem_locs and labyrinth.reachable(start, labyrinth.cell_place(y_row, x_row)):
                     loop = False
             
             # adds the new gem locations to 
             gem_locs.append((x_row, y_row))
             
             # sets the x and y background coordinates of the gem so that it is in the center of the grid square it was placed in
-            # bg coordinate = x or y coordinate of top right of labyrinth + (wall thickness + corridor width or height)*(number of corridors skipped over) + (half the corridor width) - (half the gem width or height)
-            gem.x_bg = 1245 + (60 + 540)*(x_row - 1) + 540//2 - gem.width//2
-            gem.y_bg = 1050 + (60 + 540)*(y_row - 1) + 540//2 - gem.height//2
+            (x, y) = labyrinth.cell_center(y_row, x_row)
+            gem.x_bg = x - gem.width//2
+            gem.y_bg = y - gem.height//2
+    
+    def open_gem_door(self):
+        '''
+        open_gem_door() opens the door to the final room if the player has placed 5 collected gems in front of it
+        '''
+        
+        # gets the gems that have been collected and adds them to a list
+        collected = []
+        for gem in self.gems:
+            if gem.times_picked_up > 0:
+                collected.append(gem)
+        
+        # if the player has retrieved 5 gems, opens the last room for them to enter into
+        door = self.screen.door_list[7]
+        door.open_with_items(collected, 5, self)
+        
+        # the door stays open, so the gems no longer need to be checked
+        if door.frame == 1:
+            self.triggers.unregister('gem door')
+    
+    def add_gem_door(self):
+        '''
+        add_gem_door() registers the trigger that opens the door to the final room once the gems are in front of it (see open_gem_door())
+        The trigger is in the places of the corridor in front of the door and runs every frame the player is there until the door opens
+        '''
+        
+        door = self.screen.door_list[7]
+        labyrinth = self.screen.labyrinth
+        corridor = labyrinth.places_in(door.x_bg - labyrinth.offset_x, door.y_bg - 310 - labyrinth.offset_y, door.x_bg + door.width - labyrinth.offset_x, door.y_bg + door.height - labyrinth.offset_y)
+        self.triggers.register('gem door', corridor, self.open_gem_door, once=False)
+    
+    @property
+    def time_left(self):
+        '''
+        time_left() retrieves the number of seconds left until the gems disappear
+        
+        Returns:
+            float - seconds left; gem_time if the countdown hasn't started and 0 once the gems have disappeared
+        '''
+        
+        if self.gem_timer == None:
+            return self.gem_time
+        return self.scheduler.remaining(self.gem_timer)
     
     def gem_countdown(self):
         '''
         gem_countdown() draws the countdown for gems before they disappear from the background
+        The countdown starts the first time it is drawn, and the gems are removed by remove_gems() when it ends
         '''
         
-        # frame rate per minute is 60 times the frame rate per second of the game
-        fpm = 60*self.fps
+        # starts the countdown
+        if self.gem_timer == None:
+            self.gem_timer = self.scheduler.after(self.gem_time, self.remove_gems)
         
         # gets the minutes and second left
-        total_mins = self.time_left//fpm  # minutes left = (time left)/(frame rateper minute)
-        total_sec = (self.time_left - (fpm*total_mins))//self.fps  # seconds left = (time left - (frames per minute * minutes left))/(frame rate per second)
-        
-        # decreases time left
-        self.time_left -= 1
-        
-        # if time is still left, draws how much time is left in minutes:seconds on screen
-        if self.time_left > 0:
-            # sets the string for the text
-            if total_sec < 10:
-                # adds a 0 in from of seconds if second are below 10
-                t_string = str(total_mins) + ":0" + str(total_sec)
-            else:
-                t_string = str(total_mins) + ":" + str(total_sec)
-            
-            # sets the text item based on the text string
-            text = self.font.render(t_string, True, (99,99,99))
-        
-        # once time runs out
+        time_left = self.time_left
+        total_mins = int(time_left//60)
+        total_sec = int(time_left%60)
+        
+        # sets the string for the text
+        if total_sec < 10:
+            # adds a 0 in from of seconds if second are below 10
+            t_string = str(total_mins) + ":0" + str(total_sec)
         else:
-            # sets text item as blank after the time has elapsed
-            text = self.font.render("", True, (99,99,99))
-            
-            # removes all gems that haven't been found from the background
-            for gem in self.gems:
-                if gem.times_picked_up == 0:
-                    self.available_weapons.remove(gem)
-                    self.screen.background_obj.remove(gem)
-            
-            # resets background image
-            self.screen.set_background_image()
+            t_string = str(total_mins) + ":" + str(total_sec)
+        
+        # sets the text item based on the text string
+        text = frame_stats.render(self.font, t_string, True, (99,99,99))
         
         # draws countdown text on light grey background on screen
         self.countdown.fill((20, 20, 20))
-        self.countdown.blit(text, (10,10))
-        self.screen.screen.blit(self.countdown, (25,725))
+        frame_stats.blit(self.countdown, text, (10,10))
+        frame_stats.blit(self.screen.screen, self.countdown, (25,725))
+    
+    def remove_gems(self):
+        '''
+        remove_gems() removes all gems that haven't been found from the background once the gem countdown ends
+        '''
+        
+        for gem in self.gems:
+            if gem.times_picked_up == 0:
+                self.available_weapons.remove(gem)
+                self.screen.remove_object(gem)
+        
+        # resets background image
+        self.screen.set_background_image()
     
     
     ## Level Functions ##
@@ -1094,19 +1204,23 @@ class Game():
             level_key.x_bg = self.active_monster.x_bg + 575
             level_key.y_bg = self.active_monster.y_bg + 475
             
+            # the killed monster's heads die with it
+            self.hydra_heads.clear()
+            
             # advances to the next level and retrieves level items
             self.level += 1
             self.levels()
             
             # puts level key and newly available weapon into the background
-            self.screen.background_obj.append(level_key)
-            self.screen.background_obj.append(self.weapons[self.level])
+            self.screen.add_object(level_key)
+            self.screen.add_object(self.weapons[self.level])
             
             # removes the new monster from the background object list
-            self.screen.background_obj.remove(self.monsters[self.level])
+            self.screen.remove_object(self.monsters[self.level])
             
-            # places the level key into available weapons
+            # places the level key into available weapons, and introduces keys where it is if they haven't been introduced
             self.available_weapons.append(level_key)
+            self.add_introduction('key', [level_key])
             
             # redraws background
             self.screen.set_background_image()
@@ -1117,6 +1231,9 @@ class Game():
             # releases the next monster by opening the door and retrieves its grid location
             self.screen.door_list[self.level].open_door()
             self.active_monster.get_new_loc(self.screen)
+            
+            # records memory growth since the previous level in memory profiling mode
+            memory_profile.snapshot('level {}'.format(self.level), self)
         
         # if the next level is the last level, advances to the final level
         else:
@@ -1153,7 +1270,10 @@ class Game():
         level_key.y_bg = self.active_monster.y_bg + 475
         
         # puts level key into the background
-        self.screen.background_obj.append(level_key)
+        self.screen.add_object(level_key)
+        
+        # the killed monster's heads die with it
+        self.hydra_heads.clear()
         
         # advances the level by 1
         self.level += 1
@@ -1161,11 +1281,15 @@ class Game():
         # gets the key for the final room and places it int othe final monster's chest
         final_key = self.keys[self.level]
         self.chests[self.level-1].place_object(final_key)
-        self.screen.background_obj.append(final_key)
+        self.screen.add_object(final_key)
         
-        # places both keys into available weapons
+        # places both keys into available weapons, and introduces keys where they are if they haven't been introduced
         self.available_weapons.append(level_key)
         self.available_weapons.append(final_key)
+        self.add_introduction('key', [level_key, final_key])
+        
+        # checks for the correct number of gems collected whenever the player is in the corridor in front of the door to the final room
+        self.add_gem_door()
         
         # redraws background
         self.screen.set_background_image()
@@ -1175,6 +1299,225 @@ class Game():
         
         # final story instructions should be displayed
         self.final_story_instructions = True
+        
+        # records memory growth since the previous level in memory profiling mode
+        memory_profile.snapshot('final level', self)
+    
+    
+    ## Saving and Loading ##
+    
+    def saved_objects(self):
+        '''
+        saved_objects() retrieves the objects of the game in the order they are numbered in saved games, so a saved game can refer to an object by its number
+        
+        Returns:
+            tuple - list of all items, and list of all objects (the items, monsters, plants, chests, and light switch)
+        '''
+        
+        items = self.weapons + self.keys + self.gems + [self.potion]
+        return (items, items + self.monsters + self.plants + self.chests + [self.screen.light_switch])
+    
+    def save(self, path):
+        '''
+        save() saves the state of the game to a file in a compact binary format (see savefile.py), quickly enough to be done between two frames
+        The horde and the hydra's heads aren't saved
+        
+        Parameter (required):
+            path - name of the file
+        '''
+        
+        (items, objects) = self.saved_objects()
+        number = {id(object): n for (n, object) in enumerate(objects)}  # number of each object, keyed by the object's identity
+        
+        # whether the lights are on, whether the light switch is on, whether the final story should be displayed, and whether the game is complete, as bits
+        flags = self.labyrinth_lights_on | self.screen.light_switch.frame << 1 | self.final_story_instructions << 2 | self.complete << 3
+        
+        # introductions that have been displayed, as bits in the order of the introductions dictionary
+        introduced = 0
+        for (bit, name) in enumerate(self.introductions):
+            if self.introductions[name]:
+                introduced |= 1 << bit
+        
+        # the gem countdown hasn't started (0), is running (1), or has ended (2)
+        if self.gem_timer == None:
+            countdown = 0
+        elif self.gem_timer.active:
+            countdown = 1
+        else:
+            countdown = 2
+        
+        writer = SaveWriter()
+        writer.pack(GAME, self.level, flags, introduced, countdown, self.frame, self.time_left,
+                    self.screen.stagePosX, self.screen.stagePosY, self.screen.sub_x, self.screen.sub_y,
+                    int(self.player.health), number.get(id(self.player.held_item), NONE), self.collected_gems)
+        writer.records(ITEM, [(LOCATIONS.index(item.loc), item.x_bg, item.y_bg, item.times_picked_up, item.frame, item is self.flashlight and item.state) for item in items])
+        writer.records(MONSTER, [(monster.x_bg, monster.y_bg, int(monster.health), monster.state, monster.frame) for monster in self.monsters])
+        writer.records(PLANT, [(plant.frame,) for plant in self.plants])
+        writer.records(CHEST, [(chest.state, number.get(id(chest.content), NONE)) for chest in self.chests])
+        writer.records(DOOR, [(door.frame,) for door in self.screen.door_list])
+        
+        # items in the backpack, items the player has found, and objects in the background, by number
+        writer.numbers([number[id(item)] for item in self.items_list])
+        writer.numbers([number[id(item)] for item in self.available_weapons])
+        writer.numbers([number[id(object)] for object in self.screen.background_obj])
+        
+        writer.write(path)
+    
+    def load(self, path):
+        '''
+        load() restores the state of the game from a file written by save(), quickly enough to be done between two frames
+        The whole file is read and checked before the game is changed, so a file that can't be loaded leaves the game as it was
+        Only the parts of the background image that changed are redrawn (see Background.redraw_changes())
+        
+        Parameter (required):
+            path - name of the file
+        
+        Raises:
+            ValueError - if the file isn't a saved game of this version of the game
+        '''
+        
+        (items, objects) = self.saved_objects()
+        
+        # reads and checks the whole file
+        reader = SaveReader.read(path)
+        (level, flags, introduced, countdown, facing, seconds, stage_x, stage_y, sub_x, sub_y, health, held, collected) = reader.unpack(GAME)
+        reader.number(held, len(objects), optional=True)
+        item_rows = reader.records(ITEM, len(items))
+        monster_rows = reader.records(MONSTER, len(self.monsters))
+        plant_rows = reader.records(PLANT, len(self.plants))
+        chest_rows = reader.records(CHEST, len(self.chests))
+        door_rows = reader.records(DOOR, len(self.screen.door_list))
+        backpack = reader.numbers(len(objects))
+        available = reader.numbers(len(objects))
+        background = reader.numbers(len(objects))
+        reader.finish()
+        for (loc, x_bg, y_bg, times_picked_up, frame, on) in item_rows:
+            if loc >= len(LOCATIONS):
+                raise ValueError("saved game has an item in an unknown location")
+        
+        # every frame has to be one of its object's images, or the object couldn't be drawn
+        frames = [(self.player, facing)]
+        frames += [(item, row[4]) for (item, row) in zip(items, item_rows)]
+        frames += [(monster, row[4]) for (monster, row) in zip(self.monsters, monster_rows)]
+        frames += [(plant, frame) for (plant, (frame,)) in zip(self.plants, plant_rows)]
+        frames += [(door, frame) for (door, (frame,)) in zip(self.screen.door_list, door_rows)]
+        if any(frame >= len(obj.images) for (obj, frame) in frames):
+            raise ValueError("saved game has an unknown frame")
+        for (is_open, content) in chest_rows:
+            reader.number(content, len(objects), optional=True)
+        
+        # what was drawn on the background image before loading
+        drawn = self.screen.drawn_images()
+        
+        # level and the level's monster
+        self.level = level
+        self.active_monster = None
+        if self.level >= 0 and self.level < self.max_levels:
+            self.active_monster = self.monsters[self.level]
+        self.hydra_heads.clear()
+        
+        # game flags and introductions
+        self.labyrinth_lights_on = bool(flags & 1)
+        self.screen.light_switch.frame = flags >> 1 & 1
+        self.final_story_instructions = bool(flags & 4)
+        self.complete = bool(flags & 8)
+        for (bit, name) in enumerate(self.introductions):
+            self.introductions[name] = bool(introduced & 1 << bit)
+        self.collected_gems = collected
+        
+        # player position, facing direction, and health
+        self.screen.stagePosX = stage_x
+        self.screen.stagePosY = stage_y
+        self.screen.sub_x = sub_x
+        self.screen.sub_y = sub_y
+        self.frame = facing
+        self.player.health = health
+        self.scheduler.cancel(self.player.hit_timer)
+        self.player.hit = False
+        
+        # items
+        for (item, (loc, x_bg, y_bg, times_picked_up, frame, on)) in zip(items, item_rows):
+            item.loc = LOCATIONS[loc]
+            item.x_bg = x_bg
+            item.y_bg = y_bg
+            item.times_picked_up = times_picked_up
+            item.frame = frame
+            item.wielder = None
+            if item is self.flashlight:
+                if on:
+                    item.turn_on()
+                else:
+                    item.turn_off()
+        
+        # item in the player's hands, items in the backpack, and items the player has found
+        # the lists are changed in place since the player and the game share the backpack list
+        self.player.held_item = None
+        if held != NONE:
+            self.player.held_item = objects[held]
+            self.player.held_item.wielder = self.player
+        self.items_list[:] = [objects[n] for n in backpack]
+        self.available_weapons[:] = [objects[n] for n in available]
+        
+        # monsters
+        for (monster, (x_bg, y_bg, monster_health, state, frame)) in zip(self.monsters, monster_rows):
+            monster.x_bg = x_bg
+            monster.y_bg = y_bg
+            monster.health = monster_health
+            monster.state = bool(state)
+            monster.frame = frame
+            monster.previous = None
+            monster.collide = None
+            monster.labyrinth_place = None
+            monster.chase_left = 0
+            monster.n = 0
+            self.scheduler.cancel(monster.hit_timer)
+            monster.hit = False
+        
+        # plants, chests, and doors
+        for (plant, (frame,)) in zip(self.plants, plant_rows):
+            plant.frame = frame
+        for (chest, (is_open, content)) in zip(self.chests, chest_rows):
+            chest.state = bool(is_open)
+            chest.frame = 1 if is_open else 0
+            chest.content = None if content == NONE else objects[content]
+        for (door, (frame,)) in zip(self.screen.door_list, door_rows):
+            door.restore(frame)
+        
+        # objects in the background
+        self.screen.set_objects([objects[n] for n in background])
+        
+        # gem countdown, restarted with the seconds that were left
+        self.scheduler.cancel(self.gem_timer)
+        self.gem_timer = None
+        if countdown == 1:
+            self.gem_timer = self.scheduler.after(seconds, self.remove_gems)
+        elif countdown == 2:
+            self.gem_timer = Timer(self.scheduler.now, self.remove_gems)
+            self.gem_timer.active = False  # the countdown has ended and the gems were removed
+        
+        # forgets what was happening in the frame before loading: held keys, error messages, and touching objects
+        for name in list(self.repeats):
+            self.release(name)
+        if self.error:
+            self.scheduler.cancel(self.error_msg.timer)
+            self.error_msg.hide(self)
+        self.bp_error_type = None
+        self.contacts = Contacts()
+        
+        # places of the player and the monster
+        self.player.get_new_loc(self.screen)
+        self.player_place = self.screen.labyrinth.place_at(self.screen.stagePosX, self.screen.stagePosY)
+        if self.active_monster != None:
+            self.active_monster.get_new_loc(self.screen)
+        
+        # triggers of the introductions that haven't been displayed, and of the gem door if the player is at the final level and it is still closed
+        self.triggers = TriggerZones()
+        self.add_introductions()
+        if self.level == self.max_levels and self.screen.door_list[7].frame == 0:
+            self.add_gem_door()
+        
+        # redraws the parts of the background image that changed
+        self.screen.redraw_changes(drawn)
     
     
     ## Game Pausing ##
@@ -1232,6 +1575,10 @@ class Game():
                 pygame.quit()
                 sys.exit()
         
+        # saves and resets the drawing counters for the next frame
+        self.frame_stats.end_frame()
+        self.ai_scheduler.end_frame()
+        
         # advances game using how many frames per second shoudl be updated
         self.clock.tick(fps)
         return self.clock.get_fps()
@@ -1245,7 +1592,7 @@ class Game():
         '''
         
         # draws the background at the last location
-        self.screen.screen.blit(self.screen.surface, [-self.screen.stagePosX, -self.screen.stagePosY])
+        frame_stats.blit(self.screen.screen, self.screen.surface, [-self.screen.stagePosX, -self.screen.stagePosY])
         
         # updates the player's image based on a dictionary of the animation images
         # rate at which images are updates will depend on the previously set frame rate of the animation
@@ -1258,7 +1605,7 @@ class Game():
             pass
         
         # draws the player image on screen
-        self.screen.screen.blit(self.player.image, [self.player.x, self.player.y])
+        frame_stats.blit(self.screen.screen, self.player.image, [self.player.x, self.player.y])
 
         # checks for button clicks
         for button in self.buttons:
@@ -29,6 +29,7 @@ class HealthBar(pygame.surface.Surface):
         '''
         
         super().__init__([300,30])  # creates a 300x30 pixel surface for the bar
+        frame_stats.count_surface()  # counts the new surface
         self.value = value  # current number of health points
         self.max_value = value  # maximum number of health points
         self.x = x  # x coordinate of bar
@@ -54,7 +55,7 @@ class HealthBar(pygame.surface.Surface):
         self.text.updateText(self, new_text = self.nick + ": " + str(self.value) + '/' + str(self.max_value))
         
         # place self on screen
-        screen.blit(self, [self.x,self.y])
+        frame_stats.blit(screen, self, [self.x,self.y])
     
     def update_bar(self,screen, new_val=None):
         '''
@@ -0,0 +1,292 @@
+'''
+Names: Spencer Lyudovyk, Amanda Lin, Jue Gong
+Date: 05/09/22
+Project: Labors of Hercules (Choose Your Own Adventure Game)
+File: horde.py
+Purpose: This file contains the Horde class that implements horde mode, where many monsters chase the player at the same time.
+         Run "python main.py --horde [number of monsters]" to play in horde mode (100 monsters by default).
+Task Description: Design a school-appropriate game allowing for user interaction/input.
+'''
+
+# imports
+import random
+from monster import *
+from frame_stats import frame_stats
+
+# the monster table needs NumPy; without it, the horde updates its monster objects one at a time
+try:
+    import numpy as np
+    from monster_table import MonsterTable
+except ImportError:
+    MonsterTable = None
+
+class Horde:
+    '''
+    The Horde() class represents a group of monsters that are all active at once.
+    All monsters are updated together each frame: they follow the labyrinth's shared flow field, check for the player with a simple box test, and attack on their own timers.
+    Monsters far from the player only move every few frames (see ai_scheduler.py), and only the monsters on screen are drawn, all with one batched blit.
+    A horde can also start empty and have monsters added from a MonsterPool (see monster_pool.py), as with the heads that split off a hydra.
+    If NumPy is installed, the monsters' state is kept in a MonsterTable (see monster_table.py) and computed for all of them at once.
+    '''
+
+    # monster types that horde monsters are made from
+    monster_types = (Lion, Cerberus, Hydra, Golden_Deer, Cattle, Boar)
+
+    def __init__(self, game, count=100, min_distance=2, spread=150, damage_delay=100, use_table=True, pool=None):
+        '''
+        __init__() creates the horde's monsters at random locations in the labyrinth
+
+        Parameter (required):
+            game - game object the horde is a part of
+
+        Parameters (optional):
+            count - number of monsters; set to 100 by default
+            min_distance - minimum number of cells between the player's starting cell and a monster's starting cell; set to 2 by default
+            spread - maximum number of pixels a monster starts away from the center of its cell; set to 150 by default
+            damage_delay - number of frames between hits on a monster while the player keeps a weapon extended on it; set to 100 by default
+            use_table - Boolean representing whether to keep the monsters' state in a MonsterTable if NumPy is installed; set to True by default
+            pool - MonsterPool that monsters added with add() come from and that killed monsters go back to; set to None by default
+        '''
+
+        labyrinth = game.screen.labyrinth
+
+        self.scheduler = game.ai_scheduler  # gives each monster a slot for its AI ticks
+        self.pool = pool
+        self.damage_delay = damage_delay
+        self.damage_lag = {}  # frames since each monster was last hit by the player's weapon
+        self.killed = 0  # number of monsters the player has killed
+
+        # grid cells that are far enough from the player and can be reached from the player's cell
+        # a horde that starts empty (e.g., one filled from a pool) doesn't need them
+        cells = []
+        if count > 0:
+            start = labyrinth.place_at(game.screen.stagePosX, game.screen.stagePosY)
+            for row in range(1, 10):
+                for col in range(1, 10):
+                    place = labyrinth.cell_place(row, col)
+                    if abs(place//9 - start//9) + abs(place%9 - start%9) >= min_distance and labyrinth.reachable(start, place):
+                        cells.append(place)
+
+        # creates each monster centered in a random cell, moved by a random amount on the 5 pixel movement grid
+        self.monsters = []
+        for i in range(count):
+            (x, y) = labyrinth.centers[random.choice(cells)]
+            monster = self.monster_types[i%len(self.monster_types)](0, 0)
+            monster.x_bg = x - monster.width//2 + 5*random.randint(-spread//5, spread//5)
+            monster.y_bg = y - monster.height//2 + 5*random.randint(-spread//5, spread//5)
+            monster.state = True
+            self.monsters.append(monster)
+        
+        # table of the monsters' state; None if the monster objects are updated one at a time
+        self.table = None
+        if use_table and MonsterTable != None:
+            self.table = MonsterTable(self.monsters, game.ai_scheduler)
+
+    def __len__(self):
+        '''
+        __len__() retrieves the number of monsters in the horde
+
+        Returns:
+            int - number of monsters
+        '''
+
+        return len(self.monsters)
+
+    def add(self, monster):
+        '''
+        add() adds a monster to the horde
+
+        Parameter (required):
+            monster - monster object (e.g., one spawned from the horde's pool)
+        '''
+
+        if self.table != None:
+            self.table.add([monster], self.scheduler)
+            self.monsters = self.table.monsters
+        else:
+            self.monsters.append(monster)
+
+    def clear(self):
+        '''
+        clear() removes every monster from the horde, putting them back into the horde's pool if it has one
+        '''
+
+        if self.pool != None:
+            for monster in self.monsters:
+                self.pool.despawn(monster)
+        self.monsters = []
+        self.damage_lag = {}
+        if self.table != None:
+            self.table.remove(np.zeros(len(self.table), dtype=bool))
+
+    def update(self, game):
+        '''
+        update() moves, draws, and resolves attacks for every monster in the horde
+
+        Parameter (required):
+            game - game object the horde is a part of
+        '''
+
+        if self.table != None:
+            self.update_table(game)
+            return
+
+        background = game.screen
+        player = game.player
+        scheduler = game.ai_scheduler
+
+        # player's box in the same coordinates as the monsters' x_bg and y_bg
+        player_left = background.stagePosX - 500 + player.x
+        player_top = background.stagePosY - 400 + player.y
+        player_right = player_left + player.width
+        player_bottom = player_top + player.height
+
+        weapon = self.weapon(game)
+
+        dead = []
+        sprites = []  # surfaces of the monsters on screen, drawn together after all monsters are updated
+        for monster in self.monsters:
+            left = monster.x_bg
+            top = monster.y_bg
+
+            # monsters touching the player stop and attack on their own timers
+            if left < player_right and left + monster.width > player_left and top < player_bottom and top + monster.height > player_top:
+                monster.n += 1
+                extend = monster.n >= monster.attack_delay
+                if extend:
+                    player.decrease_health(monster.attack_pts)
+                    monster.n = 0
+
+            # other monsters move towards the player when their AI runs this frame, making up for the frames they skipped
+            else:
+                extend = False
+                monster.n = 0
+                steps = scheduler.steps(monster, (background.stagePosX - left, background.stagePosY - top))
+                if steps > 0 and random.random() < monster.move_rate:
+                    monster.chase_step(background, background.stagePosX, background.stagePosY, steps)
+
+            # updates the monster's window position, and draws it if it is on screen
+            monster.x = monster.x_bg - (background.stagePosX - 500)
+            monster.y = monster.y_bg - (background.stagePosY - 400)
+            if monster.x > -monster.width and monster.x < background.sizex and monster.y > -monster.height and monster.y < background.sizey:
+                sprites += monster.sprites(background, extend=extend)
+
+            # the player's extended weapon can hurt the monster
+            if self.hurt(monster, weapon, game):
+                dead.append(monster)
+
+        frame_stats.blit_many(background.screen, sprites)
+
+        # removes killed monsters
+        for monster in dead:
+            self.monsters.remove(monster)
+            self.kill(monster)
+
+    def update_table(self, game):
+        '''
+        update_table() does the same as update(), using the monster table to compute the monsters' state for all of them at once
+        Only the monsters on screen are copied into their monster objects to be drawn and hit
+
+        Parameter (required):
+            game - game object the horde is a part of
+        '''
+
+        background = game.screen
+        player = game.player
+        table = self.table
+
+        # monsters touching the player stop and attack on their own timers
+        touching = table.touching_player(background, player)
+        attacking = table.attack(touching)
+        for i in np.flatnonzero(attacking):
+            player.decrease_health(int(table.attack_pts[i]))
+
+        # other monsters move towards the player when their AI runs this frame, making up for the frames they skipped
+        (dx, dy) = table.distances(background)
+        steps = table.ai_steps(game.ai_scheduler, dx, dy)
+        moving = (steps > 0) & ~touching & (np.random.random(len(table)) < table.move_rate)
+        table.chase(background, np.flatnonzero(moving), steps[moving])
+
+        # finds the monsters on screen
+        screen_x = table.x - (background.stagePosX - 500)
+        screen_y = table.y - (background.stagePosY - 400)
+        visible = (screen_x > -table.width) & (screen_x < background.sizex) & (screen_y > -table.height) & (screen_y < background.sizey)
+
+        # draws the monsters on screen, and lets the player's extended weapon hurt them
+        weapon = self.weapon(game)
+        keep = np.ones(len(table), dtype=bool)
+        sprites = []
+        for i in np.flatnonzero(visible):
+            monster = table.view(i)
+            sprites += monster.sprites(background, extend=bool(attacking[i]))
+            keep[i] = not self.hurt(monster, weapon, game)
+            table.health[i] = monster.health
+        frame_stats.blit_many(background.screen, sprites)
+
+        # forgets the hits on monsters that went off screen
+        if self.damage_lag:
+            shown = {table.monsters[i] for i in np.flatnonzero(visible)}
+            for monster in [monster for monster in self.damage_lag if monster not in shown]:
+                del self.damage_lag[monster]
+
+        # removes killed monsters
+        if not keep.all():
+            for i in np.flatnonzero(~keep):
+                self.kill(table.monsters[i])
+            table.remove(keep)
+            self.monsters = table.monsters
+
+    def weapon(self, game):
+        '''
+        weapon() retrieves the weapon the player is attacking with
+
+        Parameter (required):
+            game - game object the horde is a part of
+
+        Returns:
+            weapon - held weapon object if it is extended and can hurt monsters; None if not
+        '''
+
+        weapon = game.player.held_item
+        if weapon == None or not game.extend or weapon.nick in ('key', 'flashlight', 'gem'):
+            return None
+        return weapon
+
+    def hurt(self, monster, weapon, game):
+        '''
+        hurt() lets the player's weapon hurt a monster when it first touches the monster and then every damage_delay frames while it keeps touching
+
+        Parameters (required):
+            monster - monster object
+            weapon - weapon the player is attacking with; None if the player isn't attacking
+            game - game object the horde is a part of
+
+        Returns:
+            Boolean - True if the monster was killed; False if not
+        '''
+
+        if weapon == None or not weapon.touching(monster, game.screen):
+            self.damage_lag.pop(monster, None)
+            return False
+
+        lag = self.damage_lag.get(monster, 0)
+        if lag == 0:
+            monster.decrease_health(weapon.damage_pts[monster.nick])
+            if monster.health > 0:
+                monster.struck(game)
+        self.damage_lag[monster] = (lag + 1)%self.damage_delay
+        return monster.health <= 0
+
+    def kill(self, monster):
+        '''
+        kill() counts a killed monster and puts it back into the horde's pool if it has one
+
+        Parameter (required):
+            monster - monster object that was removed from the horde
+        '''
+
+        self.damage_lag.pop(monster, None)
+        self.killed += 1
+        if self.pool != None:
+            self.pool.despawn(monster)
+
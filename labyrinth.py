@@ -0,0 +1,591 @@
+'''
+Names: Spencer Lyudovyk, Amanda Lin, Jue Gong
+Date: 05/09/22
+Project: Labors of Hercules (Choose Your Own Adventure Game)
+File: labyrinth.py
+Purpose: This file contains the Labyrinth class that finds routes through the labyrinth's cells, rooms, and doors.
+Task Description: Design a school-appropriate game allowing for user interaction/input.
+'''
+
+# bits of each cell's wall mask
+NORTH = 1
+EAST = 2
+SOUTH = 4
+WEST = 8
+SIDES = {'N': NORTH, 'E': EAST, 'S': SOUTH, 'W': WEST}
+
+class Labyrinth():
+    '''
+    The Labyrinth() class represents the labyrinth as a graph of places (the 81 grid cells, the rooms, and the corridor to the final room) connected by openings and doors.
+    The walls of each grid cell are compiled into a 4 bit mask, and the places are numbered so that all lookups are list indexes.
+    Places that can reach each other share a component number, so reachability can be checked without searching.
+    It finds the shortest route between two places so that monsters walk around walls instead of into them.
+    It also keeps a flow field that points every place towards the player so that any number of monsters can chase the player with one lookup each.
+    Line of sight between places is found by walking the grid cells a straight line passes through and checking their wall masks.
+    All positions are stage coordinates (i.e., the same coordinates as the wall points, monster positions, and the background stage position).
+    '''
+
+    def __init__(self, offset=(505, 390), grid_x=1245, grid_y=1050, cell=540, wall=60):
+        '''
+        __init__() initializes a Labyrinth() object
+
+        Parameters (optional):
+            offset - tuple of x and y offsets between background coordinates and stage coordinates; set to (505, 390) by default
+            grid_x - background x coordinate of the inside of the first grid column; set to 1245 by default
+            grid_y - background y coordinate of the inside of the first grid row; set to 1050 by default
+            cell - width and height of the inside of each grid cell; set to 540 by default
+            wall - thickness of the walls; set to 60 by default
+        '''
+
+        # offsets from background to stage coordinates
+        self.offset_x = offset[0]
+        self.offset_y = offset[1]
+
+        # stage coordinates of the top left of the grid (including the walls of the first cell) and the distance between cells
+        self.left = grid_x - wall - self.offset_x
+        self.top = grid_y - wall - self.offset_y
+        self.cell = cell
+        self.wall = wall
+        self.spacing = cell + wall
+
+        # places in the labyrinth; the 81 grid cells are places 0 to 80 (row by row) and rooms are added after them
+        self.walls = bytearray(81)  # wall mask of each grid cell (NORTH, EAST, SOUTH, and/or WEST bits)
+        self.centers = []  # list of the center of each place
+        self.rooms = []  # list of (place, left, top, right, bottom) for each room
+        self.edges = []  # list of each place's connections as lists of (neighbor, door, portal x, portal y, move)
+        self.open_edges = []  # list of each place's connections that can currently be passed through (door connections are only included while the door is open)
+
+        # doors, whether they are open, and the two places each door connects
+        self.doors = {}
+        self.door_places = {}
+
+        # component number of each place; places with the same number can reach each other
+        self.components = []
+        self.components_changed = True  # whether the components need to be numbered again
+
+        # routes that have already been found, keyed by (start place, goal place)
+        self.routes = {}
+
+        # flow field towards the player: the connection to take out of each place to get to the player's place
+        self.flow = []
+        self.flow_goal = None  # place the flow field leads to
+        self.flow_changed = False  # whether a door was opened or closed since the flow field was made
+
+        # whether each pair of places can see each other, keyed by (place, place)
+        self.sight = {}
+
+    def add_place(self, center):
+        '''
+        add_place() adds a new place to the labyrinth
+
+        Parameter (required):
+            center - tuple of x and y coordinates of the center of the place
+
+        Returns:
+            place - number of the new place
+        '''
+
+        self.centers.append(center)
+        self.edges.append([])
+        self.open_edges.append([])
+        self.components_changed = True
+        return len(self.centers) - 1
+
+    def connect(self, a, b, door=None, portal=None):
+        '''
+        connect() connects two places so that characters can move between them
+
+        Parameters (required):
+            a - first place
+            b - second place
+
+        Parameters (optional):
+            door - door between the places; the connection is only used while the door is open; set to None (i.e., always open) by default
+            portal - tuple of the x and y coordinates that characters move through; set to None (halfway between the places' centers) by default
+        '''
+
+        (ax, ay) = self.centers[a]
+        (bx, by) = self.centers[b]
+
+        # crossing point between the places
+        if portal == None:
+            portal = ((ax + bx)//2, (ay + by)//2)
+
+        # direction to move from one place to the other, based on which way the places are farther apart
+        if abs(bx - ax) >= abs(by - ay):
+            move = "right" if bx > ax else "left"
+            back = "left" if bx > ax else "right"
+        else:
+            move = "down" if by > ay else "up"
+            back = "up" if by > ay else "down"
+
+        self.edges[a].append((b, door, portal[0], portal[1], move))
+        self.edges[b].append((a, door, portal[0], portal[1], back))
+
+        # only open connections can be passed through
+        if door == None or self.doors[door]:
+            self.open_edges[a].append(self.edges[a][-1])
+            self.open_edges[b].append(self.edges[b][-1])
+        self.components_changed = True
+
+    def add_cells(self, wall_cells):
+        '''
+        add_cells() compiles the walls of the 81 grid cells into wall masks and connects each pair of neighboring cells that don't have a wall between them
+
+        Parameter (required):
+            wall_cells - dictionary of which cells have which walls (north, east, south, and/or west), as created by Background.place_walls()
+        '''
+
+        # adds the cells row by row with their wall masks
+        for row in range(9):
+            for col in range(9):
+                place = self.add_place((self.left + self.wall + self.spacing*col + self.cell//2, self.top + self.wall + self.spacing*row + self.cell//2))
+                for side in wall_cells[row+1][col+1]:
+                    self.walls[place] |= SIDES[side]
+
+        # connects cells to their east and south neighbors if neither cell has a wall on that side
+        for place in range(81):
+            if place%9 < 8 and not (self.walls[place] & EAST or self.walls[place+1] & WEST):
+                self.connect(place, place+1)
+            if place < 72 and not (self.walls[place] & SOUTH or self.walls[place+9] & NORTH):
+                self.connect(place, place+9)
+
+    def has_wall(self, row, col, side):
+        '''
+        has_wall() checks if a grid cell has a wall on one of its sides
+
+        Parameters (required):
+            row - grid row of cell (1 to 9)
+            col - grid column of cell (1 to 9)
+            side - NORTH, EAST, SOUTH, or WEST
+
+        Returns:
+            Boolean - True if the cell has the wall; False if not
+        '''
+
+        return self.walls[self.cell_place(row, col)] & side != 0
+
+    def add_room(self, left, top, right, bottom):
+        '''
+        add_room() adds a room outside of the grid
+
+        Parameters (required):
+            left - left x value of room (including its walls) with respect to the background
+            top - top y value of room (including its walls) with respect to the background
+            right - right x value of room (including its walls) with respect to the background
+            bottom - bottom y value of room (including its walls) with respect to the background
+
+        Returns:
+            place - number of the new place
+        '''
+
+        # stage coordinates of the room
+        left -= self.offset_x
+        right -= self.offset_x
+        top -= self.offset_y
+        bottom -= self.offset_y
+
+        place = self.add_place(((left + right)//2, (top + bottom)//2))
+        self.rooms.append((place, left, top, right, bottom))
+        return place
+
+    def add_door(self, door, reach=100):
+        '''
+        add_door() connects the places on either side of a door
+
+        Parameter (required):
+            door - Door object
+
+        Parameter (optional):
+            reach - distance from the center of the door to each side that is checked for a place; set to 100 by default
+        '''
+
+        # center of the door in stage coordinates
+        x = door.x_bg + door.width//2 - self.offset_x
+        y = door.y_bg + door.height//2 - self.offset_y
+
+        # tall doors are passed through from left to right and wide doors from top to bottom
+        if door.height > door.width:
+            a = self.place_at(x - reach, y)
+            b = self.place_at(x + reach, y)
+        else:
+            a = self.place_at(x, y - reach)
+            b = self.place_at(x, y + reach)
+
+        self.doors[door] = door.frame == 1
+        if a != None and b != None:
+            self.door_places[door] = (a, b)
+            self.connect(a, b, door, (x, y))
+
+    def door_changed(self, door):
+        '''
+        door_changed() updates whether a door is open by adding or removing its connection from the open connections of the places on either side
+        Saved routes, the flow field, and the components are updated only if the door was actually opened or closed
+
+        Parameter (required):
+            door - Door object that was opened or closed
+
+        Returns:
+            Boolean - True if the door was opened or closed; False if it was already in that state
+        '''
+
+        is_open = door.frame == 1
+        if door not in self.doors or self.doors[door] == is_open:
+            return False
+        self.doors[door] = is_open
+
+        # flips the door connection in both places
+        if door in self.door_places:
+            for place in self.door_places[door]:
+                self.open_edges[place] = [edge for edge in self.edges[place] if edge[1] == None or self.doors[edge[1]]]
+
+        self.routes = {}
+        self.sight = {}
+        self.flow_changed = True
+        self.components_changed = True
+        return True
+
+    def reachable(self, a, b):
+        '''
+        reachable() checks if one place can be reached from another through the open connections
+
+        Parameters (required):
+            a - first place
+            b - second place
+
+        Returns:
+            Boolean - True if the places are connected; False if not
+        '''
+
+        # numbers the components again if a door was opened or closed since they were last numbered
+        if self.components_changed:
+            self.number_components()
+
+        return self.components[a] == self.components[b]
+
+    def number_components(self):
+        '''
+        number_components() gives each group of places that can reach each other its own component number
+        '''
+
+        self.components = [None]*len(self.centers)
+        number = 0
+        for start in range(len(self.centers)):
+            if self.components[start] != None:
+                continue
+
+            # searches all places connected to the start
+            self.components[start] = number
+            queue = [start]
+            for place in queue:
+                for edge in self.open_edges[place]:
+                    if self.components[edge[0]] == None:
+                        self.components[edge[0]] = number
+                        queue.append(edge[0])
+
+            number += 1
+
+        self.components_changed = False
+
+    def cell_place(self, row, col):
+        '''
+        cell_place() retrieves the place number of a grid cell
+
+        Parameters (required):
+            row - grid row of cell (1 to 9)
+            col - grid column of cell (1 to 9)
+
+        Returns:
+            place - number of the cell's place
+        '''
+
+        return (row - 1)*9 + (col - 1)
+
+    def cell_center(self, row, col):
+        '''
+        cell_center() retrieves the center of a grid cell with respect to the background
+
+        Parameters (required):
+            row - grid row of cell (1 to 9)
+            col - grid column of cell (1 to 9)
+
+        Returns:
+            tuple - x and y coordinates of the center of the cell with respect to the background
+        '''
+
+        (x, y) = self.centers[self.cell_place(row, col)]
+        return (x + self.offset_x, y + self.offset_y)
+
+    def place_at(self, x, y):
+        '''
+        place_at() finds the place a point is in
+
+        Parameters (required):
+            x - x coordinate of the point with respect to the stage
+            y - y coordinate of the point with respect to the stage
+
+        Returns:
+            place - number of the place the point is in; None if the point isn't in any place (e.g., inside a wall between a room and the grid)
+        '''
+
+        # grid cells (each cell includes its north and west walls)
+        col = (x - self.left)//self.spacing
+        row = (y - self.top)//self.spacing
+        if col >= 0 and col < 9 and row >= 0 and row < 9:
+            return row*9 + col
+
+        # rooms (including their walls)
+        for (place, left, top, right, bottom) in self.rooms:
+            if x >= left and x < right and y >= top and y < bottom:
+                return place
+
+        return None
+
+    def places_in(self, left, top, right, bottom, step=40):
+        '''
+        places_in() finds the places an area overlaps, checking points of the area every few pixels (fewer than the thinnest place, a room behind a door, is wide)
+
+        Parameters (required):
+            left - left x coordinate of the area with respect to the stage
+            top - top y coordinate of the area with respect to the stage
+            right - right x coordinate of the area with respect to the stage
+            bottom - bottom y coordinate of the area with respect to the stage
+
+        Parameter (optional):
+            step - number of pixels between the points that are checked; set to 40 by default
+
+        Returns:
+            set - numbers of the places the area overlaps
+        '''
+
+        # points every step pixels, including the area's right and bottom edges
+        xs = list(range(left, right, step)) + [right]
+        ys = list(range(top, bottom, step)) + [bottom]
+
+        places = {self.place_at(x, y) for x in xs for y in ys}
+        places.discard(None)
+        return places
+
+    def route(self, start, goal):
+        '''
+        route() finds the shortest list of places from one place to another using a breadth first search
+        Routes are saved so that each route is only searched for once until a door is opened or closed
+
+        Parameters (required):
+            start - starting place
+            goal - place to go to
+
+        Returns:
+            list - places from the start to the goal (including both); None if the goal can't be reached
+        '''
+
+        key = (start, goal)
+        if key in self.routes:
+            return self.routes[key]
+
+        # places in different components can't reach each other
+        if not self.reachable(start, goal):
+            self.routes[key] = None
+            return None
+
+        # searches outward from the start, saving the place each place was reached from
+        came_from = {start: None}
+        queue = [start]
+        for place in queue:
+            if place == goal:
+                break
+            for edge in self.open_edges[place]:
+                neighbor = edge[0]
+                if neighbor not in came_from:
+                    came_from[neighbor] = place
+                    queue.append(neighbor)
+
+        # follows the saved places back from the goal to get the route
+        route = None
+        if goal in came_from:
+            route = [goal]
+            while route[-1] != start:
+                route.append(came_from[route[-1]])
+            route.reverse()
+
+        self.routes[key] = route
+        return route
+
+    def next_step(self, start, goal):
+        '''
+        next_step() retrieves the connection to take out of the starting place to get to the goal
+
+        Parameters (required):
+            start - starting place
+            goal - place to go to
+
+        Returns:
+            tuple - (neighbor, door, portal x, portal y, move) of the connection; None if the goal can't be reached or is the start
+        '''
+
+        route = self.route(start, goal)
+        if route == None or len(route) < 2:
+            return None
+
+        for edge in self.open_edges[start]:
+            if edge[0] == route[1]:
+                return edge
+
+        return None
+
+    def follow(self, goal):
+        '''
+        follow() points the flow field towards a place, which is usually the player's place
+        The flow field is only made again if the goal is a different place or if a door was opened or closed
+
+        Parameter (required):
+            goal - place the flow field should lead to; None keeps the current goal (e.g., while the player is in the wall between a room and the grid)
+        '''
+
+        if goal == None or (goal == self.flow_goal and not self.flow_changed):
+            return
+
+        self.flow_goal = goal
+        self.flow_changed = False
+
+        # searches outward from the goal; the connection back to the place each place was reached from leads towards the goal
+        self.flow = [None]*len(self.centers)
+        reached = {goal}
+        queue = [goal]
+        for place in queue:
+            for (neighbor, door, px, py, move) in self.open_edges[place]:
+                if neighbor not in reached:
+                    reached.add(neighbor)
+                    queue.append(neighbor)
+
+                    # saves the neighbor's connection back to this place
+                    for edge in self.open_edges[neighbor]:
+                        if edge[0] == place and edge[1] == door:
+                            self.flow[neighbor] = edge
+                            break
+
+    def flow_step(self, place):
+        '''
+        flow_step() retrieves the connection to take out of a place to follow the flow field
+
+        Parameter (required):
+            place - place to move out of
+
+        Returns:
+            tuple - (neighbor, door, portal x, portal y, move) of the connection; None if the place is the goal or can't reach the goal
+        '''
+
+        if place == None or not self.flow:
+            return None
+
+        return self.flow[place]
+
+    def visible(self, a, b):
+        '''
+        visible() checks whether a straight line between the centers of two places passes through no walls
+        Grid cells are checked by walking the cells the line passes through; a room can only see the places its open doors lead to
+        Results are saved by (place, place), so each pair is only checked once until a door is opened or closed
+
+        Parameters (required):
+            a - first place
+            b - second place
+
+        Returns:
+            Boolean - True if the places can see each other; False if not
+        '''
+
+        key = (a, b)
+        if key in self.sight:
+            return self.sight[key]
+
+        if a == b:
+            seen = True
+
+        # rooms and the corridor only see through their open doors
+        elif a >= 81 or b >= 81:
+            seen = any(edge[0] == b for edge in self.open_edges[a])
+
+        # grid cells see each other if none of the cell sides the line crosses has a wall
+        else:
+            (row, col) = divmod(a, 9)
+            (end_row, end_col) = divmod(b, 9)
+            x_steps = abs(end_col - col)
+            y_steps = abs(end_row - row)
+            x_dir = 1 if end_col > col else -1
+            y_dir = 1 if end_row > row else -1
+
+            # crosses the next column or row boundary, whichever the line reaches first
+            seen = True
+            x_crossed = 0
+            y_crossed = 0
+            while seen and (x_crossed < x_steps or y_crossed < y_steps):
+                order = (1 + 2*x_crossed)*y_steps - (1 + 2*y_crossed)*x_steps
+                if order == 0:
+                    # passes through a corner, so both ways around the corner must be open
+                    seen = (self.opening(row, col, 0, x_dir) and self.opening(row, col + x_dir, y_dir, 0) and
+                            self.opening(row, col, y_dir, 0) and self.opening(row + y_dir, col, 0, x_dir))
+                    (row, col) = (row + y_dir, col + x_dir)
+                    x_crossed += 1
+                    y_crossed += 1
+                elif order < 0:
+                    seen = self.opening(row, col, 0, x_dir)
+                    col += x_dir
+                    x_crossed += 1
+                else:
+                    seen = self.opening(row, col, y_dir, 0)
+                    row += y_dir
+                    y_crossed += 1
+
+        self.sight[(a, b)] = seen
+        self.sight[(b, a)] = seen
+        return seen
+
+    def opening(self, row, col, row_dir, col_dir):
+        '''
+        opening() checks whether there is no wall between a grid cell and the cell next to it
+
+        Parameters (required):
+            row - grid row of cell (0 to 8)
+            col - grid column of cell (0 to 8)
+            row_dir - -1 for the cell above, 1 for the cell below, or 0
+            col_dir - -1 for the cell to the left, 1 for the cell to the right, or 0
+
+        Returns:
+            Boolean - True if the cells are open to each other; False if not
+        '''
+
+        (side, opposite) = {(-1, 0): (NORTH, SOUTH), (1, 0): (SOUTH, NORTH), (0, -1): (WEST, EAST), (0, 1): (EAST, WEST)}[(row_dir, col_dir)]
+        return self.walls[row*9 + col] & side == 0 and self.walls[(row + row_dir)*9 + col + col_dir] & opposite == 0
+
+    def raycast(self, x, y, move):
+        '''
+        raycast() finds how far a point is from the first wall in a direction, walking through the grid cells' wall masks
+
+        Parameters (required):
+            x - x coordinate of the point with respect to the stage
+            y - y coordinate of the point with respect to the stage
+            move - direction to look ("left","right","up","down")
+
+        Returns:
+            int - number of pixels to the wall; None if the point isn't in a grid cell
+        '''
+
+        place = self.place_at(x, y)
+        if place == None or place >= 81:
+            return None
+        (row, col) = divmod(place, 9)
+
+        # walks cell by cell until a cell has a wall on that side (or the edge of the grid is reached)
+        (side, row_dir, col_dir) = {"left": (WEST, 0, -1), "right": (EAST, 0, 1), "up": (NORTH, -1, 0), "down": (SOUTH, 1, 0)}[move]
+        while self.walls[row*9 + col] & side == 0 and 0 <= row + row_dir < 9 and 0 <= col + col_dir < 9:
+            row += row_dir
+            col += col_dir
+
+        # distance to the inside edge of the wall (each cell includes its north and west walls)
+        if move == "left":
+            return max(0, x - (self.left + self.spacing*col + self.wall))
+        if move == "right":
+            return max(0, self.left + self.spacing*(col + 1) - x)
+        if move == "up":
+            return max(0, y - (self.top + self.spacing*row + self.wall))
+        return max(0, self.top + self.spacing*(row + 1) - y)
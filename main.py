@@ -9,35 +9,63 @@ Task Description: Design a school-appropriate game allowing for user interaction
 '''
 
 # imports
-from numpy import place
-from background import *
-from player import Player
-from weapons import *
-from monster import *
-from plant import *
-from additional_func import *
-from text import *
-from button import *
-from game import *
-from chest import *
-
-def main():
-    # loops game to allow for replaying
-    while True:
-        # creates Background object for screen
+import os
+import sys
+from startup_profile import startup_profile
+
+# in startup profiling mode, everything before the first frame is timed, starting with the imports
+startup_profile.enabled = '--profile-startup' in sys.argv
+
+# numpy comes first, since pygame imports it too (for pygame.surfarray)
+with startup_profile.step('import numpy'):
+    from numpy import place
+with startup_profile.step('import pygame'):
+    import pygame
+with startup_profile.step('import pandas'):
+    import pandas
+with startup_profile.step('import game files'):
+    from background import *
+    from player import Player
+    from weapons import *
+    from monster import *
+    from plant import *
+    from additional_func import *
+    from text import *
+    from button import *
+    from game import *
+    from chest import *
+    from horde import Horde
+
+# imported after the timed imports, since it loads pygame itself
+from memory_profile import memory_profile
+
+def new_game():
+    '''
+    new_game() creates the background, player, items, monsters, and text needed for a new game
+    
+    Returns:
+        game - Game object containing all of the created objects
+    '''
+    
+    # creates Background object for screen
+    with startup_profile.step('Background'):
         screen = Background(1000, 800, "images/map.png", (1050, 900), light_switch=(3830, 3870))
 
-        # player and all the items they possess (items_list)
+    # player and all the items they possess (items_list)
+    with startup_profile.step('Player'):
         items_list = []
         player = Player("player", items_list)
 
-        # instructions textbox in the corner of the screen
+    # instructions textbox in the corner of the screen
+    with startup_profile.step('TextBox'):
         text = TextBox(700,530,270,240, top_padding=10, left_padding=10, padding=0)
-        
-        # story box
+    
+    # story box
+    with startup_profile.step('Story'):
         story = Story(150,150)
 
-        # monsters
+    # monsters
+    with startup_profile.step('monsters'):
         lion = Lion(400,1500)
         cerberus = Cerberus(400,3220)
         hydra = Hydra(400,4970)
@@ -46,7 +74,8 @@ def main():
         boar = Boar(6050,4970)
         monsters = [lion, cerberus, hydra, cattle, golden_deer, boar]
 
-        # weapons
+    # weapons
+    with startup_profile.step('weapons'):
         sword = Sword(None,"ground",x_bg=1300, y_bg=1300)
         shovel = Shovel(player,'hands', x_bg=1300, y_bg=1300)
         boxing_glove = Boxing_Glove(None, 'ground',x_bg=1300, y_bg=1300)
@@ -54,65 +83,123 @@ def main():
         trident = Trident(None,'ground',x_bg=1500,y_bg=1500)
         flashlight = Flashlight(None, 'ground', x_bg=1300, y_bg=1400)
         weapons = [shovel, sword, flashlight, boxing_glove, flame_thrower, trident]
-        
-        # keys for each door
+    
+    # keys for each door
+    with startup_profile.step('keys'):
         keys = []
         for n in range(1,9):
             keys.append(Key(None, 'ground', n))
 
-        # flowers throughout the map
+    # flowers throughout the map
+    with startup_profile.step('plants'):
         plants = []
         plant_location = [(1980,1170),(2730,2365),(4975,3055),(5535, 5985),(2000,4000),(3000,1800)]
         for location in plant_location:
             plants.append(Plant(location[0],location[1]))
 
-        # chests in monster rooms
+    # chests in monster rooms
+    with startup_profile.step('chests'):
         chests = []
         chest_location = [(660,1890), (660,3600), (660,5350), (6950,1890), (6950,3600), (6950,5350)]
         for location in chest_location:
             chests.append(Chest(location[0],location[1]))
 
-        # buttons
+    # buttons
+    with startup_profile.step('buttons'):
         pause_button = Button(900,20,screen.screen,'pause')
         buttons = [pause_button]
-        
-        # 6 gems throughout labyrinth
+    
+    # 6 gems throughout labyrinth
+    with startup_profile.step('gems'):
         gems = []
         for i in range(0, 6):
             gems.append(Gem(None, 'ground'))
 
-        # elixir/potion of immortality
+    # elixir/potion of immortality
+    with startup_profile.step('potion'):
         potion = Potion(None, 'ground', x_bg=3860, y_bg=7150)
+    
+    # gets x and y starting positions for the 6 rooms on the sides of the labyrinth
+    hor_rooms = []
+    for num in range(1,4):
+        # gets the top y value for the room
+        # this is the wall number from the top * the starting wall x coordinate - 5 * (the wall number from the top - 1)
+        # the 5 pixel offset ensures the rooms match up properly with the other walls
+        y = 1745*num - 5*(num-1)
         
-        # gets x and y starting positions for the 6 rooms on the sides of the labyrinth
-        hor_rooms = []
-        for num in range(1,4):
-            # gets the top y value for the room
-            # this is the wall number from the top * the starting wall x coordinate - 5 * (the wall number from the top - 1)
-            # the 5 pixel offset ensures the rooms match up properly with the other walls
-            y = 1745*num - 5*(num-1)
-            
-            # a room on each side of the labyrinth for each y value
-            for x in (550, 6600):
-                hor_rooms.append((x, y))
-        
-        # gets x and y starting positions of the single vertical room
-        vert_rooms = [(3695,6665)]
-        
-        # all rooms
-        rooms = (hor_rooms, vert_rooms)
-        
-        # initializes game with above variables
+        # a room on each side of the labyrinth for each y value
+        for x in (550, 6600):
+            hor_rooms.append((x, y))
+    
+    # gets x and y starting positions of the single vertical room
+    vert_rooms = [(3695,6665)]
+    
+    # all rooms
+    rooms = (hor_rooms, vert_rooms)
+    
+    # initializes game with above variables
+    with startup_profile.step('Game'):
         game = Game(screen, player, weapons, monsters, keys, gems, plants, buttons, text, story, chests, items_list, potion, rooms, level=0)
 
+    
+    return game
+
+autosave_time = 30  # number of seconds of play between autosaves (see main())
+
+def main(horde_count=0, save_path=None):
+    '''
+    main() plays the game, starting a new game each time the player loses
+    
+    Parameters (optional):
+        horde_count - number of monsters chasing the player at once in horde mode; set to 0 (i.e., normal game) by default
+        save_path - name of the file the game is saved to every autosave_time seconds of play, and loaded from when the game starts if it exists; set to None (i.e., no saving) by default
+    '''
+    
+    # number of times the game has been restarted
+    restarts = 0
+    
+    # loops game to allow for replaying
+    while True:
+        # creates a new game with all of its objects
+        game = new_game()
+        player = game.player
+        
+        # continues the saved game when the game starts, if there is one
+        continuing = save_path != None and restarts == 0 and os.path.exists(save_path)
+        
         # displays initial storyline
-        game.story_screen()
+        if not continuing:
+            game.story_screen()
         
         # sets up first level of game
         game.setup()
+        
+        # loads the saved game into the new game; a saved game that can't be loaded leaves the new game as it was
+        if continuing:
+            try:
+                game.load(save_path)
+            except ValueError as error:
+                print("could not load " + save_path + ": " + str(error))
+                continuing = False
+        
+        # adds the horde of monsters in horde mode
+        if horde_count > 0:
+            game.horde = Horde(game, horde_count)
+        
+        # records memory at the start of the game, and on restarts, how much memory the previous game left behind (memory profiling mode)
+        if restarts == 0:
+            memory_profile.snapshot('start', game)
+        else:
+            memory_profile.snapshot('restart {}'.format(restarts), game)
+        restarts += 1
 
-        # displays starting instructions
-        game.instruction_screen()
+        # displays starting instructions, unless a saved game was continued
+        if not continuing:
+            game.instruction_screen()
+        
+        # saves the game regularly while playing (the scheduler's time stops while the game is paused)
+        if save_path != None:
+            game.scheduler.every(autosave_time, lambda: game.save(save_path))
 
         # loops gameplay while the player is alive
         while player.health > 0:
@@ -159,6 +246,66 @@ def main():
             pygame.display.update()
             game.tick(game.fps, game.events)
 
-# calls main function
+def profile_startup(filename='startup_profile.json'):
+    '''
+    profile_startup() creates a new game and draws its first frame, then prints how long each step took and saves the times to a JSON file
+    
+    Parameter (optional):
+        filename - name of the JSON file the times are saved to; set to 'startup_profile.json' by default
+    '''
+    
+    # creates the game and all of its objects
+    with startup_profile.step('new_game'):
+        game = new_game()
+    
+    # sets up the first level
+    with startup_profile.step('Game.setup'):
+        game.setup()
+    
+    # draws the first frame, which is a tutorial frame in the normal game
+    with startup_profile.step('first frame'):
+        game.events = pygame.event.get()
+        game.gameplay(tutorial=True)
+        pygame.display.update()
+    
+    # prints and saves the times
+    startup_profile.report()
+    startup_profile.write_json(filename)
+    print("startup profile written to " + filename)
+    
+    pygame.quit()
+
+def option_args(option):
+    '''
+    option_args() retrieves the optional filename given after a command line option
+    
+    Parameter (required):
+        option - command line option (e.g., '--profile-startup')
+    
+    Returns:
+        list - the filename in a list if one was given; otherwise, an empty list
+    '''
+    
+    args = sys.argv[sys.argv.index(option)+1:]
+    return [arg for arg in args[:1] if not arg.startswith('--')]
+
+# calls main function, or profiles the startup if '--profile-startup' was given (optionally followed by a JSON filename)
+# '--profile-memory' (optionally followed by a report filename) records memory use at every level change and restart while playing
+# '--horde' (optionally followed by a number of monsters) plays in horde mode
+# '--save' (optionally followed by a filename) continues the saved game and autosaves while playing
 if __name__=="__main__":
-    main()
\ No newline at end of file
+    if startup_profile.enabled:
+        profile_startup(*option_args('--profile-startup'))
+    else:
+        if '--profile-memory' in sys.argv:
+            memory_profile.start(*option_args('--profile-memory'))
+        
+        horde_count = 0
+        if '--horde' in sys.argv:
+            horde_count = int((option_args('--horde') + [100])[0])
+        
+        save_path = None
+        if '--save' in sys.argv:
+            save_path = (option_args('--save') + ['savegame.dat'])[0]
+        
+        main(horde_count, save_path)
\ No newline at end of file
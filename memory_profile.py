@@ -0,0 +1,174 @@
+'''
+Names: Spencer Lyudovyk, Amanda Lin, Jue Gong
+Date: 05/09/22
+Project: Labors of Hercules (Choose Your Own Adventure Game)
+File: memory_profile.py
+Purpose: This file contains the MemoryProfile class that records how memory grows as the game moves through its levels.
+         Run "python main.py --profile-memory [filename]" to write a report at every level change and restart (memory_profile.txt by default).
+Task Description: Design a school-appropriate game allowing for user interaction/input.
+'''
+
+# imports
+import gc, time, types, tracemalloc
+import pygame
+
+class MemoryProfile:
+    '''
+    The MemoryProfile() class takes tracemalloc snapshots and compares each one to the previous one, grouped by source line.
+    Since tracemalloc can't see the pixel memory that SDL allocates for surfaces, it also tallies the sizes of all surfaces the game can reach.
+    Snapshots are only taken if profiling is enabled.
+    '''
+
+    def __init__(self):
+        '''
+        __init__() initializes the MemoryProfile
+        '''
+
+        self.enabled = False  # whether snapshots are taken
+        self.filename = None  # report file
+        self.start_time = None  # time profiling started
+        self.previous = None  # previous tracemalloc snapshot
+        self.previous_surfaces = {}  # previous surface tally
+        self.top = 15  # number of source lines listed for each snapshot
+
+    def start(self, filename='memory_profile.txt'):
+        '''
+        start() enables profiling and starts tracing memory allocations
+
+        Parameter (optional):
+            filename - name of the report file; set to 'memory_profile.txt' by default
+        '''
+
+        self.enabled = True
+        self.filename = filename
+        self.start_time = time.perf_counter()
+
+        tracemalloc.start()
+
+        # starts a new report
+        with open(self.filename, 'w') as file:
+            file.write("Memory profile\n")
+
+    def snapshot(self, label, game):
+        '''
+        snapshot() takes a snapshot and adds its differences from the previous snapshot to the report
+
+        Parameters (required):
+            label - name of the snapshot in the report (e.g., 'level 2')
+            game - game object whose surfaces are tallied
+        '''
+
+        if not self.enabled:
+            return
+
+        # ignores memory used by tracemalloc, this profile, and the import system
+        snapshot = tracemalloc.take_snapshot().filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),
+                                                              tracemalloc.Filter(False, __file__),
+                                                              tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                                                              tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>")))
+        surfaces = surface_tally(game)
+
+        lines = ["", "=== {} ({:.1f} s) ===".format(label, time.perf_counter() - self.start_time)]
+
+        # Python memory traced by tracemalloc
+        total = sum(stat.size for stat in snapshot.statistics('filename'))
+        if self.previous == None:
+            lines.append("traced Python memory: {}".format(size_text(total)))
+            lines.append("largest allocations by source line:")
+            for stat in snapshot.statistics('lineno')[:self.top]:
+                lines.append("  {:>12}  {:>8} blocks  {}".format(size_text(stat.size), stat.count, line_text(stat.traceback)))
+        else:
+            previous_total = sum(stat.size for stat in self.previous.statistics('filename'))
+            lines.append("traced Python memory: {} ({} since previous snapshot)".format(size_text(total), size_text(total - previous_total, sign=True)))
+            lines.append("largest changes by source line:")
+            for stat in snapshot.compare_to(self.previous, 'lineno')[:self.top]:
+                if stat.size_diff == 0:
+                    break
+                lines.append("  {:>12}  {:>+8} blocks  {}".format(size_text(stat.size_diff, sign=True), stat.count_diff, line_text(stat.traceback)))
+
+        # surface memory allocated by SDL, grouped by the type and size of surface
+        surface_total = sum(count*size for (count, size) in surfaces.values())
+        previous_surface_total = sum(count*size for (count, size) in self.previous_surfaces.values())
+        lines.append("SDL surface memory reachable from the game: {} surfaces, {} ({} since previous snapshot)".format(
+                     sum(count for (count, size) in surfaces.values()), size_text(surface_total), size_text(surface_total - previous_surface_total, sign=True)))
+        for key in sorted(surfaces, key=lambda k: -surfaces[k][0]*surfaces[k][1])[:self.top]:
+            count, size = surfaces[key]
+            previous_count = self.previous_surfaces.get(key, (0, size))[0]
+            lines.append("  {:>12}  {:>5} x {} {}x{} ({:+d})".format(size_text(count*size), count, key[0], key[1], key[2], count - previous_count))
+
+        with open(self.filename, 'a') as file:
+            file.write("\n".join(lines) + "\n")
+
+        self.previous = snapshot
+        self.previous_surfaces = surfaces
+
+def surface_tally(game):
+    '''
+    surface_tally() finds every pygame surface that can be reached from the game's objects and the display
+
+    Parameter (required):
+        game - game object to search from
+
+    Returns:
+        tally - dictionary of (type name, width, height):(number of surfaces, bytes per surface)
+    '''
+
+    tally = {}
+    seen = set()
+    stack = [game, pygame.display.get_surface()]
+
+    # objects that can't hold surfaces and aren't searched (sets are skipped since they only hold wall points)
+    skipped = (int, float, bool, str, bytes, set, frozenset, type, types.ModuleType, types.FunctionType, types.MethodType, types.BuiltinFunctionType)
+
+    while stack:
+        obj = stack.pop()
+        if obj is None or id(obj) in seen or isinstance(obj, skipped):
+            continue
+        seen.add(id(obj))
+
+        # counts the surface using the memory SDL allocated for its pixels (pitch is the number of bytes in each row)
+        if isinstance(obj, pygame.Surface):
+            key = (type(obj).__name__, obj.get_width(), obj.get_height())
+            count, size = tally.get(key, (0, obj.get_pitch()*obj.get_height()))
+            tally[key] = (count + 1, size)
+
+        # searches everything the object refers to (e.g., list items or an object's attributes)
+        stack.extend(gc.get_referents(obj))
+
+    return tally
+
+def size_text(size, sign=False):
+    '''
+    size_text() formats a number of bytes as KiB or MiB
+
+    Parameter (required):
+        size - number of bytes
+
+    Parameter (optional):
+        sign - Boolean representing whether to always show a + or - sign; set to False by default
+
+    Returns:
+        string - formatted size
+    '''
+
+    prefix = "+" if sign and size >= 0 else ""
+    if abs(size) >= 1024*1024:
+        return "{}{:.1f} MiB".format(prefix, size/(1024*1024))
+    return "{}{:.1f} KiB".format(prefix, size/1024)
+
+def line_text(traceback):
+    '''
+    line_text() formats the source line of an allocation
+
+    Parameter (required):
+        traceback - tracemalloc traceback of the allocation
+
+    Returns:
+        string - filename and line number
+    '''
+
+    frame = traceback[0]
+    return "{}:{}".format(frame.filename, frame.lineno)
+
+# profile shared by all files; main.py enables it in memory profiling mode
+memory_profile = MemoryProfile()
@@ -14,9 +14,10 @@ from text import *
 from weapons import *
 
 #accesses csv file that stores the stats of all the weapons
-weapon_stats = pd.read_csv('./stats/weapons.csv')
-weapon_stats.index = weapon_stats["weapons"]
-weapon_stats.drop(columns=["weapons"],inplace=True)
+with startup_profile.step('read stats/weapons.csv ({})'.format(__name__)):
+    weapon_stats = pd.read_csv('./stats/weapons.csv')
+    weapon_stats.index = weapon_stats["weapons"]
+    weapon_stats.drop(columns=["weapons"],inplace=True)
 #data points can be accessed via weapon_stats[category, weapon_nick]
 # for example, weapon_stats["lion"]["sword"] gives the damage the sword does against the lion
 
@@ -57,6 +58,7 @@ class Menu(pygame.surface.Surface):
         
         # initializes a surface that can be transparent
         super().__init__([self.width, self.height], pygame.SRCALPHA)
+        frame_stats.count_surface()  # counts the new surface
         
         # gets all item slides and stats windows
         self.slides = []
@@ -84,20 +86,20 @@ class Menu(pygame.surface.Surface):
         title.place(self, text_color=(0,0,0))
         
         # title boxes for the menu, informing the user where each piece of information is
-        menu_titles = pygame.surface.Surface([self.width-self.padding*2, 40], pygame.SRCALPHA)
+        menu_titles = frame_stats.surface([self.width-self.padding*2, 40], pygame.SRCALPHA)
         text = TextBox(self.padding,0,self.width-self.padding*4,40,text_size=30,text=' #         Item          Name')
         text.place(menu_titles, text_color=(0,0,0))
-        self.blit(menu_titles, [self.padding, 95])
+        frame_stats.blit(self, menu_titles, [self.padding, 95])
         
         # creates the item container below the title and sets its background color (slightly lighter than the main menu color)
-        self.item_surface = pygame.surface.Surface([self.width-self.padding*2, self.height-200])
+        self.item_surface = frame_stats.surface([self.width-self.padding*2, self.height-200])
         self.item_surface.fill((225, 193, 110))
         
         # draws all slides in the item surface
         self.draw_all_items()
         
         # draws the item surface in the menu
-        self.blit(self.item_surface, [self.padding, 130])
+        frame_stats.blit(self, self.item_surface, [self.padding, 130])
         
         # instructional text box at the bottom of the screen
         text = TextBox(self.padding, 130+self.height-200+12, self.width-self.padding*2, 30, text_size=25, text="Click the number key corresponding to a weapon\nto select it", padding=0)
@@ -123,7 +125,7 @@ class Menu(pygame.surface.Surface):
             slide.make()
             
             # adds the slide to the item surface at the x and y locations
-            self.item_surface.blit(slide, [x,y])
+            frame_stats.blit(self.item_surface, slide, [x,y])
             
             # updates the item's x and y values with respect to the pygame window
             slide.x = self.x + self.padding + x
@@ -141,7 +143,7 @@ class Menu(pygame.surface.Surface):
         '''
         
         # draws the menu on the screen
-        screen.blit(self, [self.x, self.y])
+        frame_stats.blit(screen, self, [self.x, self.y])
         
         # draws the sub window corresponding to the clicked on slide in the menu
         if self.selected != None:
@@ -181,6 +183,7 @@ class WeaponSlide(pygame.surface.Surface):
         
         # initializes slide as a surface
         super().__init__([self.width, self.height], pygame.SRCALPHA)
+        frame_stats.count_surface()  # counts the new surface
         
         self.padding = 5  # padding between items in slide
         self.val = val  # number of the slide in the menu
@@ -201,7 +204,7 @@ class WeaponSlide(pygame.surface.Surface):
         num.place(self, text_color=(50, 0, 0))
         
         # draws the image representing the list item
-        self.blit(self.image, [60+self.padding*6, self.padding])
+        frame_stats.blit(self, self.image, [60+self.padding*6, self.padding])
         
         # creates and draws the textbox for the name of the item in the menu
         # formatting includes replacing dashes with spaces in the item nickname
@@ -216,7 +219,7 @@ class WeaponSlide(pygame.surface.Surface):
         if self.displaying_stats:
             # gets and draws the arrow image
             self.stats_btn = loadImage('images/open_stats.png')
-            self.blit(self.stats_btn, [name.x+name.width+self.padding*4, self.padding+20])
+            frame_stats.blit(self, self.stats_btn, [name.x+name.width+self.padding*4, self.padding+20])
     
     def hover(self):
         '''
@@ -280,6 +283,7 @@ class Stats(pygame.surface.Surface):
         
         # initializes window as a surface
         super().__init__([self.width, self.height], pygame.SRCALPHA)
+        frame_stats.count_surface()  # counts the new surface
         
         # x and y coordinates of window
         self.x = x
@@ -335,4 +339,4 @@ class Stats(pygame.surface.Surface):
         text.place(self, background_color=(225, 193, 110), text_color=(50,0,0))
         
         # draws stats window to screen
-        screen.blit(self, [self.x,self.y])
\ No newline at end of file
+        frame_stats.blit(screen, self, [self.x,self.y])
\ No newline at end of file
@@ -0,0 +1,294 @@
+'''
+Names: Spencer Lyudovyk, Amanda Lin, Jue Gong
+Date: 05/09/22
+Project: Labors of Hercules (Choose Your Own Adventure Game)
+File: microbench.py
+Purpose: This file contains microbenchmarks for the collision and touching checks, timed against growing numbers of objects.
+         Run "python microbench.py" to print a table of the results.
+Task Description: Design a school-appropriate game allowing for user interaction/input.
+'''
+
+# imports
+import json, time, random, argparse
+from perf_gate import headless_game
+from main import *
+
+# image shared by all benchmark objects; it is loaded without a pixel mask (see spritesTouching())
+box_image = pygame.Surface((1, 1))
+
+# default numbers of objects in each population
+DEFAULT_SIZES = [10, 100, 1000, 10000, 100000]
+
+class BenchObject:
+    '''
+    The BenchObject() class represents a plain object with a position and size, used to build synthetic populations of background objects.
+    '''
+
+    def __init__(self, x_bg, y_bg, width=60, height=60):
+        '''
+        __init__() initializes a BenchObject
+
+        Parameters (required):
+            x_bg - x coordinate with respect to the background
+            y_bg - y coordinate with respect to the background
+
+        Parameters (optional):
+            width - width of the object; set to 60 by default
+            height - height of the object; set to 60 by default
+        '''
+
+        self.x_bg = x_bg
+        self.y_bg = y_bg
+        self.x = x_bg  # x and y coordinates with respect to the window; set by make_population() once the background position is known
+        self.y = y_bg
+        self.width = width
+        self.height = height
+        self.walk_over = False
+        self.held_item = None  # used by Chest.touching(), which checks the item the other object is holding
+        self.images = [box_image]  # image without a pixel mask, so touching() checks treat the object as a solid box
+        self.frame = 0
+
+
+## Primitives ##
+# each primitive takes the game and returns a function that runs the check once for a single object of the population
+# in_background is True if the population should be placed into the background object list, since the touching() checks search that list
+
+def player_touching(game):
+    '''
+    player_touching() checks the player against a background object
+    '''
+
+    return lambda other: game.player.touching(other, game.screen, monster=False)
+
+def monster_touching(game):
+    '''
+    monster_touching() checks the active monster against a background object
+    '''
+
+    return lambda other: game.active_monster.touching(other, game.screen)
+
+def holdable_touching(game):
+    '''
+    holdable_touching() checks the item the player is holding against a background object
+    '''
+
+    return lambda other: game.player.held_item.touching(other, game.screen)
+
+def holdable_detect_collision(game):
+    '''
+    holdable_detect_collision() checks the item the player is holding against an object using window coordinates
+    '''
+
+    return lambda other: game.player.held_item.detect_collision(other)
+
+def chest_touching(game):
+    '''
+    chest_touching() checks a chest against an object that isn't holding an item
+    '''
+
+    return lambda other: game.chests[0].touching(other, game.screen)
+
+def button_detect_collision(game):
+    '''
+    button_detect_collision() checks the light switch against an object using window coordinates
+    '''
+
+    return lambda other: game.screen.light_switch.detect_collision(other)
+
+def detect_wall_collision(game):
+    '''
+    detect_wall_collision() checks the player against the walls with the player moved to the object's location
+    '''
+
+    screen = game.screen
+
+    def check(other):
+        # uses the object's position as the player's position
+        screen.stagePosX = other.x_bg - other.x_bg%5
+        screen.stagePosY = other.y_bg - other.y_bg%5
+        return screen.detect_wall_collision(game.player)
+
+    return check
+
+def monster_detect_wall_collision(game):
+    '''
+    monster_detect_wall_collision() checks the object against the walls as if it were a monster
+    '''
+
+    return lambda other: game.screen.monster_detect_wall_collision(other)
+
+def item_detect_wall_collision(game):
+    '''
+    item_detect_wall_collision() checks the object against the walls as if it were a held item
+    '''
+
+    return lambda other: game.screen.item_detect_wall_collision(other)
+
+# all primitives by name with whether their population is placed into the background object list
+primitives = {"Player.touching": (player_touching, True),
+              "Monster.touching": (monster_touching, True),
+              "Holdable.touching": (holdable_touching, True),
+              "Holdable.detect_collision": (holdable_detect_collision, False),
+              "Chest.touching": (chest_touching, False),
+              "BackgroundButton.detect_collision": (button_detect_collision, False),
+              "detect_wall_collision": (detect_wall_collision, False),
+              "monster_detect_wall_collision": (monster_detect_wall_collision, False),
+              "item_detect_wall_collision": (item_detect_wall_collision, False)}
+
+
+## Running ##
+
+def make_population(game, size, seed=0):
+    '''
+    make_population() creates a population of objects at random locations in the map
+
+    Parameters (required):
+        game - game whose background the objects are placed in
+        size - number of objects
+
+    Parameter (optional):
+        seed - random seed for the object locations; set to 0 by default
+
+    Returns:
+        population - list of BenchObject objects
+    '''
+
+    rand = random.Random(seed)
+    population = []
+    for i in range(size):
+        obj = BenchObject(rand.randrange(0, game.screen.width), rand.randrange(0, game.screen.height))
+
+        # window coordinates based on the current background position
+        obj.x = obj.x_bg - game.screen.stagePosX
+        obj.y = obj.y_bg - game.screen.stagePosY
+        population.append(obj)
+
+    return population
+
+def time_primitive(game, name, population, max_calls=2000):
+    '''
+    time_primitive() times a primitive against a population of objects
+
+    Parameters (required):
+        game - game that the primitive is run on
+        name - name of primitive in the primitives dictionary
+        population - list of objects to check
+
+    Parameter (optional):
+        max_calls - maximum number of objects checked; large populations are sampled and the full sweep time is estimated; set to 2000 by default
+
+    Returns:
+        tuple - nanoseconds per check and estimated milliseconds to check every object in the population
+    '''
+
+    make_check, in_background = primitives[name]
+    check = make_check(game)
+
+    # objects that are checked; evenly spaced through the population so that list searches are not always short
+    step = max(1, len(population)//max_calls)
+    sample = population[::step][:max_calls]
+
+    # places the population in the background, keeping the original background objects
+    screen = game.screen
+    original = screen.background_obj
+    start_pos = (screen.stagePosX, screen.stagePosY)
+    if in_background:
+        screen.set_objects(original + population)
+
+    # times the sample, repeating small samples so that at least max_calls checks are made, and keeps the fastest round
+    check(sample[0])
+    best = None
+    for i in range(max(1, max_calls//len(sample))):
+        start = time.perf_counter()
+        for obj in sample:
+            check(obj)
+        elapsed = time.perf_counter() - start
+        if best == None or elapsed < best:
+            best = elapsed
+
+    # restores the background
+    screen.set_objects(original)
+    screen.stagePosX, screen.stagePosY = start_pos
+
+    per_call = best/len(sample)
+    return (per_call*1e9, per_call*len(population)*1e3)
+
+def run_benchmarks(names, sizes, seed=0, max_calls=2000):
+    '''
+    run_benchmarks() times each primitive against each population size
+
+    Parameters (required):
+        names - list of primitive names
+        sizes - list of population sizes
+
+    Parameters (optional):
+        seed - random seed for the game and the populations; set to 0 by default
+        max_calls - maximum number of checks timed for each population; set to 2000 by default
+
+    Returns:
+        results - dictionary of primitive name:{population size:(ns per check, ms per sweep)}
+    '''
+
+    game = headless_game(seed)
+
+    # populations are shared by all primitives
+    populations = {}
+    for size in sizes:
+        populations[size] = make_population(game, size, seed)
+
+    results = {}
+    for name in names:
+        results[name] = {}
+        for size in sizes:
+            results[name][size] = time_primitive(game, name, populations[size], max_calls)
+
+    return results
+
+def print_results(results, sizes):
+    '''
+    print_results() prints a table of nanoseconds per check and a table of the estimated time to check a whole population
+
+    Parameters (required):
+        results - dictionary returned by run_benchmarks()
+        sizes - list of population sizes
+    '''
+
+    for title, index, fmt in (("ns per check", 0, "{:>12.0f}"), ("ms per sweep of the whole population", 1, "{:>12.3f}")):
+        print(title)
+        print("{:<36}".format("objects") + "".join("{:>12}".format(size) for size in sizes))
+        for name, timings in results.items():
+            print("{:<36}".format(name) + "".join(fmt.format(timings[size][index]) for size in sizes))
+        print()
+
+def main_bench(args=None):
+    '''
+    main_bench() runs the microbenchmarks from the command line
+
+    Parameter (optional):
+        args - list of command line arguments; by default, set to None (i.e., sys.argv is used)
+    '''
+
+    parser = argparse.ArgumentParser(description="Times the collision and touching checks against growing numbers of objects.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="population sizes")
+    parser.add_argument("--max-calls", type=int, default=2000, help="maximum checks timed per population")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--json", help="also writes the results to this JSON file")
+    parser.add_argument("primitive", nargs="*", help="primitives to time; all primitives by default")
+    args = parser.parse_args(args)
+
+    names = args.primitive or list(primitives)
+    for name in names:
+        if name not in primitives:
+            parser.error("unknown primitive '{}' (choose from {})".format(name, ", ".join(primitives)))
+
+    results = run_benchmarks(names, args.sizes, seed=args.seed, max_calls=args.max_calls)
+    print_results(results, args.sizes)
+
+    if args.json:
+        with open(args.json, 'w') as file:
+            json.dump({name: {str(size): {"ns_per_check": round(t[0], 1), "ms_per_sweep": round(t[1], 3)} for size, t in timings.items()} for name, timings in results.items()}, file, indent=2)
+            file.write('\n')
+
+# runs the microbenchmarks
+if __name__=="__main__":
+    main_bench()
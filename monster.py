@@ -8,46 +8,97 @@ Task Description: Design a school-appropriate game allowing for user interaction
 '''
 
 from player import Player
+from additional_func import spritesTouching
 import pygame, os, sys,random
+import pandas as pd
+from startup_profile import startup_profile
+
+# accesses csv file that stores the behaviour profile of each monster, and compiles it into a dictionary of monster nickname:profile
+# each profile is a tuple of the values in the order of profile_fields, so a monster's whole profile is one lookup
+profile_fields = ("attack_pts", "speed", "move_rate", "attack_delay", "aggro_radius", "ai_tick_rate")
+with startup_profile.step('read stats/monsters.csv'):
+    monster_stats = pd.read_csv('./stats/monsters.csv')
+    monster_profiles = {row.monsters: tuple(getattr(row, field) for field in profile_fields) for row in monster_stats.itertuples()}
+# for example, monster_profiles["lion"] gives (attack_pts, speed, move_rate, attack_delay, aggro_radius, ai_tick_rate) of the lion
 
 class Monster(Player):
     '''
     The Monster() class is a subclass of the Player() class that represents the monsters in the game.
     '''
-    def __init__(self, nick,x_bg, y_bg, attack_pts, speed=5, state=False):
+
+    # x and y direction of each move and the image frame of the monster facing that way
+    steps = {"left": (-1, 0), "right": (1, 0), "up": (0, -1), "down": (0, 1)}
+    move_frames = {"down": 0, "right": 1, "left": 2, "up": 3}
+    backwards = {"left": "right", "right": "left", "up": "down", "down": "up"}
+
+    # number of frames a monster keeps chasing the player after it last saw them
+    chase_memory = 900
+
+    collision_space = "stage"  # a monster's x_bg and y_bg are stage coordinates (see collision.py)
+
+    # attributes of each monster (and their types) in addition to those of Player(); subclasses add none, so no monster has a __dict__
+    __slots__ = (
+        "nick",             # str; monster nickname
+        "x_bg",             # int; x position in stage coordinates
+        "y_bg",             # int; y position in stage coordinates
+        "state",            # Boolean; whether the monster is active
+        "attack_pts",       # int; how much an attack is worth
+        "speed",            # int; number of pixels moved in one move
+        "move_rate",        # float; probability of moving in each AI tick
+        "attack_delay",     # int; number of frames between attacks
+        "aggro_radius",     # int; farthest distance (in pixels) the player is noticed from
+        "ai_tick_rate",     # int; largest number of frames between AI ticks
+        "walk_over",        # Boolean; whether the player can walk over the monster
+        "previous",         # str or None; previous move
+        "collide",          # str or None; direction the monster is colliding with the player in
+        "labyrinth_place",  # int or None; labyrinth cell or room the monster was last in
+        "ai_slot",          # int or None; frame slot of the monster's AI ticks
+        "chase_left",       # int; number of frames the monster will keep chasing the player
+        "n",                # int; attack delay counter
+    )
+
+    def __init__(self, nick,x_bg, y_bg, state=False):
         '''
         __init__() initializes the monster
+        Its behaviour (attack points, speed, move rate, attack delay, aggro radius, and AI tick rate) comes from its profile in stats/monsters.csv
 
         Parameters (required): 
-            nick - monster 'nickname'; used to reference monster and retrieve correct images from the images folder
+            nick - monster 'nickname'; used to reference monster, retrieve correct images from the images folder, and look up its profile
             x_bg - x coordinate with relation to the background
             y_bg - y coordinate with relation to the background
-            attack_pts - how much attack damage the monster does with each attack on the player
 
         Parameters (optional):
-            speed - number of pixels the monster moves each time; by default, set to 5
             state - whether or not the monster is active; by default set to False i.e. inactive
         '''
 
         self.nick = nick            # nickname
         self.x_bg = x_bg            # x position in relation to the entire background
         self.y_bg = y_bg            # y position in relation ot the entire background
-        self.attack_pts = attack_pts  # how much an attack is worth   
-        self.speed = speed          # number of pixels the monster moves in one move
         self.state = state          # whether or not the monster is active (True is active, False is inactive)
+
+        # behaviour profile
+        (self.attack_pts,           # how much an attack is worth
+         self.speed,                # number of pixels the monster moves in one move
+         self.move_rate,            # how often it moves, probability between 0 and 1, inclusive
+         self.attack_delay,         # number of frames between attacks while touching the player
+         self.aggro_radius,         # farthest distance (in pixels) the monster notices the player from
+         self.ai_tick_rate) = monster_profiles[nick]  # largest number of frames between AI ticks when far from the player (see ai_scheduler.py)
         
-        self.frame = 1              # direction the monster is facing (with a different image associate with each direction)
         self.walk_over = False      # whether the player can walk over the monster
-        self.move_rate = 0.75       # how often it moves, probability between 0 and 1, inclusive
 
         self.previous = None        # the previous move (string "left","right","up","down")
                                     # used so there is a bias for moving in the same direction
         self.collide = None         # direction that the monster is colliding with the player in 
                                     # string: ("left", "right","up","down") or None
+        self.labyrinth_place = None # labyrinth cell or room the monster was last in (see labyrinth.py)
+        self.ai_slot = None         # frame slot that staggers the monster's AI ticks (see ai_scheduler.py)
+        self.chase_left = 0         # number of frames the monster will keep chasing the player; it patrols the labyrinth when this reaches 0
 
         # intializes parent class Player
         super().__init__(self.nick) # the image files should be namd the same as the nickname
         
+        self.frame = 1              # direction the monster is facing (with a different image associate with each direction)
+        
         # attack delay counter
         self.n = 0
 
@@ -64,6 +115,20 @@ class Monster(Player):
         '''
 
         vector = [background.stagePosX - self.x_bg, background.stagePosY - self.y_bg] # vector between monster and player
+        
+        # monsters far from the player only run their AI every few frames, and then make that many frames of moves at once
+        # monsters that haven't seen the player lately patrol the labyrinth instead of chasing them
+        steps = game.ai_scheduler.steps(self, vector)
+        chasing = steps > 0 and self.sees_player(background, steps)
+        if steps != 1 or not chasing:
+            if steps > 0 and random.random() < self.move_rate:
+                if chasing:
+                    self.chase_step(background, background.stagePosX, background.stagePosY, steps)
+                else:
+                    self.patrol(background, steps)
+            self.place(background)      # draw monster
+            return
+        
         vector_dir = [-1 if vector[0]<0 else 1, -1 if vector[1]<0 else 1] # defines the direction of the vector: -1 is up or left, 1 is down or right
         
         x_dir = (8000-abs(vector[0]))/8000    # probability of going towards the monster in x direction
@@ -109,13 +174,7 @@ class Monster(Player):
         # checks whether the monster is touching player and updates self.collide (direction of collission)
         self.touching(player,background)
         
-        # checks whether the monster is colliding with a background object
-        bg_collision = False
-        for obj in background.background_obj:
-            if self.touching(obj, background):
-                bg_collision = True
-        
-        if background.monster_detect_wall_collision(self) or bg_collision:  # if collide with wall or background object
+        if background.monster_detect_wall_collision(self):  # if collide with wall
             if self.touching(player,background):       # and if touching player
                 pass            # do not move
 
@@ -138,148 +197,217 @@ class Monster(Player):
         else:       # if not touching player or wall or background object
             self.speed == 5         
 
+            # direction along the labyrinth route to the player; None if the player is in the same cell or room or can't be reached
+            route_move = self.route_move(background)
+
             # if the random number is less than the move_rate, the monster will move
             # this allows the rate of movement of the monster to be changed without adjusting speed
             # chance of movement based on probability
-            if random_num_1 < self.move_rate:       
+            if random_num_1 < self.move_rate and route_move != None:
+                # follows the route to the player's cell or room
+                self.move(background,route_move,direction)
 
+            elif random_num_1 < self.move_rate:
+                # steers towards the player inside the same cell or room
                 # uses probabilities to calculate thresholds by normalizing probabilities
                 threshold = [direction[0]/sum, (direction[0]+direction[1])/sum, (direction[0]+direction[1]+direction[2])/sum, (direction[0]+direction[1]+direction[2]+direction[3])/sum,1] #[prob of going left, prob of going right, prob of going up, prob of going down]
 
                 # uses random number to determine which direction to move in, depending on threshold probabilities
                 if random_num_2 < threshold[0]:           # go left
-                    self.move_left(background,direction)
+                    self.move(background,"left",direction)
                 elif random_num_2 < threshold[1]:         # go right
-                    self.move_right(background,direction)
+                    self.move(background,"right",direction)
                 elif random_num_2 < threshold[2]:         # go up
-                    self.move_up(background,direction)
+                    self.move(background,"up",direction)
                 elif random_num_2 < threshold[3]:         # go down
-                    self.move_down(background,direction)
+                    self.move(background,"down",direction)
 
                 else:   # random_num_2 < 1 (all other cases)
                     # go in whatever direction you were going before
-                    if self.previous == "left":         # go left
-                        self.move_left(background,direction)
-                    elif self.previous == "right":      # go right
-                        self.move_right(background,direction)
-                    elif self.previous == "up":         # go up
-                        self.move_up(background,direction)
-                    elif self.previous == "down":       # go down
-                        self.move_down(background,direction)
+                    if self.previous != None:
+                        self.move(background,self.previous,direction)
             else:   # if the monster does not move in this frame (to slow the monster down relative to the sprite)
                 pass
         
         self.attack(background,player,game) # attacks the player by doing damage to it
     
-    def move_left(self,background,direction):            
+    def route_move(self, background):
         '''
-        move_left() moves the monster to the left according to the speed and changes image frame
+        route_move() finds the direction the monster should move to follow the labyrinth's flow field to the player
+        The monster first lines up with the opening or door to the next cell or room, then moves through it
 
         Parameters (required):
             background - game background object that the monster is located on
-            direction - list of direction probabilities, generated in the track_player function
+
+        Returns:
+            string - direction to move ("left","right","up","down"); None if the player is in the same cell or room or can't be reached
         '''
 
-        self.x_bg -= self.speed         # move to the left
-        self.frame = 2                  # change frame
-        self.previous = "left"
+        labyrinth = background.labyrinth
 
-        # if the movement causes the monster to collide with the wall
-        if background.monster_detect_wall_collision(self):
-            self.x_bg += self.speed       # return to original position (by moving right)
+        # center of the monster
+        x = self.x_bg + self.width//2
+        y = self.y_bg + self.height//2
 
-            try:        # try if the sum of the y direction probabilites are not equal to 0
-                # move up if a random number is under the probability for moving up 
-                # else move down
-                self.move_up(background,direction) if random.random() < (direction[2]/(direction[2]+direction[3])) else self.move_down(background,direction)
-            
-            except:     # if there is a divide by 0 error
-                # move up if random number < 0.5
-                # else move down
-                self.move_up(background,direction) if random.random() < 0.5 else self.move_down(background,direction)
+        # cell or room of the monster; keeps the last one if the monster is in the wall between a room and the grid
+        place = labyrinth.place_at(x, y)
+        if place != None:
+            self.labyrinth_place = place
+
+        # opening to the next cell or room towards the player, from the flow field shared by all monsters (see Game.place_player())
+        step = labyrinth.flow_step(self.labyrinth_place)
+        if step == None:
+            return None
+        (neighbor, door, portal_x, portal_y, move) = step
 
+        # lines up with the opening, then moves through it
+        if move in ("left", "right") and abs(y - portal_y) > self.speed:
+            return "up" if y > portal_y else "down"
+        if move in ("up", "down") and abs(x - portal_x) > self.speed:
+            return "left" if x > portal_x else "right"
+        return move
 
-    def move_right(self,background,direction):       
+    def sees_player(self, background, frames=1):
         '''
-        move_right() moves the monster to the right according to the speed and changes image frame
+        sees_player() checks whether the monster can see the player through the labyrinth within its aggro radius, or saw them recently enough to keep chasing them
 
         Parameters (required):
             background - game background object that the monster is located on
-            direction - list of direction probabilities, generated in the track_player function
+
+        Parameters (optional):
+            frames - number of frames since the monster last checked; set to 1 by default
+
+        Returns:
+            Boolean - True if the monster should chase the player; False if it should patrol
         '''
 
-        self.x_bg += self.speed         # move to the right
-        self.frame = 1                  # change frame
-        self.previous = "right"
+        x = self.x_bg + self.width//2
+        y = self.y_bg + self.height//2
 
-        # if movement causes monster to collide with the wall
-        if background.monster_detect_wall_collision(self):
-            self.x_bg -= self.speed        # return to the original position (by moving left)
+        # notices the player if they are close enough and in sight
+        if (x - background.stagePosX)**2 + (y - background.stagePosY)**2 <= self.aggro_radius**2 and background.line_of_sight(x, y, background.stagePosX, background.stagePosY):
+            self.chase_left = self.chase_memory
+        else:
+            self.chase_left = max(0, self.chase_left - frames)
+        return self.chase_left > 0
 
-            try:    # try if the sum of the y direction probabilites are not equal to 0
-                # move up if a random number is under the probability for moving up 
-                # else move down
-                self.move_up(background,direction) if random.random() < (direction[2]/(direction[2]+direction[3])) else self.move_down(background,direction)
-            
-            except: # if there is a divide by 0 error
-                # move up if random number < 0.5
-                # else move down
-                self.move_up(background,direction) if random.random() < 0.5 else self.move_down(background,direction)
-            
-    
-    def move_up(self,background,direction):           
+    def patrol(self, background, steps=1):
         '''
-        move_up() moves the monster up according to the speed and changes image frame
+        patrol() walks the monster around the labyrinth while it isn't chasing the player
+        The monster keeps going the same way until it gets close to a wall, then turns the way with the most room (only turning back if there is no other way)
 
         Parameters (required):
             background - game background object that the monster is located on
-            direction - list of direction probabilities, generated in the track_player function
+
+        Parameters (optional):
+            steps - number of steps to make at once; set to 1 by default
         '''
-        self.y_bg -= self.speed     # move up
-        self.frame = 3              # change frame
-        self.previous = "up"
 
-        # if movement causes monster to collide with the wall
-        if background.monster_detect_wall_collision(self):
-            self.y_bg += self.speed         # return to the original position (by moving down)
-            
-            try:    # try if the sum of the x direction probabilites are not equal to 0
-                # move left if a random number is under the probability for moving left 
-                # else move right
-                self.move_left(background,direction) if random.random() < (direction[0]/(direction[0]+direction[1])) else self.move_right(background,direction)
-            except:     # if there is a divide by 0 error
-                # move left if random number < 0.5
-                # else move right
-                self.move_left(background,direction) if random.random() < 0.5 else self.move_right(background,direction)
+        x = self.x_bg + self.width//2
+        y = self.y_bg + self.height//2
+        move = self.previous if self.previous != None else random.choice(list(self.steps))
+
+        # room each move needs in front of the monster's center
+        needed = {"left": self.width//2, "right": self.width//2, "up": self.height//2, "down": self.height//2}
+        distance = self.speed*steps
+
+        # turns if a wall is close, using rays cast through the grid (monsters in rooms just turn when they reach the walls)
+        room = background.raycast(x, y, move)
+        if room != None and room < needed[move] + distance:
+            move = self.backwards[move]
+            turns = [option for option in self.steps if option != move and option != self.previous]
+            random.shuffle(turns)   # breaks ties between turns with the same room at random
+            best = max(turns, key=lambda option: background.raycast(x, y, option) - needed[option])
+            if background.raycast(x, y, best) >= needed[best] + distance:
+                move = best
+
+        self.move(background, move, [0,0,0,0], steps)
+
+    def chase_step(self, background, target_x, target_y, steps=1):
+        '''
+        chase_step() moves the monster towards the player, following the labyrinth's flow field when the player is in a different cell or room
+        It skips the checks for touching the player and background objects, so it is used for monsters that are far from the player or in horde mode
+
+        Parameters (required):
+            background - game background object that the monster is located on
+            target_x - x coordinate of the center of the player with respect to the stage
+            target_y - y coordinate of the center of the player with respect to the stage
+
+        Parameters (optional):
+            steps - number of steps to make at once; fewer are made if the monster would pass the opening it is lining up with or the player; set to 1 by default
+        '''
+
+        x = self.x_bg + self.width//2
+        y = self.y_bg + self.height//2
+
+        # which way the player is, used to choose which side to turn to at walls
+        direction = [x > target_x, x < target_x, y > target_y, y < target_y]
 
+        # follows the flow field, or heads straight for the player along the farther axis in the same cell or room
+        move = self.route_move(background)
+        if move == None:
+            if abs(target_x - x) >= abs(target_y - y):
+                move = "left" if target_x < x else "right"
+            else:
+                move = "up" if target_y < y else "down"
+            stop = (target_x, target_y)     # doesn't step past the player
+        else:
+            (neighbor, door, portal_x, portal_y, through) = background.labyrinth.flow_step(self.labyrinth_place)
+            stop = None if move == through else (portal_x, portal_y)   # doesn't step past the opening it is lining up with
+
+        # cuts the steps short so the monster stops at the player or the opening
+        if steps > 1 and stop != None:
+            ahead = abs(stop[0] - x) if move in ("left", "right") else abs(stop[1] - y)
+            steps = max(1, min(steps, ahead//self.speed))
+
+        self.move(background, move, direction, steps)
 
-    def move_down(self,background,direction):       
+    def move(self, background, move, direction, steps=1):
         '''
-        move_down() moves the monster down according to the speed and changes image frame
+        move() moves the monster one step in a direction and changes image frame
+        If a wall is in the way, the monster turns to one of the sides instead (picked using the direction probabilities), or turns back if both sides are blocked
+        All of the moves are checked against the background's mask of free moves at once, so each move takes a small, fixed amount of work
 
         Parameters (required):
             background - game background object that the monster is located on
+            move - direction to move ("left","right","up","down")
             direction - list of direction probabilities, generated in the track_player function
+
+        Parameters (optional):
+            steps - number of steps to make at once in the direction; only one step is made if the way isn't clear that far; set to 1 by default
         '''
 
-        self.y_bg += self.speed         # move down
-        self.frame = 0                  # change frame
-        self.previous = "down"
+        # steps made at once are never longer than a wall is thick, so the monster can't pass through a wall
+        steps = min(steps, (background.labyrinth.wall - 1)//self.speed)
+        distance = self.speed*max(steps, 1)
 
-        # if movement causes monster to collide with the wall
-        if background.monster_detect_wall_collision(self):
-            self.y_bg -= self.speed       # return to the original position (by moving up)
-            
-            try:    # try if the sum of the x direction probabilites are not equal to 0
-                # move left if a random number is under the probability for moving left 
-                # else move right
-                self.move_left(background,direction) if random.random() < (direction[0]/(direction[0]+direction[1])) else self.move_right(background,direction)
-            
-            except:     # if there is a divide by 0 error
-                # move left if random number < 0.5
-                # else move right
-                self.move_left(background,direction) if random.random() < 0.5 else self.move_right(background,direction)
+        # moves that aren't blocked by a wall from the monster's position
+        free = background.monster_free_moves(self, distance)
+        if distance > self.speed and not free & background.move_bits[move]:
+            distance = self.speed
+            free = background.monster_free_moves(self, distance)
 
+        # sides to turn to if the move is blocked; the side the player is more likely to be on is tried first
+        if move in ("left", "right"):
+            total = direction[2] + direction[3]
+            first = direction[2]/total if total > 0 else 0.5     # probability of trying up first
+            sides = ("up", "down") if random.random() < first else ("down", "up")
+            back = "right" if move == "left" else "left"
+        else:
+            total = direction[0] + direction[1]
+            first = direction[0]/total if total > 0 else 0.5     # probability of trying left first
+            sides = ("left", "right") if random.random() < first else ("right", "left")
+            back = "down" if move == "up" else "up"
+
+        # makes the first move that isn't blocked
+        for option in (move, sides[0], sides[1], back):
+            if free & background.move_bits[option]:
+                (dx, dy) = self.steps[option]
+                self.x_bg += dx*distance
+                self.y_bg += dy*distance
+                self.frame = self.move_frames[option]      # change frame
+                self.previous = option
+                return
 
     def place(self,background,extend=False):
         '''
@@ -303,6 +431,38 @@ class Monster(Player):
         # calls parent class place function to draw the monster
         super().place(background,self.frame)
 
+    def sprites(self, background, extend=False):
+        '''
+        sprites() retrieves the surfaces that draw the monster, so that many monsters can be drawn with one batched blit (see horde.py)
+
+        Parameters (required):
+            background - game background object the monster is located on
+
+        Parameters (optional):
+            extend - whether or not the monster is in attack mode; by default, set to False i.e. not attacking
+
+        Returns:
+            list - (surface, (x, y)) pairs to be drawn in order
+        '''
+
+        # calculates x and y positions the same way as place()
+        self.x = self.x_bg - (background.stagePosX - 500)
+        self.y = self.y_bg - (background.stagePosY - 400)
+        if extend:
+            self.extend()
+
+        return self.frame_sprites(self.frame)
+
+    def struck(self, game):
+        '''
+        struck() is called when the player's weapon hurts the monster without killing it; most monsters do nothing more
+
+        Parameter (required):
+            game - game object that encompasses the whole game
+        '''
+
+        pass
+
     def extend(self):
         '''
         extend() moves the monster forward by 10 pixels to show the monster is attacking the player
@@ -316,7 +476,7 @@ class Monster(Player):
         elif self.frame == 3:   # if moving up
             self.y -= 10
 
-    def touching(self,other,background,tolerance = 0):
+    def touching(self,other,background,tolerance = 0,exact=False):
         '''
         touching() checks whether the monster is touching a particular object
 
@@ -327,13 +487,15 @@ class Monster(Player):
         Parameters (optional):
             tolerance - how much leeway there is between whether the monster is actually touching the object or not;
                         by default, set to 0
+            exact - whether the monster's and the player's pixels must touch (checked only after their boxes do; see spritesTouching());
+                    by default, set to False i.e. their boxes touching is enough (as for attacks)
 
         Returns:
             Boolean - True if touching the other object; False if not
 
         '''
 
-        if other in background.door_list:  # if it's a door
+        if background.is_door(other):  # if it's a door
 
             # calculates the x and y coordinates in relation to the screen
             x1 = self.x_bg + 505
@@ -357,7 +519,7 @@ class Monster(Player):
                     return True
             return False
 
-        elif other in background.background_obj and other != self:  # if it's a plant or another object in background_obj list
+        elif background.in_background(other) and other != self:  # if it's a plant or another object in background_obj list
             pass    
 
         # tolerance is used because otherwise the player keeps getting stuck on the monster
@@ -374,6 +536,10 @@ class Monster(Player):
             if (x2 >= (x1 + tolerance) and x2 <= (x1 + self.width - tolerance)) or (x1 >= (x2 + tolerance) and x1 <= (x2 + other.width - tolerance)):
                 if (y2 >= (y1 + tolerance) and y2 <= (y1 + self.height -tolerance)) or (y1 >= (y2 + tolerance) and y1 <= (y2 + other.height -tolerance)):
                     
+                    # the boxes are touching, but the transparent parts of the images may be all that overlap
+                    if exact and not spritesTouching(self.images[self.frame], x1, y1, other.images[other.frame], x2, y2):
+                        return False
+                    
                     # checks to see which side the monster is colliding with the player on
                     if x1 >= (x2 + other.width - abs(tolerance)) and x1 <= (x2 + other.width + abs(tolerance)):
                         self.collide= "left"       #the player is to the left of the monster
@@ -399,9 +565,9 @@ class Monster(Player):
         '''
 
         # if the player is not attacking the monster and the monster is touching the player and is colliding with the player in the same direction it is traveling in
-        if (player.held_item == None or not game.extend or player.held_item.nick == 'key' or not player.held_item.touching(self, game.screen)) and (self.touching(player,background,-15) and self.previous == self.collide and self.previous != None and not game.extend):
+        if (player.held_item == None or not game.extend or player.held_item.nick == 'key' or not game.contacts.touching(player.held_item, self)) and (self.touching(player,background,-15) and self.previous == self.collide and self.previous != None and not game.extend):
             self.n += 1     # attack delay
-            if self.n == 50:
+            if self.n >= self.attack_delay:
                 self.place(background,extend=True)      # draw monster with extend=True (attack mode)
                 player.decrease_health(self.attack_pts)     # decrease player mode
                 self.n = 0      # reset attack delay
@@ -414,6 +580,9 @@ class Lion(Monster):
     '''
     The Lion() class is a subclass of the Monster() class that represents the lion monster
     '''
+
+    __slots__ = ()  # no attributes other than those of Monster()
+
     def __init__(self,x_bg, y_bg):
         '''
         __init__ initializes lion monsters
@@ -423,13 +592,16 @@ class Lion(Monster):
             y_bg - y coordinate with relation to the background
         '''
 
-        # intiates Monster parent class with nickname "lion" and attack_pts 5
-        super().__init__("lion",x_bg, y_bg, 5)
+        # intiates Monster parent class with nickname "lion" (its profile in stats/monsters.csv sets its attack_pts)
+        super().__init__("lion",x_bg, y_bg)
 
 class Cerberus(Monster):
     '''
     The Cerberus() class is a subclass of the Monster() class that represents the cerberus monster
     '''
+
+    __slots__ = ()  # no attributes other than those of Monster()
+
     def __init__(self,x_bg, y_bg):
         '''
         __init__ initializes cerberus monsters
@@ -439,13 +611,22 @@ class Cerberus(Monster):
             y_bg - y coordinate with relation to the background
         '''
 
-        # intiates Monster parent class with nickname "cerberus" and attack_pts 6
-        super().__init__("cerberus",x_bg, y_bg, 6)
+        # intiates Monster parent class with nickname "cerberus" (its profile in stats/monsters.csv sets its attack_pts)
+        super().__init__("cerberus",x_bg, y_bg)
 
 class Hydra(Monster):
     '''
     The Hydra() class is a subclass of the Monster() class that represents the hydra monster
+    Each time the player's weapon hurts the hydra, new heads split off from it and chase the player (see Hydra_Head)
     '''
+
+    __slots__ = ()  # no attributes other than those of Monster()
+
+    heads_per_strike = 2    # number of heads that split off each time the hydra is hurt
+
+    # x and y offsets from the hydra that new heads are placed at, tried in order (on the 5 pixel movement grid)
+    head_offsets = ((0, -160), (160, 0), (0, 160), (-160, 0), (115, -115), (115, 115), (-115, 115), (-115, -115))
+
     def __init__(self,x_bg, y_bg):
         '''
         __init__ initializes hydra monsters
@@ -455,13 +636,69 @@ class Hydra(Monster):
             y_bg - y coordinate with relation to the background
         '''
 
-        # intiates Monster parent class with nickname "hydra" and attack_pts 7
-        super().__init__("hydra",x_bg, y_bg, 7)
+        # intiates Monster parent class with nickname "hydra" (its profile in stats/monsters.csv sets its attack_pts)
+        super().__init__("hydra",x_bg, y_bg)
+
+    def struck(self, game):
+        '''
+        struck() splits new heads off the hydra when the player's weapon hurts it
+        The heads come from the game's pool of hydra heads, so no monsters or images are created during the fight; no heads split off once the pool runs out
+
+        Parameter (required):
+            game - game object that encompasses the whole game
+        '''
+
+        # starts at the offset after the last head placed, so heads from each strike go around the hydra instead of on top of each other
+        background = game.screen
+        first = len(game.hydra_heads)
+        spawned = 0
+        for i in range(len(self.head_offsets)):
+            if spawned == self.heads_per_strike:
+                break
+            (dx, dy) = self.head_offsets[(first + i)%len(self.head_offsets)]
+
+            # heads are the same size as the hydra, so the hydra's own box shifted by the offset is checked against the walls
+            if background.monster_detect_wall_collision(self, dx, dy):
+                continue
+
+            head = game.hydra_heads.pool.spawn(self.x_bg + dx, self.y_bg + dy)
+            if head == None:
+                break
+            head.frame = self.frame
+            game.hydra_heads.add(head)
+            spawned += 1
+
+class Hydra_Head(Hydra):
+    '''
+    The Hydra_Head() class is a subclass of the Hydra() class that represents a head that split off a hydra
+    Heads look and attack like the hydra, but they are weaker and don't split again
+    '''
+
+    __slots__ = ()  # no attributes other than those of Monster()
+
+    heads_per_strike = 0    # heads don't split
+
+    def __init__(self,x_bg, y_bg):
+        '''
+        __init__ initializes hydra heads
+
+        Parameters (required):
+            x_bg - x coordinate with relation to the background
+            y_bg - y coordinate with relation to the background
+        '''
+
+        # intiates Hydra parent class, which shares its images and profile
+        super().__init__(x_bg, y_bg)
+        self.health = 20    # heads start with less health than the hydra
+        self.state = True   # heads always chase the player
 
 class Golden_Deer(Monster):
     '''
     The Golden_Deer() class is a subclass of the Monster() class that represents the golden deer monster
     '''
+
+    __slots__ = ()  # no attributes other than those of Monster()
+
     def __init__(self,x_bg, y_bg):
         '''
         __init__ initializes golden deer monsters
@@ -471,13 +708,16 @@ class Golden_Deer(Monster):
             y_bg - y coordinate with relation to the background
         '''
 
-        # intiates Monster parent class with nickname "golden_deer" and attack_pts 8
-        super().__init__("golden_deer",x_bg, y_bg, 8)
+        # intiates Monster parent class with nickname "golden_deer" (its profile in stats/monsters.csv sets its attack_pts)
+        super().__init__("golden_deer",x_bg, y_bg)
 
 class Cattle(Monster):
     '''
     The Cattle() class is a subclass of the Monster() class that represents the cattle monster
     '''
+
+    __slots__ = ()  # no attributes other than those of Monster()
+
     def __init__(self,x_bg, y_bg):
         '''
         __init__ initializes cattle monsters
@@ -487,13 +727,16 @@ class Cattle(Monster):
             y_bg - y coordinate with relation to the background
         '''
 
-        # intiates Monster parent class with nickname "cattle" and attack_pts 9
-        super().__init__("cattle",x_bg, y_bg, 9)
+        # intiates Monster parent class with nickname "cattle" (its profile in stats/monsters.csv sets its attack_pts)
+        super().__init__("cattle",x_bg, y_bg)
 
 class Boar(Monster):
     '''
     The Boar() class is a subclass of the Monster() class that represents the boar monster
     '''
+
+    __slots__ = ()  # no attributes other than those of Monster()
+
     def __init__(self,x_bg, y_bg):
         '''
         __init__ initializes boar monsters
@@ -503,5 +746,5 @@ class Boar(Monster):
             y_bg - y coordinate with relation to the background
         '''
 
-        # intiates Monster parent class with nickname "boar" and attack_pts 10
-        super().__init__("boar",x_bg, y_bg, 10)
\ No newline at end of file
+        # intiates Monster parent class with nickname "boar" (its profile in stats/monsters.csv sets its attack_pts)
+        super().__init__("boar",x_bg, y_bg)
\ No newline at end of file
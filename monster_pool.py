@@ -0,0 +1,83 @@
+'''
+Names: Spencer Lyudovyk, Amanda Lin, Jue Gong
+Date: 05/09/22
+Project: Labors of Hercules (Choose Your Own Adventure Game)
+File: monster_pool.py
+Purpose: This file contains the MonsterPool class that creates monsters ahead of time and reuses them, so that monsters can appear and disappear in the middle of a fight without loading images or creating surfaces.
+Task Description: Design a school-appropriate game allowing for user interaction/input.
+'''
+
+# imports
+from scheduler import scheduler
+
+class MonsterPool:
+    '''
+    The MonsterPool() class keeps a fixed number of monsters of one type that are handed out by spawn() and given back by despawn().
+    All monsters in the pool are created when the pool is, and they share their images (see Player.__init__()), so spawning a monster only resets its state.
+    '''
+
+    def __init__(self, monster_type, size):
+        '''
+        __init__() creates all of the pool's monsters
+
+        Parameters (required):
+            monster_type - monster class the pool's monsters are made from (e.g., Hydra_Head)
+            size - number of monsters in the pool; the largest number that can be spawned at once
+        '''
+
+        self.monsters = [monster_type(0, 0) for i in range(size)]  # every monster in the pool
+        self.free = list(reversed(self.monsters))  # monsters that can be spawned, with the next one to be spawned last
+        self.health = self.monsters[0].health if size > 0 else 100  # health each monster is spawned with
+
+    def __len__(self):
+        '''
+        __len__() retrieves the number of monsters that are currently spawned
+
+        Returns:
+            int - number of spawned monsters
+        '''
+
+        return len(self.monsters) - len(self.free)
+
+    def spawn(self, x_bg, y_bg):
+        '''
+        spawn() takes a monster out of the pool and resets it
+
+        Parameters (required):
+            x_bg - x coordinate of the monster with relation to the background
+            y_bg - y coordinate of the monster with relation to the background
+
+        Returns:
+            monster - spawned monster object; None if all of the pool's monsters are already spawned
+        '''
+
+        if not self.free:
+            return None
+
+        monster = self.free.pop()
+        monster.x_bg = x_bg
+        monster.y_bg = y_bg
+        monster.state = True
+        monster.health = self.health
+
+        # forgets everything from the last time the monster was spawned
+        monster.frame = 1
+        monster.previous = None
+        monster.collide = None
+        monster.labyrinth_place = None
+        monster.chase_left = 0
+        monster.n = 0
+        monster.hit = False
+        scheduler.cancel(monster.hit_timer)
+        return monster
+
+    def despawn(self, monster):
+        '''
+        despawn() puts a spawned monster back into the pool
+
+        Parameter (required):
+            monster - monster object that was spawned from this pool
+        '''
+
+        monster.state = False
+        self.free.append(monster)
@@ -0,0 +1,414 @@
+'''
+Names: Spencer Lyudovyk, Amanda Lin, Jue Gong
+Date: 05/09/22
+Project: Labors of Hercules (Choose Your Own Adventure Game)
+File: monster_table.py
+Purpose: This file contains the MonsterTable class that stores many monsters as NumPy columns so that they can all be updated at once (used by horde mode).
+Task Description: Design a school-appropriate game allowing for user interaction/input.
+'''
+
+# imports
+import numpy as np
+from monster import Monster
+
+# moves in the order of their numbers in the table, with the x and y direction and the image frame of each
+MOVES = ("left", "right", "up", "down")
+DX = np.array([Monster.steps[move][0] for move in MOVES])
+DY = np.array([Monster.steps[move][1] for move in MOVES])
+FRAMES = np.array([Monster.move_frames[move] for move in MOVES])
+
+class MonsterTable:
+    '''
+    The MonsterTable() class stores the state of many monsters as NumPy columns, with one row for each monster.
+    Distances to the player, attack timers, AI ticks, and moves (checked against a grid of the wall points) are computed for all monsters with a few array operations.
+    The Monster objects are kept as thin views: view() only copies a monster's row into its object when the monster is drawn or hit.
+    '''
+
+    # names of the columns
+    columns = ("x", "y", "width", "height", "speed", "frame", "previous", "collide", "n", "health", "attack_pts", "attack_delay", "move_rate", "ai_tick_rate", "place", "slot")
+
+    def __init__(self, monsters, scheduler):
+        '''
+        __init__() creates a table from monster objects
+
+        Parameters (required):
+            monsters - list of monster objects
+            scheduler - AIScheduler object that gives each monster a slot for its AI ticks (see ai_scheduler.py)
+        '''
+
+        self.monsters = list(monsters)  # monster objects, in the same order as the rows
+
+        # columns copied from the monsters; moves are stored as their numbers in MOVES (-1 for None)
+        self.x = np.array([monster.x_bg for monster in monsters], dtype=np.int64)  # x position with respect to the stage
+        self.y = np.array([monster.y_bg for monster in monsters], dtype=np.int64)  # y position with respect to the stage
+        self.width = np.array([monster.width for monster in monsters], dtype=np.int64)
+        self.height = np.array([monster.height for monster in monsters], dtype=np.int64)
+        self.speed = np.array([monster.speed for monster in monsters], dtype=np.int64)
+        self.frame = np.array([monster.frame for monster in monsters], dtype=np.int64)
+        self.previous = np.array([move_number(monster.previous) for monster in monsters], dtype=np.int64)
+        self.collide = np.array([move_number(monster.collide) for monster in monsters], dtype=np.int64)
+        self.n = np.array([monster.n for monster in monsters], dtype=np.int64)  # attack delay counter
+        self.health = np.array([monster.health for monster in monsters], dtype=np.float64)
+        self.attack_pts = np.array([monster.attack_pts for monster in monsters], dtype=np.int64)
+        self.attack_delay = np.array([monster.attack_delay for monster in monsters], dtype=np.int64)
+        self.move_rate = np.array([monster.move_rate for monster in monsters], dtype=np.float64)
+        self.ai_tick_rate = np.array([monster.ai_tick_rate for monster in monsters], dtype=np.int64)
+        self.place = np.array([-1 if monster.labyrinth_place == None else monster.labyrinth_place for monster in monsters], dtype=np.int64)
+
+        # gives each monster its own slot for its AI ticks
+        self.slot = np.arange(scheduler.next_slot, scheduler.next_slot + len(self.monsters), dtype=np.int64)
+        scheduler.next_slot += len(self.monsters)
+        for (monster, slot) in zip(self.monsters, self.slot):
+            monster.ai_slot = int(slot)
+
+        # grid of wall points (one entry for every 5 pixels), made from the background's wall_list
+        self.walls = None
+        self.walls_key = None  # (number of wall changes, number of wall points) the grid was made from
+        self.walls_left = 0  # x coordinate of the grid's first column
+        self.walls_top = 0  # y coordinate of the grid's first row
+
+        # flow field towards the player as columns: move out of each place (-1 for none) and the x and y coordinates of the opening
+        self.flow = None  # flow field list the columns were made from
+        self.flow_move = None
+        self.flow_x = None
+        self.flow_y = None
+
+    def __len__(self):
+        '''
+        __len__() retrieves the number of monsters in the table
+
+        Returns:
+            int - number of rows
+        '''
+
+        return len(self.monsters)
+
+    def view(self, i):
+        '''
+        view() copies a row of the table into its monster object
+
+        Parameter (required):
+            i - row number
+
+        Returns:
+            monster - monster object of the row
+        '''
+
+        monster = self.monsters[i]
+        monster.x_bg = int(self.x[i])
+        monster.y_bg = int(self.y[i])
+        monster.speed = int(self.speed[i])
+        monster.frame = int(self.frame[i])
+        monster.previous = MOVES[self.previous[i]] if self.previous[i] >= 0 else None
+        monster.collide = MOVES[self.collide[i]] if self.collide[i] >= 0 else None
+        monster.n = int(self.n[i])
+        monster.health = float(self.health[i])
+        monster.labyrinth_place = int(self.place[i]) if self.place[i] >= 0 else None
+        return monster
+
+    def remove(self, keep):
+        '''
+        remove() removes rows from the table
+
+        Parameter (required):
+            keep - Boolean array that is True for each row to keep
+        '''
+
+        self.monsters = [monster for (monster, kept) in zip(self.monsters, keep) if kept]
+        for name in self.columns:
+            setattr(self, name, getattr(self, name)[keep])
+
+    def add(self, monsters, scheduler):
+        '''
+        add() adds rows for more monsters to the end of the table; the wall grid and flow field columns are kept
+
+        Parameters (required):
+            monsters - list of monster objects
+            scheduler - AIScheduler object that gives each monster a slot for its AI ticks (see ai_scheduler.py)
+        '''
+
+        rows = MonsterTable(monsters, scheduler)
+        self.monsters = self.monsters + rows.monsters
+        for name in self.columns:
+            setattr(self, name, np.concatenate((getattr(self, name), getattr(rows, name))))
+
+    def distances(self, background):
+        '''
+        distances() finds the vector from each monster to the player (the same vector as Monster.track_player())
+
+        Parameter (required):
+            background - game background object that the monsters are located on
+
+        Returns:
+            tuple - arrays of the x and y distances
+        '''
+
+        return (background.stagePosX - self.x, background.stagePosY - self.y)
+
+    def touching_player(self, background, player):
+        '''
+        touching_player() checks which monsters' boxes overlap the player, and saves which side the player is on in the collide column
+
+        Parameters (required):
+            background - game background object that the monsters are located on
+            player - player object
+
+        Returns:
+            array - Boolean array that is True for each monster touching the player
+        '''
+
+        # player's box in the same coordinates as the monsters
+        left = background.stagePosX - 500 + player.x
+        top = background.stagePosY - 400 + player.y
+
+        touching = (self.x < left + player.width) & (self.x + self.width > left) & (self.y < top + player.height) & (self.y + self.height > top)
+
+        # side the player is on, along the axis with the larger distance between their centers
+        dx = (left + player.width//2) - (self.x + self.width//2)
+        dy = (top + player.height//2) - (self.y + self.height//2)
+        side = np.where(abs(dx) >= abs(dy), np.where(dx < 0, 0, 1), np.where(dy < 0, 2, 3))
+        self.collide = np.where(touching, side, -1)
+
+        return touching
+
+    def attack(self, touching):
+        '''
+        attack() counts up the attack delay of each monster touching the player
+
+        Parameter (required):
+            touching - Boolean array that is True for each monster touching the player
+
+        Returns:
+            array - Boolean array that is True for each monster that attacks this frame
+        '''
+
+        self.n = np.where(touching, self.n + 1, 0)
+        attacking = self.n >= self.attack_delay
+        self.n[attacking] = 0
+        return attacking
+
+    def ai_steps(self, scheduler, dx, dy):
+        '''
+        ai_steps() decides which monsters' AI runs this frame, the same way as AIScheduler.steps() but for all monsters at once
+
+        Parameters (required):
+            scheduler - AIScheduler object
+            dx - array of x distances from each monster to the player
+            dy - array of y distances from each monster to the player
+
+        Returns:
+            array - number of frames of movement each monster should make this frame; 0 if its AI doesn't run this frame
+        '''
+
+        # frames between AI ticks for the ring each monster is in, starting from the farthest ring
+        period = np.full(len(self.monsters), scheduler.rates[-1][2], dtype=np.int64)
+        for (x_distance, y_distance, rate) in reversed(scheduler.rates[:-1]):
+            period[(abs(dx) <= x_distance) & (abs(dy) <= y_distance)] = rate
+        period = np.minimum(period, self.ai_tick_rate)
+
+        # runs each monster's AI on its slot's frames only
+        ticking = (scheduler.frame + self.slot)%period == 0
+        scheduler.ticks += int(ticking.sum())
+        return np.where(ticking, period, 0)
+
+    def wall_grid(self, background):
+        '''
+        wall_grid() makes the grid of wall points again if a door was opened or closed since it was last made
+        Every wall point is a multiple of 5, so the grid has one entry for every 5 pixels
+
+        Parameter (required):
+            background - game background object with the walls
+        '''
+
+        key = (background.wall_changes, len(background.wall_list))
+        if key == self.walls_key:
+            return
+        self.walls_key = key
+
+        points = np.array(list(background.wall_list), dtype=np.int64).reshape(-1, 2)//5
+        self.walls_left = int(points[:, 0].min())
+        self.walls_top = int(points[:, 1].min())
+        self.walls = np.zeros((int(points[:, 1].max()) - self.walls_top + 1, int(points[:, 0].max()) - self.walls_left + 1), dtype=bool)
+        self.walls[points[:, 1] - self.walls_top, points[:, 0] - self.walls_left] = True
+
+    def flow_columns(self, labyrinth):
+        '''
+        flow_columns() copies the labyrinth's flow field into columns if it changed since it was last copied
+
+        Parameter (required):
+            labyrinth - Labyrinth object with the flow field (see labyrinth.py)
+        '''
+
+        if labyrinth.flow is self.flow:
+            return
+        self.flow = labyrinth.flow
+
+        count = len(labyrinth.centers)
+        self.flow_move = np.full(count + 1, -1, dtype=np.int64)  # the extra last entry is used for monsters without a place
+        self.flow_x = np.zeros(count + 1, dtype=np.int64)
+        self.flow_y = np.zeros(count + 1, dtype=np.int64)
+        for (place, step) in enumerate(self.flow):
+            if step != None:
+                (neighbor, door, portal_x, portal_y, move) = step
+                self.flow_move[place] = MOVES.index(move)
+                self.flow_x[place] = portal_x
+                self.flow_y[place] = portal_y
+
+    def places(self, labyrinth, x, y):
+        '''
+        places() finds the place of each point, the same way as Labyrinth.place_at() but for many points at once
+
+        Parameters (required):
+            labyrinth - Labyrinth object
+            x - array of x coordinates with respect to the stage
+            y - array of y coordinates with respect to the stage
+
+        Returns:
+            array - place number of each point; -1 if the point isn't in any place
+        '''
+
+        # grid cells (each cell includes its north and west walls)
+        col = (x - labyrinth.left)//labyrinth.spacing
+        row = (y - labyrinth.top)//labyrinth.spacing
+        places = np.where((col >= 0) & (col < 9) & (row >= 0) & (row < 9), row*9 + col, -1)
+
+        # rooms (including their walls)
+        for (place, left, top, right, bottom) in labyrinth.rooms:
+            places[(places < 0) & (x >= left) & (x < right) & (y >= top) & (y < bottom)] = place
+
+        return places
+
+    def blocked(self, rows, moves, distance):
+        '''
+        blocked() checks whether moves would put monsters in a wall, using the same 16 points of each monster as Background.monster_detect_wall_collision()
+
+        Parameters (required):
+            rows - array of row numbers
+            moves - array of the move number for each row
+            distance - array of the number of pixels each move goes
+
+        Returns:
+            array - Boolean array that is True for each move that is blocked
+        '''
+
+        # left, 1/3, 2/3, and right x coordinates and top, 1/3, 2/3, and bottom y coordinates of each monster after the move
+        left = self.x[rows] + DX[moves]*distance
+        top = self.y[rows] + DY[moves]*distance
+        xs = left[:, None] + np.stack((0*self.width[rows], self.width[rows]//3, 2*(self.width[rows]//3), self.width[rows]), axis=1)
+        ys = top[:, None] + np.stack((0*self.height[rows], self.height[rows]//3, 2*(self.height[rows]//3), self.height[rows]), axis=1)
+
+        # every pairing of the x and y coordinates
+        xs = np.repeat(xs, 4, axis=1)
+        ys = np.tile(ys, 4)
+
+        # looks the points up in the wall grid (only points that are multiples of 5 can be wall points)
+        col = xs//5 - self.walls_left
+        row = ys//5 - self.walls_top
+        inside = (xs%5 == 0) & (ys%5 == 0) & (col >= 0) & (col < self.walls.shape[1]) & (row >= 0) & (row < self.walls.shape[0])
+        hits = np.zeros(xs.shape, dtype=bool)
+        hits[inside] = self.walls[row[inside], col[inside]]
+
+        return hits.any(axis=1)
+
+    def chase(self, background, rows, steps):
+        '''
+        chase() moves monsters towards the player, the same way as Monster.chase_step() but for many monsters at once
+
+        Parameters (required):
+            background - game background object that the monsters are located on
+            rows - array of the row numbers of the monsters to move
+            steps - array of the number of steps each monster should make at once
+        '''
+
+        if len(rows) == 0:
+            return
+
+        labyrinth = background.labyrinth
+        self.wall_grid(background)
+        self.flow_columns(labyrinth)
+
+        speed = self.speed[rows]
+        target_x = background.stagePosX
+        target_y = background.stagePosY
+
+        # centers of the monsters
+        x = self.x[rows] + self.width[rows]//2
+        y = self.y[rows] + self.height[rows]//2
+
+        # cell or room of each monster; keeps the last one if the monster is in the wall between a room and the grid
+        places = self.places(labyrinth, x, y)
+        self.place[rows] = np.where(places >= 0, places, self.place[rows])
+        places = self.place[rows]
+
+        # opening to the next cell or room towards the player, from the flow field
+        through = self.flow_move[places]
+        portal_x = self.flow_x[places]
+        portal_y = self.flow_y[places]
+        routed = through >= 0
+
+        # lines up with the opening, then moves through it
+        horizontal = through <= 1
+        align_y = routed & horizontal & (abs(y - portal_y) > speed)
+        align_x = routed & ~horizontal & (abs(x - portal_x) > speed)
+        move = through.copy()
+        move[align_y] = np.where(y[align_y] > portal_y[align_y], 2, 3)
+        move[align_x] = np.where(x[align_x] > portal_x[align_x], 0, 1)
+
+        # heads straight for the player along the farther axis in the same cell or room
+        farther_x = abs(target_x - x) >= abs(target_y - y)
+        move = np.where(routed, move, np.where(farther_x, np.where(target_x < x, 0, 1), np.where(target_y < y, 2, 3)))
+
+        # cuts the steps short so the monsters stop at the player or the opening they are lining up with
+        stop_x = np.where(routed, portal_x, target_x)
+        stop_y = np.where(routed, portal_y, target_y)
+        ahead = np.where(move <= 1, abs(stop_x - x), abs(stop_y - y))
+        stops = ~routed | align_x | align_y
+        steps = np.where(stops & (steps > 1), np.maximum(1, np.minimum(steps, ahead//speed)), steps)
+
+        # steps made at once are never longer than a wall is thick
+        steps = np.maximum(1, np.minimum(steps, (labyrinth.wall - 1)//speed))
+        distance = speed*steps
+
+        # only one step is made if the way isn't clear that far
+        long = distance > speed
+        if long.any():
+            short = long & self.blocked(rows, move, distance)
+            distance[short] = speed[short]
+
+        # sides to turn to if the move is blocked; the side the player is on is tried first (either side if neither)
+        direction = np.stack((x > target_x, x < target_x, y > target_y, y < target_y), axis=1)
+        first_side = np.where(move <= 1, 2, 0)
+        other_side = first_side + 1
+        lean_first = direction[np.arange(len(rows)), first_side]
+        lean_other = direction[np.arange(len(rows)), other_side]
+        chance = np.where(lean_first | lean_other, lean_first.astype(float), 0.5)
+        swap = np.random.random(len(rows)) >= chance
+        (first_side, other_side) = (np.where(swap, other_side, first_side), np.where(swap, first_side, other_side))
+        back = move ^ 1
+
+        # makes the first move that isn't blocked
+        chosen = np.full(len(rows), -1, dtype=np.int64)
+        for option in (move, first_side, other_side, back):
+            open_rows = (chosen < 0) & ~self.blocked(rows, option, distance)
+            chosen[open_rows] = option[open_rows]
+
+        moved = chosen >= 0
+        rows = rows[moved]
+        chosen = chosen[moved]
+        self.x[rows] += DX[chosen]*distance[moved]
+        self.y[rows] += DY[chosen]*distance[moved]
+        self.frame[rows] = FRAMES[chosen]
+        self.previous[rows] = chosen
+
+def move_number(move):
+    '''
+    move_number() retrieves the number of a move in the table
+
+    Parameter (required):
+        move - direction ("left","right","up","down") or None
+
+    Returns:
+        int - index of the move in MOVES; -1 for None
+    '''
+
+    return -1 if move == None else MOVES.index(move)
@@ -0,0 +1,322 @@
+'''
+Names: Spencer Lyudovyk, Amanda Lin, Jue Gong
+Date: 05/09/22
+Project: Labors of Hercules (Choose Your Own Adventure Game)
+File: perf_gate.py
+Purpose: This file contains the performance regression gate that times the game's hot paths without a window and compares them to a stored baseline.
+         Run "python perf_gate.py" to check for regressions or "python perf_gate.py --update" to store new baseline values.
+Task Description: Design a school-appropriate game allowing for user interaction/input.
+'''
+
+# imports
+import os, sys, json, time, random, argparse, tracemalloc
+
+# runs pygame without opening a window and from the project folder so that images and stats can be found
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+from main import *
+
+# default location of the stored baseline and default allowed slowdown (0.25 is 25% slower than the baseline)
+BASELINE_FILE = 'stats/perf_baseline.json'
+DEFAULT_TOLERANCE = 0.25
+
+# extra memory allowed on top of the tolerance, since very small peaks vary by a few allocations between runs
+MEMORY_SLACK = 16*1024
+
+def headless_game(seed=0):
+    '''
+    headless_game() creates and sets up a game the same way main() does, but skips the story and tutorial screens that wait for user input
+
+    Parameter (optional):
+        seed - seed for the random module so that gem locations and monster movement are the same on every run; set to 0 by default
+
+    Returns:
+        game - Game object ready for the first level
+    '''
+
+    random.seed(seed)
+
+    # creates and sets up the first level of the game
+    game = new_game()
+    game.setup()
+
+    # begins the first level the same way the end of the tutorial does
+    game.level = 0
+    game.screen.door_list[game.level].open_door()
+    game.levels()
+
+    return game
+
+
+## Scenarios ##
+# each scenario takes a game and returns a function that runs the hot path a number of times along with that number of calls
+
+def detect_wall_collision_scenario(game):
+    '''
+    detect_wall_collision_scenario() checks the player against the walls at random positions throughout the labyrinth
+    '''
+
+    screen = game.screen
+    player = game.player
+
+    # random player positions on the 5 pixel movement grid
+    rand = random.Random(1)
+    positions = [(rand.randrange(0, 7000, 5), rand.randrange(0, 7000, 5)) for i in range(2000)]
+
+    def run():
+        start = (screen.stagePosX, screen.stagePosY)
+        for (x, y) in positions:
+            screen.stagePosX = x
+            screen.stagePosY = y
+            screen.detect_wall_collision(player)
+        screen.stagePosX, screen.stagePosY = start
+
+    return run, len(positions)
+
+def scroll_scenario(game):
+    '''
+    scroll_scenario() moves the player around the starting corridor, including into walls
+    '''
+
+    screen = game.screen
+    player = game.player
+
+    # moves right, down, left, and up, then tries to move through the top wall
+    moves = [(5,0)]*40 + [(0,5)]*40 + [(-5,0)]*40 + [(0,-5)]*40 + [(0,-5)]*40
+
+    def run():
+        start = (screen.stagePosX, screen.stagePosY)
+        for (x, y) in moves:
+            screen.scroll(x, y, player, player.held_item)
+        screen.stagePosX, screen.stagePosY = start
+
+    return run, len(moves)
+
+def track_player_scenario(game):
+    '''
+    track_player_scenario() lets the first monster chase the player through the labyrinth
+    '''
+
+    screen = game.screen
+    player = game.player
+    monster = game.active_monster
+    frames = 400
+
+    # points the monsters' flow field at the player the same way Game.place_player() does each frame
+    screen.labyrinth.follow(screen.labyrinth.place_at(screen.stagePosX, screen.stagePosY))
+
+    def run():
+        start = (monster.x_bg, monster.y_bg)
+        health = player.health
+
+        # the same random moves are made on every run
+        random.seed(2)
+        for i in range(frames):
+            monster.track_player(screen, player, game)
+            game.ai_scheduler.end_frame()
+
+        monster.x_bg, monster.y_bg = start
+        player.health = health
+        player.hit = False
+
+    return run, frames
+
+def set_background_image_scenario(game):
+    '''
+    set_background_image_scenario() redraws the full background image with all background objects
+    '''
+
+    def run():
+        for i in range(3):
+            game.screen.set_background_image()
+
+    return run, 3
+
+def textbox_place_scenario(game):
+    '''
+    textbox_place_scenario() draws the instructional text box in the corner of the screen
+    '''
+
+    # fills the text box with the controls text used during gameplay
+    game.text_update()
+
+    def run():
+        for i in range(200):
+            game.text.place(game.screen.screen, background_color=(255,233,155), text_color=(0,0,0))
+
+    return run, 200
+
+# all scenarios by name, in the order they are run
+scenarios = {"detect_wall_collision": detect_wall_collision_scenario,
+             "scroll": scroll_scenario,
+             "track_player": track_player_scenario,
+             "set_background_image": set_background_image_scenario,
+             "TextBox.place": textbox_place_scenario}
+
+
+## Measuring ##
+
+def measure(game, make_scenario, repeat=5):
+    '''
+    measure() times a scenario and records its peak memory use
+
+    Parameters (required):
+        game - game object the scenario is run on
+        make_scenario - scenario function from the scenarios dictionary
+
+    Parameter (optional):
+        repeat - number of timed runs; the fastest run is used since it has the least outside noise; set to 5 by default
+
+    Returns:
+        dictionary - microseconds per call and peak memory in bytes
+    '''
+
+    run, calls = make_scenario(game)
+
+    # warm up run so that one-time costs are not timed
+    run()
+
+    # times the scenario several times and keeps the fastest time
+    best = None
+    for i in range(repeat):
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        if best == None or elapsed < best:
+            best = elapsed
+
+    # runs the scenario once more with memory tracing, which is done separately since tracing slows down the code
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    run()
+    peak = tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+
+    return {"us_per_call": round(best/calls*1e6, 3), "peak_bytes": peak}
+
+def run_scenarios(names, seed=0, repeat=5):
+    '''
+    run_scenarios() measures each of the named scenarios on a new headless game
+
+    Parameter (required):
+        names - list of scenario names to run
+
+    Parameters (optional):
+        seed - random seed for the game; set to 0 by default
+        repeat - number of timed runs per scenario; set to 5 by default
+
+    Returns:
+        results - dictionary of scenario name:measurements
+    '''
+
+    game = headless_game(seed)
+
+    results = {}
+    for name in names:
+        results[name] = measure(game, scenarios[name], repeat)
+
+    return results
+
+def compare(results, baseline, tolerance):
+    '''
+    compare() prints the current measurements next to the baseline and finds any regressions
+
+    Parameters (required):
+        results - dictionary of current measurements
+        baseline - dictionary of baseline measurements
+        tolerance - allowed slowdown or memory growth as a fraction of the baseline (e.g., 0.25 is 25%)
+
+    Returns:
+        failures - list of strings describing each regression
+    '''
+
+    failures = []
+
+    print("{:<24}{:>14}{:>14}{:>9}{:>14}{:>14}".format("scenario", "us/call", "baseline", "change", "peak KiB", "baseline"))
+    for name, current in results.items():
+        # scenarios without a baseline are only reported
+        if name not in baseline:
+            print("{:<24}{:>14.3f}{:>14}{:>9}{:>14.1f}{:>14}".format(name, current["us_per_call"], "-", "new", current["peak_bytes"]/1024, "-"))
+            continue
+
+        base = baseline[name]
+        change = current["us_per_call"]/base["us_per_call"] - 1
+        print("{:<24}{:>14.3f}{:>14.3f}{:>+8.0%}{:>14.1f}{:>14.1f}".format(name, current["us_per_call"], base["us_per_call"], change, current["peak_bytes"]/1024, base["peak_bytes"]/1024))
+
+        # slower than the baseline plus tolerance
+        if current["us_per_call"] > base["us_per_call"]*(1 + tolerance):
+            failures.append("{} is {:.0%} slower than the baseline".format(name, change))
+
+        # uses more memory than the baseline plus tolerance
+        if current["peak_bytes"] > base["peak_bytes"]*(1 + tolerance) + MEMORY_SLACK:
+            failures.append("{} peak memory grew from {} to {} bytes".format(name, base["peak_bytes"], current["peak_bytes"]))
+
+    return failures
+
+def main_gate(args=None):
+    '''
+    main_gate() runs the performance gate from the command line
+
+    Parameter (optional):
+        args - list of command line arguments; by default, set to None (i.e., sys.argv is used)
+
+    Returns:
+        exit code - 0 if there were no regressions; 1 if there were
+    '''
+
+    parser = argparse.ArgumentParser(description="Compares hot path timings and peak memory against a stored baseline.")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="baseline JSON file")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="allowed regression as a fraction of the baseline")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per scenario")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for the game")
+    parser.add_argument("--update", action="store_true", help="stores the current measurements as the new baseline")
+    parser.add_argument("scenario", nargs="*", help="scenarios to run; all scenarios by default")
+    args = parser.parse_args(args)
+
+    names = args.scenario or list(scenarios)
+    for name in names:
+        if name not in scenarios:
+            parser.error("unknown scenario '{}' (choose from {})".format(name, ", ".join(scenarios)))
+
+    results = run_scenarios(names, seed=args.seed, repeat=args.repeat)
+
+    # writes the measurements as the new baseline, keeping baseline values of scenarios that weren't run
+    if args.update:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as file:
+                baseline = json.load(file)
+        baseline.update(results)
+        with open(args.baseline, 'w') as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+            file.write('\n')
+
+        compare(results, {}, args.tolerance)
+        print("baseline written to " + args.baseline)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("no baseline found at {}; run with --update to create one".format(args.baseline))
+        return 1
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+
+    failures = compare(results, baseline, args.tolerance)
+
+    # lists all regressions
+    if failures:
+        print()
+        for failure in failures:
+            print("REGRESSION: " + failure)
+        return 1
+
+    print("\nno regressions")
+    return 0
+
+# runs the gate and exits with its exit code
+if __name__=="__main__":
+    sys.exit(main_gate())
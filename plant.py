@@ -16,6 +16,19 @@ class Plant:
     The Plant() class represents a flower in the game, which can be dug up using a shovel and eaten for increased health points.
     '''
     
+    collision_space = "background"  # a plant's x_bg and y_bg are background coordinates (see collision.py)
+    
+    # attributes of each plant (and their types); plants have no __dict__, so their attributes are stored in fixed slots
+    __slots__ = (
+        "x_bg",       # int; x position in background coordinates
+        "y_bg",       # int; y position in background coordinates
+        "frame",      # int; how far the plant has been dug up (0 to 4)
+        "walk_over",  # Boolean; whether the player can walk over the plant
+        "images",     # list of surfaces; one for each frame
+        "width",      # int; width of the plant in pixels
+        "height",     # int; height of the plant in pixels
+    )
+    
     def __init__(self, x_bg, y_bg):
         '''
         __init__() initializes the plant
@@ -30,12 +43,11 @@ class Plant:
         
         self.frame = 0  # starting frame of plant (not dug up at all)
         self.walk_over = False  # plant cannot be walked over by the player
-        self.dig_lag = 0  # digging lag so that, if digging continously, plant is only dug after a certain number of frames
         
         # list of sprites
         self.images = [] 
         for x in range(1,5):
-            img = loadImage('images/plant' + str(x) + '.png')
+            img = loadImage('images/plant' + str(x) + '.png', mask=True)
             self.images.append(img)
         
         # width and height of plant
@@ -50,7 +62,7 @@ class Plant:
             background - the background to draw the plant on
         '''
         
-        background.surface.blit(self.images[self.frame], (self.x_bg, self.y_bg))
+        frame_stats.blit(background.surface, self.images[self.frame], (self.x_bg, self.y_bg))
     
     def eat(self, player, background):
         '''
@@ -65,5 +77,5 @@ class Plant:
         player.increase_health(20)
         
         # removes the plant from the background
-        background.background_obj.remove(self)
+        background.remove_object(self)
         background.set_background_image()
\ No newline at end of file
@@ -11,12 +11,60 @@ Task Description: Design a school-appropriate game allowing for user interaction
 import pygame
 from additional_func import *
 from background import *
+from scheduler import scheduler
+
+# semi transparent red overlays shown on characters that were hit, by size; they are never drawn on, so characters of the same size share one
+hit_overlays = {}
+
+def hit_overlay(width, height):
+    '''
+    hit_overlay() retrieves the red overlay shown on a character that was hit, creating it the first time a size is needed
+    
+    Parameters (required):
+        width - width of the character
+        height - height of the character
+    
+    Returns:
+        surface - semi transparent red surface of the given size
+    '''
+    
+    if (width, height) not in hit_overlays:
+        # creates surface allowing transparency
+        shape_surf = frame_stats.surface((width, height), pygame.SRCALPHA)
+        
+        # draws semi transparent red rectange
+        pygame.draw.rect(shape_surf, (255, 0, 0, 150), shape_surf.get_rect())
+        hit_overlays[(width, height)] = shape_surf
+    return hit_overlays[(width, height)]
 
 class Player:
     '''
     The Player() class represents a character in the game, including the main player and the monsters (the monsters are subclasses).
     '''
     
+    collision_space = "screen"  # the player's x and y are window coordinates (see collision.py)
+    hit_time = 0.175  # number of seconds the red overlay is shown after the character is hit (21 frames)
+
+    # attributes of each character (and their types); characters have no __dict__, so their attributes are stored in fixed slots that are faster to access and take less memory
+    __slots__ = (
+        "images",            # list of surfaces; one for each direction the character faces
+        "width",             # int; width of the character in pixels
+        "height",            # int; height of the character in pixels
+        "x",                 # int; x position in reference to the window
+        "y",                 # int; y position in reference to the window
+        "held_item",         # Holdable or None; item the character is holding in their hands
+        "possible_weapons",  # list of Holdable; items the character has acquired
+        "items_list",        # list of Holdable or None; items in the character's backpack or hands
+        "health",            # int or float; health points
+        "pos_row",           # int; grid cell row in the 9x9 labyrinth grid
+        "pos_col",           # int; grid cell column in the 9x9 labyrinth grid
+        "hit",               # Boolean; whether the character is being attacked
+        "hit_timer",         # Timer or None; timer that ends the red overlay
+        "frame",             # int; frame the character was last drawn with
+        "animation_images",  # dict of surfaces; images of the main player's ending animation
+        "image",             # surface or None; current image of the ending animation
+    )
+
     def __init__(self, nick, items_list=None):
         '''
         __init__() initializes the character
@@ -30,9 +78,10 @@ class Player:
                 
         # retrieves the images for each frame of the character
         # there is 1 frame for each direction the character faces (up, down, right, or left)
+        # characters are never drawn on, so all characters with the same nickname share their images
         self.images = []
         for x in range(1,5):
-            img = loadImage('images/' + nick + str(x) + '.png')
+            img = loadImage('images/' + nick + str(x) + '.png', shared=True, mask=True)
             self.images.append(img)
         
         # width and height of the character
@@ -56,7 +105,8 @@ class Player:
         self.pos_col = 1
         
         self.hit = False  # whether or not the character is being attacked; initially, the character is not being hit
-        self.hit_count = 0  # implements a lag for being attacked (so that points are subtracted less frequently than each frame)
+        self.hit_timer = None  # timer that ends the red overlay shown after the character is hit (see decrease_health())
+        self.frame = 0  # frame the character was last drawn with (see place()); used to check exact collisions
         
         # animation_images and image are only used if the character is the main player and has beat the game
         self.animation_images = {}  # dictionary images for character animation
@@ -71,7 +121,8 @@ class Player:
         '''
         
         # x and y positions of the character with respect to the background image
-        if 'x_bg' in self.__dict__:
+        # monsters keep their own position (see Monster.collision_space); the player is always at the stage position
+        if self.collision_space == "stage":
             x_bg = self.x_bg
             y_bg = self.y_bg
         else:
@@ -93,33 +144,34 @@ class Player:
             frame - frame number of player to be drawn (each frame represents a different orientation (up, left, down, or right))
         '''
         
-        # draws the character facing in the specified direction
-        background.screen.blit(self.images[frame], (self.x, self.y))
+        # draws the character facing in the specified direction, and a red overlay on top if it was hit
+        self.frame = frame
+        frame_stats.blit_many(background.screen, self.frame_sprites(frame))
+    
+    def frame_sprites(self, frame):
+        '''
+        frame_sprites() retrieves the surfaces that draw the character, so that many characters can be drawn with one batched blit
         
-        # temporarily turns red if hit
+        Parameters (required):
+            frame - frame number of character to be drawn (each frame represents a different orientation (up, left, down, or right))
+        
+        Returns:
+            list - (surface, (x, y)) pairs to be drawn in order at the character's window position
+        '''
+        
+        # character facing in the specified direction
+        sprites = [(self.images[frame], (self.x, self.y))]
+        
+        # temporarily turns red if hit (until end_hit() runs)
         if self.hit:
-            # creates surface allowing transparency
-            shape_surf = pygame.Surface(pygame.Rect(0, 0, self.width, self.height).size, pygame.SRCALPHA)
-            
-            # draws semi transparent red rectange
-            pygame.draw.rect(shape_surf, (255, 0, 0, 150), shape_surf.get_rect())
-            
-            # implements a lag for how long the red rectangle is visible
-            # so that it is visible for about 20 frames of the game
-            if self.hit_count <= 20:
-                # draws the red rectange and increments the lag counter
-                background.screen.blit(shape_surf, (self.x, self.y))
-                self.hit_count += 1
-            else:
-                # resets the counter
-                self.hit_count = 0
-                
-                # resets whether the character has been hit so that they can be hit again
-                self.hit = False
+            sprites.append((hit_overlay(self.width, self.height), (self.x, self.y)))
+        
+        return sprites
     
     def touching(self, other, background, monster=True):
         '''
         touching() checks whether the character is touching a particular object
+        Their boxes are checked first, and only if they overlap are their images' pixels checked (see spritesTouching())
         
         Parameters (required):
             other - the object to be checked for contact
@@ -137,11 +189,11 @@ class Player:
         y1 = self.y
         
         # sets the other object's x and y coordinates
-        if other in background.background_obj and monster == True:
+        if background.in_background(other) and monster == True:
             # if the other object is an object in the background and is a monster
             x2 = other.x_bg - (background.stagePosX - 500)
             y2 = other.y_bg - (background.stagePosY - 400)
-        elif other in background.background_obj:
+        elif background.in_background(other):
             # if the other object is an object in the background but is not a monster
             x2 = other.x_bg - background.stagePosX
             y2 = other.y_bg - background.stagePosY
@@ -153,7 +205,8 @@ class Player:
         # checks whether the x and y positions of either object are inside the other object
         if (x2 >= x1 and x2 < (x1 + self.width)) or (x1 >= x2 and x1 < (x2 + other.width)):
             if (y2 >= y1 and y2 < (y1 + self.height)) or (y1 >= y2 and y1 < (y2 + other.height)):
-                return True  # returns True if the objects are touching
+                # returns True if the objects' pixels are touching
+                return spritesTouching(self.images[self.frame], x1, y1, other.images[other.frame], x2, y2)
 
         # returns False if the objects are not touching
         return False
@@ -169,6 +222,17 @@ class Player:
         
         self.health -= pts
         self.hit = True
+        
+        # the red overlay is shown for hit_time seconds after the first hit, however often the character is hit during that time
+        if self.hit_timer == None or not self.hit_timer.active:
+            self.hit_timer = scheduler.after(self.hit_time, self.end_hit)
+    
+    def end_hit(self):
+        '''
+        end_hit() resets whether the character has been hit, removing the red overlay, so that they can be hit again
+        '''
+        
+        self.hit = False
     
     def increase_health(self, pts):
         '''
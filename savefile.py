@@ -0,0 +1,215 @@
+'''
+Names: Spencer Lyudovyk, Amanda Lin, Jue Gong
+Date: 05/09/22
+Project: Labors of Hercules (Choose Your Own Adventure Game)
+File: savefile.py
+Purpose: This file contains the binary format of saved games: the SaveWriter class that packs the state of a game into bytes and the SaveReader class that unpacks it (see Game.save() and Game.load()).
+Task Description: Design a school-appropriate game allowing for user interaction/input.
+'''
+
+# imports
+import os
+import struct
+
+# every saved game starts with these bytes and the version of the format it was written in
+# VERSION must be increased whenever the records below change, so older saved games are rejected instead of read wrong
+MAGIC = b'LOHS'
+VERSION = 1
+
+NONE = 0xFFFF  # object number that stands for no object (e.g., when the player isn't holding anything)
+
+# locations of an item (see Holdable.loc), stored as their index
+LOCATIONS = ('ground', 'backpack', 'hands', 'chest')
+
+# records of the format; all numbers are little-endian
+HEADER = struct.Struct('<4sH')  # magic bytes, version
+GAME = struct.Struct('<bBBBBfiiffhHB')  # level, flags, introductions, gem countdown state, facing frame, seconds left, stage x, stage y, stage x and y fractions, player health, held object, collected gems
+ITEM = struct.Struct('<BiiHBB')  # location, x, y, times picked up, frame, flashlight on
+MONSTER = struct.Struct('<iihBB')  # x, y, health, active, frame
+PLANT = struct.Struct('<B')  # frame
+CHEST = struct.Struct('<BH')  # open, content object
+DOOR = struct.Struct('<B')  # frame
+COUNT = struct.Struct('<H')  # number of records or object numbers that follow
+
+class SaveWriter:
+    '''
+    The SaveWriter() class packs records into the bytes of a saved game, starting with the header.
+    '''
+
+    def __init__(self):
+        '''
+        __init__() starts the saved game with its header
+        '''
+
+        self.data = bytearray(HEADER.pack(MAGIC, VERSION))
+
+    def pack(self, record, *values):
+        '''
+        pack() adds one record
+
+        Parameters (required):
+            record - struct.Struct of the record (e.g., GAME)
+            values - values of the record's fields, in order
+        '''
+
+        self.data += record.pack(*values)
+
+    def records(self, record, rows):
+        '''
+        records() adds the number of records and then the records
+
+        Parameters (required):
+            record - struct.Struct of the records (e.g., ITEM)
+            rows - list of tuples of the values of each record's fields
+        '''
+
+        self.data += COUNT.pack(len(rows))
+        for row in rows:
+            self.data += record.pack(*row)
+
+    def numbers(self, numbers):
+        '''
+        numbers() adds the number of object numbers and then the object numbers (e.g., of the items in the backpack)
+
+        Parameter (required):
+            numbers - list of object numbers
+        '''
+
+        self.data += COUNT.pack(len(numbers))
+        self.data += struct.pack('<{}H'.format(len(numbers)), *numbers)
+
+    def write(self, path):
+        '''
+        write() writes the saved game to a file
+        The bytes are written to a temporary file that then replaces the file, so a game saved while playing is never left half written
+
+        Parameter (required):
+            path - name of the file
+        '''
+
+        temp = path + '.tmp'
+        with open(temp, 'wb') as file:
+            file.write(self.data)
+        os.replace(temp, path)
+
+class SaveReader:
+    '''
+    The SaveReader() class unpacks the records of a saved game in the order they were packed by SaveWriter().
+    All problems with the bytes (e.g., another file, another version, or a file that was cut short) raise a ValueError.
+    '''
+
+    def __init__(self, data):
+        '''
+        __init__() checks the header of a saved game
+
+        Parameter (required):
+            data - bytes of the saved game
+        '''
+
+        self.data = data
+        self.offset = 0  # number of bytes unpacked so far
+
+        (magic, version) = self.unpack(HEADER)
+        if magic != MAGIC:
+            raise ValueError("not a saved game")
+        if version != VERSION:
+            raise ValueError("saved game has version {}, but version {} is needed".format(version, VERSION))
+
+    @classmethod
+    def read(cls, path):
+        '''
+        read() reads a saved game from a file
+
+        Parameter (required):
+            path - name of the file
+
+        Returns:
+            SaveReader - reader of the file's bytes
+
+        Raises:
+            ValueError - if the file can't be read (e.g., it is a folder or can't be opened), or isn't a saved game
+        '''
+
+        try:
+            with open(path, 'rb') as file:
+                data = file.read()
+        except OSError as error:
+            raise ValueError("saved game can't be read ({})".format(error.strerror)) from error
+        return cls(data)
+
+    def unpack(self, record):
+        '''
+        unpack() unpacks the next record
+
+        Parameter (required):
+            record - struct.Struct of the record
+
+        Returns:
+            tuple - values of the record's fields, in order
+        '''
+
+        if self.offset + record.size > len(self.data):
+            raise ValueError("saved game is cut short")
+        values = record.unpack_from(self.data, self.offset)
+        self.offset += record.size
+        return values
+
+    def records(self, record, count=None):
+        '''
+        records() unpacks the number of records and then the records
+
+        Parameter (required):
+            record - struct.Struct of the records
+
+        Parameter (optional):
+            count - number of records there must be (e.g., the number of monsters in the game); None (the default) for any number
+
+        Returns:
+            list - tuples of the values of each record's fields
+        '''
+
+        (n,) = self.unpack(COUNT)
+        if count != None and n != count:
+            raise ValueError("saved game has {} records where {} are needed".format(n, count))
+        return [self.unpack(record) for i in range(n)]
+
+    def numbers(self, limit):
+        '''
+        numbers() unpacks the number of object numbers and then the object numbers
+
+        Parameter (required):
+            limit - number of objects in the game; every object number must be less than it
+
+        Returns:
+            list - object numbers
+        '''
+
+        (n,) = self.unpack(COUNT)
+        return [self.number(number, limit) for number in self.unpack(struct.Struct('<{}H'.format(n)))]
+
+    def number(self, number, limit, optional=False):
+        '''
+        number() checks an object number that was unpacked
+
+        Parameters (required):
+            number - object number
+            limit - number of objects in the game; the object number must be less than it
+
+        Parameter (optional):
+            optional - whether the object number can be NONE (no object); set to False by default
+
+        Returns:
+            int - the object number
+        '''
+
+        if number >= limit and not (optional and number == NONE):
+            raise ValueError("saved game refers to an object that doesn't exist")
+        return number
+
+    def finish(self):
+        '''
+        finish() checks that all bytes of the saved game were unpacked
+        '''
+
+        if self.offset != len(self.data):
+            raise ValueError("saved game has {} extra bytes".format(len(self.data) - self.offset))
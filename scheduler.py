@@ -0,0 +1,186 @@
+'''
+Names: Spencer Lyudovyk, Amanda Lin, Jue Gong
+Date: 05/09/22
+Project: Labors of Hercules (Choose Your Own Adventure Game)
+File: scheduler.py
+Purpose: This file contains the Scheduler class that runs timed game events (e.g., how long an error message is shown) after a delay or at a regular period.
+Task Description: Design a school-appropriate game allowing for user interaction/input.
+'''
+
+# imports
+import heapq
+
+class Timer:
+    '''
+    The Timer() class represents one event waiting in a Scheduler: a function to run once after a delay, or again and again at a period.
+    '''
+
+    def __init__(self, due, function, period=None):
+        '''
+        __init__() initializes the Timer
+
+        Parameters (required):
+            due - step of simulated time the timer runs at
+            function - function with no parameters to run when the timer is due; None for a timer that is only waited on (e.g., a cooldown)
+
+        Parameter (optional):
+            period - number of steps between runs of a repeating timer; None (the default) for a timer that runs once
+        '''
+
+        self.due = due
+        self.function = function
+        self.period = period
+        self.active = True  # whether the timer is still waiting to run; False once a one-time timer has run or once it is cancelled
+
+class Scheduler:
+    '''
+    The Scheduler() class keeps timers in a heap ordered by when they are due, so each frame only the timers that are due are looked at.
+    Time is simulated: it only moves forward when advance() is called, once for each frame of gameplay, so timers stop while the game is paused.
+    Delays are given in seconds and counted in steps of 1/rate seconds (one frame at the game's frame rate), so they don't depend on the frame rate.
+    '''
+
+    def __init__(self, rate=120):
+        '''
+        __init__() initializes the Scheduler
+
+        Parameter (optional):
+            rate - number of steps in one second of simulated time; set to 120 (the game's frame rate) by default
+        '''
+
+        self.rate = rate
+        self.now = 0  # number of steps of simulated time so far
+        self.heap = []  # (due step, order added, timer) of each waiting timer; cancelled timers are dropped when they reach the top
+        self.added = 0  # number of timers added so far, so timers due on the same step run in the order they were added
+
+    def __len__(self):
+        '''
+        __len__() retrieves the number of timers in the heap, including cancelled timers that haven't been dropped yet
+
+        Returns:
+            int - number of timers
+        '''
+
+        return len(self.heap)
+
+    def steps(self, seconds):
+        '''
+        steps() converts seconds of simulated time into steps
+
+        Parameter (required):
+            seconds - number of seconds
+
+        Returns:
+            int - nearest whole number of steps
+        '''
+
+        return round(seconds*self.rate)
+
+    def push(self, timer):
+        '''
+        push() puts a timer into the heap
+
+        Parameter (required):
+            timer - Timer object
+        '''
+
+        heapq.heappush(self.heap, (timer.due, self.added, timer))
+        self.added += 1
+
+    def after(self, delay, function=None):
+        '''
+        after() runs a function once after a delay
+
+        Parameter (required):
+            delay - number of seconds to wait
+
+        Parameter (optional):
+            function - function with no parameters to run; None (the default) for a timer that is only waited on (see Timer.active)
+
+        Returns:
+            Timer - the new timer, which can be cancelled with cancel()
+        '''
+
+        timer = Timer(self.now + max(1, self.steps(delay)), function)
+        self.push(timer)
+        return timer
+
+    def every(self, period, function):
+        '''
+        every() runs a function again and again, once every period, starting one period from now
+
+        Parameters (required):
+            period - number of seconds between runs
+            function - function with no parameters to run
+
+        Returns:
+            Timer - the new timer, which runs until it is cancelled with cancel()
+        '''
+
+        steps = max(1, self.steps(period))
+        timer = Timer(self.now + steps, function, steps)
+        self.push(timer)
+        return timer
+
+    def cancel(self, timer):
+        '''
+        cancel() stops a timer from running; it is dropped from the heap once it reaches the top
+
+        Parameter (required):
+            timer - Timer object; nothing happens if it is None or has already run
+        '''
+
+        if timer != None:
+            timer.active = False
+
+    def remaining(self, timer):
+        '''
+        remaining() retrieves how long is left until a timer runs
+
+        Parameter (required):
+            timer - Timer object
+
+        Returns:
+            float - number of seconds left; 0 if the timer has already run or was cancelled
+        '''
+
+        if not timer.active:
+            return 0
+        return (timer.due - self.now)/self.rate
+
+    def advance(self, steps=1):
+        '''
+        advance() moves simulated time forward and runs the timers that are now due, in the order they are due
+
+        Parameter (optional):
+            steps - number of steps to move forward; set to 1 (one frame) by default
+        '''
+
+        self.now += steps
+        while self.heap and self.heap[0][0] <= self.now:
+            (due, order, timer) = heapq.heappop(self.heap)
+
+            # drops cancelled timers
+            if not timer.active:
+                continue
+
+            # puts a repeating timer back for its next run, and finishes a one-time timer
+            if timer.period != None:
+                timer.due += timer.period
+                self.push(timer)
+            else:
+                timer.active = False
+
+            if timer.function != None:
+                timer.function()
+
+    def clear(self):
+        '''
+        clear() cancels all timers (e.g., when a new game starts)
+        '''
+
+        for (due, order, timer) in self.heap:
+            timer.active = False
+        self.heap = []
+
+# timers shared by all files
+scheduler = Scheduler()
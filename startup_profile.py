@@ -0,0 +1,230 @@
+'''
+Names: Spencer Lyudovyk, Amanda Lin, Jue Gong
+Date: 05/09/22
+Project: Labors of Hercules (Choose Your Own Adventure Game)
+File: startup_profile.py
+Purpose: This file contains the StartupProfile class that records how long each step of starting the game takes before the first frame is drawn.
+         Run "python main.py --profile-startup [filename]" to print the steps and save them as JSON (startup_profile.json by default).
+Task Description: Design a school-appropriate game allowing for user interaction/input.
+'''
+
+# imports
+import os, json, time
+
+class NullStep:
+    '''
+    The NullStep() class is a step that does nothing; it is used when startup profiling is turned off so that timed code runs normally.
+    '''
+
+    def __enter__(self):
+        '''
+        __enter__() does nothing when the step starts
+        '''
+
+        return self
+
+    def __exit__(self, *exc):
+        '''
+        __exit__() does nothing when the step ends
+        '''
+
+        return False
+
+class Step:
+    '''
+    The Step() class times a single step of the startup when used in a 'with' statement.
+    '''
+
+    def __init__(self, profile, name, merge):
+        '''
+        __init__() initializes a Step
+
+        Parameters (required):
+            profile - StartupProfile object the step is recorded in
+            name - name of the step shown in the report
+            merge - Boolean representing whether back-to-back steps with the same name should be combined into a single row
+        '''
+
+        self.profile = profile
+        self.name = name
+        self.merge = merge
+        self.record = None  # dictionary the step's timing is saved to
+
+    def __enter__(self):
+        '''
+        __enter__() starts timing the step
+        '''
+
+        self.record = self.profile.begin(self.name, self.merge)
+        return self
+
+    def __exit__(self, *exc):
+        '''
+        __exit__() stops timing the step
+        '''
+
+        self.profile.end(self.record)
+        return False
+
+class StartupProfile:
+    '''
+    The StartupProfile() class records a waterfall of nested, timed startup steps.
+    Steps are only recorded if profiling is enabled.
+    '''
+
+    def __init__(self):
+        '''
+        __init__() initializes the StartupProfile
+        '''
+
+        self.enabled = False  # whether steps are recorded
+        self.start = time.perf_counter()  # time that all step times are measured from
+        self.steps = []  # list of recorded steps in the order they started
+        self.running = []  # stack of steps that have started but not yet ended
+        self.last_at_depth = {}  # most recent step at each depth; used to merge back-to-back steps with the same name
+        self.null_step = NullStep()
+
+    def step(self, name, merge=False):
+        '''
+        step() creates a timed step to be used in a 'with' statement
+
+        Parameter (required):
+            name - name of the step shown in the report
+
+        Parameter (optional):
+            merge - Boolean representing whether this step should be combined with the previous step if it has the same name (e.g., several image loads); set to False by default
+
+        Returns:
+            Step or NullStep - the step to be used in a 'with' statement
+        '''
+
+        if not self.enabled:
+            return self.null_step
+
+        return Step(self, name, merge)
+
+    def begin(self, name, merge):
+        '''
+        begin() starts recording a step
+
+        Parameters (required):
+            name - name of the step
+            merge - whether to combine the step with the previous step of the same name
+
+        Returns:
+            record - dictionary the step is recorded in
+        '''
+
+        now = time.perf_counter()
+        depth = len(self.running)
+
+        # continues the previous step at this depth if it has the same name
+        previous = self.last_at_depth.get(depth)
+        if merge and previous != None and previous["merge"] and previous["name"] == name:
+            record = previous
+        else:
+            record = {"name": name, "depth": depth, "start": now - self.start, "duration": 0.0, "count": 0, "merge": merge}
+            self.steps.append(record)
+            self.last_at_depth[depth] = record
+
+        # steps started inside this step can't be merged with steps from before it
+        for deeper in [d for d in self.last_at_depth if d > depth]:
+            del self.last_at_depth[deeper]
+
+        self.running.append((record, now))
+        return record
+
+    def end(self, record):
+        '''
+        end() finishes recording a step
+
+        Parameter (required):
+            record - dictionary returned by begin()
+        '''
+
+        record, started = self.running.pop()
+        record["duration"] += time.perf_counter() - started
+        record["count"] += 1
+
+    def total(self):
+        '''
+        total() retrieves the time from the start of profiling to the end of the last top level step
+
+        Returns:
+            float - total time in seconds
+        '''
+
+        top = [s for s in self.steps if s["depth"] == 0]
+        if not top:
+            return 0.0
+        return max(s["start"] + s["duration"] for s in top)
+
+    def report(self, width=40):
+        '''
+        report() prints the steps as a waterfall, with each bar placed at the time its step started
+
+        Parameter (optional):
+            width - number of characters in the full time line; set to 40 by default
+        '''
+
+        total = self.total() or 1.0
+
+        print("{:<44}{:>10}{:>10}  {}".format("step", "start ms", "ms", "waterfall"))
+        for step in self.steps:
+            # step name indented by depth, with the number of merged steps
+            name = "  "*step["depth"] + step["name"]
+            if step["count"] > 1:
+                name += " (x{})".format(step["count"])
+
+            # bar starting at the step's start time and as long as its duration (at least 1 character)
+            offset = int(width*step["start"]/total)
+            length = max(1, int(round(width*step["duration"]/total)))
+            bar = " "*offset + "#"*min(length, width - offset)
+
+            print("{:<44}{:>10.1f}{:>10.1f}  |{:<{w}}|".format(name[:43], step["start"]*1000, step["duration"]*1000, bar, w=width))
+
+        print("{:<44}{:>10}{:>10.1f}".format("total before first frame", "", total*1000))
+
+    def write_json(self, filename):
+        '''
+        write_json() saves the steps to a JSON file so that startup times can be compared over time
+
+        Parameter (required):
+            filename - name of JSON file
+        '''
+
+        data = {"total_ms": round(self.total()*1000, 3),
+                "steps": [{"name": s["name"], "depth": s["depth"], "start_ms": round(s["start"]*1000, 3),
+                           "duration_ms": round(s["duration"]*1000, 3), "count": s["count"]} for s in self.steps]}
+
+        with open(filename, 'w') as file:
+            json.dump(data, file, indent=2)
+            file.write('\n')
+
+def sprite_name(filename):
+    '''
+    sprite_name() gets the name of the object a sprite belongs to from its filename, e.g., 'images/lion3.png' gives 'lion'
+
+    Parameter (required):
+        filename - filename of image
+
+    Returns:
+        name - image name without its folder, extension, frame numbers, or on/off state
+    '''
+
+    name = os.path.splitext(os.path.basename(filename))[0]
+
+    # removes on/off states (flashlight) and frame numbers
+    for suffix in ('on', 'off'):
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+    name = name.rstrip('0123456789')
+
+    # images named only by number are named after their folder (e.g., animation/1.png)
+    if name == '':
+        name = os.path.basename(os.path.dirname(filename))
+
+    return name
+
+# profile shared by all files; main.py enables it in startup profiling mode
+startup_profile = StartupProfile()
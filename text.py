@@ -41,6 +41,7 @@ class TextBox(pygame.surface.Surface):
 
         # initiates the pygame.surface.Surface super class
         super().__init__([width,height], pygame.SRCALPHA)
+        frame_stats.count_surface()  # counts the new surface
 
         # initiates pygame fonts
         pygame.font.init()
@@ -90,8 +91,8 @@ class TextBox(pygame.surface.Surface):
         # adds the text to the screen based on the list of lines
         for x in range(len(lines)):
             line = lines[x]
-            textAdded = self.font.render(line, True, text_color, None)
-            background.blit(textAdded, (self.x+self.left_padding, self.y + (self.text_size + self.padding)*x+self.top_padding))
+            textAdded = frame_stats.render(self.font, line, True, text_color, None)
+            frame_stats.blit(background, textAdded, (self.x+self.left_padding, self.y + (self.text_size + self.padding)*x+self.top_padding))
 
     def updateText(self, background, new_text=None, background_color=None,text_color=(0,255,0)):
 
@@ -171,7 +172,7 @@ class ImageBox(TextBox):
         '''
 
         # draws the image
-        self.blit(self.image, (0,0))
+        frame_stats.blit(self, self.image, (0,0))
         
         # creates a list of lines of text
         lines = self.text.splitlines()
@@ -179,13 +180,13 @@ class ImageBox(TextBox):
         # adds text to the screen based on the list of lines
         for x in range(len(lines)):
             line = lines[x]
-            textAdded = self.font.render(line, True, text_color, None)
+            textAdded = frame_stats.render(self.font, line, True, text_color, None)
             
             # the text is offset by 150 px on each direction, and 20 px between lines
-            self.blit(textAdded, (150, 150+20*x))
+            frame_stats.blit(self, textAdded, (150, 150+20*x))
         
         # draws the image box onto the screen
-        background.blit(self, (self.x,self.y))
+        frame_stats.blit(background, self, (self.x,self.y))
 
 class Story(ImageBox):
     '''
@@ -281,8 +282,8 @@ class ErrorBox(TextBox):
         # initializes super class TextBox
         super().__init__(x,y,width,height,text_size=text_size)
         
-        self.count = 0      # number of frames it has appeared on screen
-        self.viewable = 240 # total number of frames it will appear on screen for 
+        self.viewable = 2   # number of seconds it will appear on screen for (240 frames)
+        self.timer = None   # timer that hides the error message once it has been on screen for viewable seconds
     
     def update_text(self, new_text):
         '''
@@ -306,12 +307,20 @@ class ErrorBox(TextBox):
 
         # places error message on screen with text color red
         super().place(background, text_color=(200,0,0))
-        self.count += 1
         
-        # if the number of frames that the error message has been displayed is greater than the number
-        # of frames that it should be viewable
-        if self.count > self.viewable:
-            # no more erro, resets counter
-            game.error = False
-            self.count = 0
-            game.prev_click = None
\ No newline at end of file
+        # hides the error message once it has been displayed for as long as it should be viewable
+        if self.timer == None:
+            self.timer = game.scheduler.after(self.viewable, lambda: self.hide(game))
+    
+    def hide(self, game):
+        '''
+        hide() stops displaying the error text
+
+        Parameters (required):
+            game - game object that the error message is located within
+        '''
+
+        # no more error, resets timer
+        game.error = False
+        self.timer = None
+        game.prev_click = None
\ No newline at end of file
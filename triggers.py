@@ -0,0 +1,107 @@
+'''
+Names: Spencer Lyudovyk, Amanda Lin, Jue Gong
+Date: 05/09/22
+Project: Labors of Hercules (Choose Your Own Adventure Game)
+File: triggers.py
+Purpose: This file contains the TriggerZones class that runs game events (e.g., the introductions to new objects) when the player is in certain places of the labyrinth.
+Task Description: Design a school-appropriate game allowing for user interaction/input.
+'''
+
+class TriggerZones:
+    '''
+    The TriggerZones() class keeps triggers (functions to run while the player is in a place) indexed by the labyrinth place (grid cell or room; see labyrinth.py) they are in.
+    Each frame, only the triggers in the player's place are run (see update()), so the cost doesn't grow with the number of triggers elsewhere in the labyrinth.
+    A trigger that only fires once unregisters itself from all of its places when it runs.
+    '''
+
+    def __init__(self):
+        '''
+        __init__() creates an empty trigger registry
+        '''
+
+        self.zones = {}  # names of the triggers in each place, keyed by place
+        self.triggers = {}  # [function, whether it fires only once, set of places] of each trigger, keyed by name
+
+    def __len__(self):
+        '''
+        __len__() retrieves the number of registered triggers
+
+        Returns:
+            int - number of triggers
+        '''
+
+        return len(self.triggers)
+
+    def __contains__(self, name):
+        '''
+        __contains__() checks whether a trigger is registered
+
+        Parameter (required):
+            name - name of the trigger
+
+        Returns:
+            Boolean - True if the trigger is registered; False if not
+        '''
+
+        return name in self.triggers
+
+    def register(self, name, places, function, once=True):
+        '''
+        register() adds a trigger to places, or adds more places to a trigger that is already registered (keeping its function)
+
+        Parameters (required):
+            name - name of the trigger (e.g., 'plant' for the plant introduction)
+            places - list of places the trigger is in; None places (e.g., of objects that aren't in the labyrinth yet) are skipped, and a trigger with no places isn't registered
+            function - function with no parameters that is run when the player is in one of the places
+
+        Parameter (optional):
+            once - whether the trigger unregisters itself after it runs; set to True by default
+                   (a trigger that doesn't is run every frame the player is in one of its places until it is unregistered)
+        '''
+
+        places = [place for place in places if place != None]
+        if not places:
+            return
+
+        if name not in self.triggers:
+            self.triggers[name] = [function, once, set()]
+
+        trigger_places = self.triggers[name][2]
+        for place in places:
+            if place not in trigger_places:
+                trigger_places.add(place)
+                self.zones.setdefault(place, []).append(name)
+
+    def unregister(self, name):
+        '''
+        unregister() removes a trigger from all of its places
+
+        Parameter (required):
+            name - name of the trigger; nothing happens if it isn't registered
+        '''
+
+        if name not in self.triggers:
+            return
+
+        for place in self.triggers.pop(name)[2]:
+            self.zones[place].remove(name)
+            if not self.zones[place]:
+                del self.zones[place]
+
+    def update(self, place):
+        '''
+        update() runs the triggers in the player's place
+
+        Parameter (required):
+            place - place the player is in; None if they aren't in any place (e.g., inside a wall between a room and the grid)
+        '''
+
+        # copies the names since triggers can unregister themselves or other triggers as they run
+        for name in list(self.zones.get(place, ())):
+            if name not in self.triggers:
+                continue
+
+            (function, once, places) = self.triggers[name]
+            if once:
+                self.unregister(name)
+            function()
@@ -14,9 +14,10 @@ from additional_func import *
 from game import *
 
 # accesses csv file that stores the stats of all the weapons/items
-weapon_stats = pd.read_csv('./stats/weapons.csv')
-weapon_stats.index = weapon_stats["weapons"]
-weapon_stats.drop(columns=["weapons"],inplace=True)
+with startup_profile.step('read stats/weapons.csv ({})'.format(__name__)):
+    weapon_stats = pd.read_csv('./stats/weapons.csv')
+    weapon_stats.index = weapon_stats["weapons"]
+    weapon_stats.drop(columns=["weapons"],inplace=True)
 # data points can be accessed via weapon_stats[category, weapon_nick]
 # for example, weapon_stats["lion"]["sword"] gives the damage the sword does against the lion
 
@@ -28,6 +29,25 @@ class Holdable:
     The Holdable() class represents an item that the player can hold in the game.
     '''
     
+    collision_space = "background"  # an item's x_bg and y_bg are background coordinates (see collision.py)
+    
+    # attributes of each item (and their types); items have no __dict__, so their attributes are stored in fixed slots that are faster to access and take less memory
+    __slots__ = (
+        "images",           # list of surfaces; one for each direction the item faces
+        "width",            # int; width of the item in pixels
+        "height",           # int; height of the item in pixels
+        "frame",            # int; which frame image is used
+        "walk_over",        # Boolean; whether the player can walk over the item
+        "x",                # int; x position in reference to the window when held
+        "y",                # int; y position in reference to the window when held
+        "x_bg",             # int; x position in background coordinates
+        "y_bg",             # int; y position in background coordinates
+        "wielder",          # Player or None; character in control of the item
+        "loc",              # str; where the item is ("hands", "backpack", "ground", or "chest")
+        "nick",             # str; internal name of the item
+        "times_picked_up",  # int; number of times the item has been picked up
+    )
+    
     def __init__(self,wielder,loc,nick, x_bg=0, y_bg=0, defaultImages=True):  
         '''
         __init__() initializes Holdable items
@@ -48,7 +68,7 @@ class Holdable:
         if defaultImages:
             self.images = []
             for x in range(1,5):
-                img = loadImage('images/' + nick + str(x) + '.png')
+                img = loadImage('images/' + nick + str(x) + '.png', mask=True)
                 self.images.append(img)
         
         # width and height of holdable item
@@ -135,11 +155,11 @@ class Holdable:
             
             # if not, draws the item on screen on top of the player
             else:
-                background.screen.blit(self.images[self.frame], (self.x, self.y))
+                frame_stats.blit(background.screen, self.images[self.frame], (self.x, self.y))
         
         # if the item is on the ground (not held by the player), draws the item in the background
         elif self.loc == 'ground':
-            background.surface.blit(self.images[self.frame], (self.x_bg,self.y_bg))
+            frame_stats.blit(background.surface, self.images[self.frame], (self.x_bg,self.y_bg))
     
     def extend(self, background):
         '''
@@ -169,7 +189,7 @@ class Holdable:
         self.y_bg = background.stagePosY + y
         
         # draws the item on screen
-        background.screen.blit(self.images[self.frame], (x, y))
+        frame_stats.blit(background.screen, self.images[self.frame], (x, y))
     
     def pick_up(self, background, player):
         '''
@@ -181,7 +201,7 @@ class Holdable:
         '''
         
         # picks the item up from the background and updates the background image
-        background.background_obj.remove(self)
+        background.remove_object(self)
         background.set_background_image()
         
         # adds the item into the player's hands
@@ -217,7 +237,7 @@ class Holdable:
         self.y_bg = background.stagePosY + self.y
         
         # adds the item to the background and updates the background image
-        background.background_obj.append(self)
+        background.add_object(self)
         background.set_background_image()
     
     def place_in_backpack(self, player):
@@ -250,6 +270,7 @@ class Holdable:
     def touching(self, other, background):
         '''
         touching() checks whether the item is touching a particular object
+        Their boxes are checked first, and only if they overlap are their images' pixels checked (see spritesTouching())
         
         Parameters (required):
             other - the object to be checked for contact
@@ -264,7 +285,7 @@ class Holdable:
         y1 = self.y_bg - background.stagePosY
         
         # sets the other object's x and y coordinates
-        if other in background.background_obj or other in background.door_list:  # if the object is a background object or a door
+        if background.in_background(other) or background.is_door(other):  # if the object is a background object or a door
             x2 = other.x_bg - background.stagePosX
             y2 = other.y_bg - background.stagePosY
         else:  # if the object isn't in the background
@@ -274,7 +295,8 @@ class Holdable:
         # checks whether the x and y positions of either object are inside the other object
         if (x2 >= x1 and x2 < (x1 + self.width)) or (x1 >= x2 and x1 < (x2 + other.width)):
             if (y2 >= y1 and y2 < (y1 + self.height)) or (y1 >= y2 and y1 < (y2 + other.height)):
-                return True  # returns True if the objects are touching
+                # returns True if the objects' pixels are touching
+                return spritesTouching(self.images[self.frame], x1, y1, other.images[other.frame], x2, y2)
         
         # returns False if the objects aren't touching
         return False
@@ -284,6 +306,8 @@ class Weapon(Holdable):
     The Weapon() class is a subclass of Holdable() that represents all weapons the player can hold.
     '''
     
+    __slots__ = ("damage_pts",)  # dict of damage (int) caused towards each enemy, keyed by enemy nickname
+    
     def __init__(self,wielder,loc,nick, x_bg=0, y_bg=0, defaultImages=True):
         '''
         __init__() initializes Weapon items
@@ -312,6 +336,8 @@ class Sword(Weapon):
     The Sword() class is a subclass of Weapon()
     '''
     
+    __slots__ = ()  # no attributes other than those of Weapon()
+    
     def __init__(self,wielder,loc, x_bg=0, y_bg=0):
         '''
         __init__() initializes Sword items
@@ -333,6 +359,8 @@ class Trident(Weapon):
     The Trident() class is a subclass of Weapon()
     '''
     
+    __slots__ = ()  # no attributes other than those of Weapon()
+    
     def __init__(self,wielder,loc,x_bg=0, y_bg=0):
         '''
         __init__() initializes Trident items
@@ -354,6 +382,8 @@ class Boxing_Glove(Weapon):
     The Boxing_Glove() class is a subclass of Weapon()
     '''
     
+    __slots__ = ()  # no attributes other than those of Weapon()
+    
     def __init__(self,wielder,loc, x_bg=0, y_bg=0):
         '''
         __init__() initializes Boxing_Glove items
@@ -375,6 +405,8 @@ class Shovel(Weapon):
     The Shovel() class is a subclass of Weapon()
     '''
     
+    __slots__ = ()  # no attributes other than those of Weapon()
+    
     def __init__(self,wielder,loc, x_bg=0, y_bg=0):
         '''
         __init__() initializes Shovel items
@@ -406,7 +438,7 @@ class Shovel(Weapon):
             plant.frame += 1
         
         # if the plant is a background object, the shovel is touching the plant, and the plant isn't fully dug up, digs plant and draws it
-        if plant in background.background_obj and self.touching(plant, background) and plant.frame <= 2:
+        if background.in_background(plant) and self.touching(plant, background) and plant.frame <= 2:
             plant.frame += 1
             plant.draw(background)
 
@@ -415,6 +447,13 @@ class Flashlight(Weapon):
     The Flashlight() class is a subclass of Weapon()
     '''
     
+    # attributes in addition to those of Weapon()
+    __slots__ = (
+        "state",       # Boolean; whether the flashlight is on
+        "images_on",   # list of surfaces; sprites when turned on
+        "images_off",  # list of surfaces; sprites when turned off
+    )
+    
     def __init__(self,wielder,loc,x_bg=0, y_bg=0):
         '''
         __init__() initializes Flashlight items
@@ -433,13 +472,13 @@ class Flashlight(Weapon):
         # flashlight sprites when turned on
         self.images_on = []
         for x in range(1,5):
-            img = loadImage('images/flashlight' + str(x) + 'on.png')
+            img = loadImage('images/flashlight' + str(x) + 'on.png', mask=True)
             self.images_on.append(img)
         
         # flashlight sprites when turned off
         self.images_off = []
         for x in range(1,5):
-            img = loadImage('images/flashlight' + str(x) + 'off.png')
+            img = loadImage('images/flashlight' + str(x) + 'off.png', mask=True)
             self.images_off.append(img)
         
         # by default, the flashlight starts off, so off images are used
@@ -479,6 +518,8 @@ class Flame_Thrower(Weapon):
     The Flame_Thrower() class is a subclass of Weapon()
     '''
     
+    __slots__ = ()  # no attributes other than those of Weapon()
+    
     def __init__(self,wielder,loc,x_bg=0, y_bg=0):
         '''
         __init__() initializes Flame_Thrower items
@@ -500,6 +541,8 @@ class Key(Holdable):
     The Key() class is a subclass of Holdable()
     '''
     
+    __slots__ = ("id",)  # int; door that the key can open
+    
     def __init__(self,wielder,loc,id,x_bg=0, y_bg=0):
         '''
         __init__() initializes Key items
@@ -518,7 +561,7 @@ class Key(Holdable):
         # gets key sprites
         self.images = []
         for x in range(1,5):
-            img = loadImage('images/' + "key" + str(self.id) + str(x) + '.png')
+            img = loadImage('images/' + "key" + str(self.id) + str(x) + '.png', mask=True)
             self.images.append(img)
     
         # calls parent class initialization with 'key' nickname and doesn't use default images
@@ -529,6 +572,8 @@ class Gem(Holdable):
     The Gem() class is a subclass of Holdable()
     '''
     
+    __slots__ = ()  # no attributes other than those of Holdable()
+    
     def __init__(self,wielder,loc,x_bg=0, y_bg=0):  
         '''
         __init__() initializes Gem items
@@ -570,6 +615,8 @@ class Potion(Holdable):
     The Potion() class is a subclass of Holdable()
     '''
     
+    __slots__ = ()  # no attributes other than those of Holdable()
+    
     def __init__(self,wielder,loc,x_bg=0,y_bg=0):
         '''
         __init__() initializes Gem items